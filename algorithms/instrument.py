@@ -0,0 +1,86 @@
+# dsa_visualizer/algorithms/instrument.py
+# Operation counters for the algorithms. Every algorithm takes a `counter`
+# argument that defaults to NULL_COUNTER, whose methods do nothing, so hot
+# loops call it unconditionally instead of checking whether counting is on.
+import math
+
+
+class Counter:
+    __slots__ = ("comparisons", "swaps", "visits", "allocations")
+
+    def __init__(self):
+        self.comparisons = 0
+        self.swaps = 0
+        self.visits = 0
+        self.allocations = 0
+
+    def compare(self, count=1):
+        self.comparisons += count
+
+    def swap(self, count=1):
+        self.swaps += count
+
+    def visit(self, count=1):
+        self.visits += count
+
+    def allocate(self, count=1):
+        self.allocations += count
+
+    def as_dict(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+class NullCounter:
+    __slots__ = ()
+
+    def compare(self, count=1):
+        pass
+
+    def swap(self, count=1):
+        pass
+
+    def visit(self, count=1):
+        pass
+
+    def allocate(self, count=1):
+        pass
+
+
+NULL_COUNTER = NullCounter()
+
+GROWTH_CLASSES = {
+    "O(1)": lambda n: 1.0,
+    "O(log n)": lambda n: math.log2(n),
+    "O(√n)": lambda n: math.sqrt(n),
+    "O(n)": lambda n: float(n),
+    "O(n log n)": lambda n: n * math.log2(n),
+    "O(n²)": lambda n: float(n * n),
+}
+
+
+def measure_growth(run, make_args, sizes, metric="comparisons", callback=None):
+    # run(*make_args(n), callback, counter=...) is called once per size.
+    callback = callback or (lambda *args: None)
+    costs = []
+    for n in sizes:
+        counter = Counter()
+        run(*make_args(n), callback, counter=counter)
+        costs.append(getattr(counter, metric))
+    return costs
+
+
+def fit_growth(sizes, costs):
+    # Fit cost ≈ c·f(n) for each class in log space, where the best c is the
+    # geometric mean of cost / f(n) and the residual is the variance of the
+    # log ratio. Returns (best_class, constant, {class: (constant, residual)}).
+    points = [(n, max(cost, 1)) for n, cost in zip(sizes, costs) if n > 1]
+    if not points:
+        raise ValueError("fit_growth needs at least one size greater than 1")
+    fits = {}
+    for name, growth in GROWTH_CLASSES.items():
+        ratios = [math.log(cost / growth(n)) for n, cost in points]
+        mean = sum(ratios) / len(ratios)
+        residual = sum((ratio - mean) ** 2 for ratio in ratios) / len(ratios)
+        fits[name] = (math.exp(mean), residual)
+    best = min(fits, key=lambda name: fits[name][1])
+    return best, fits[best][0], fits
@@ -0,0 +1,114 @@
+# dsa_visualizer/algorithms/list_operations.py
+# Every operation accepts either the head Node of a chain or a ListPool, which
+# keeps the nodes in typed arrays; callers get back the same kind they passed in.
+from .instrument import NULL_COUNTER
+from .node_pool import ListPool
+
+class Node:
+    __slots__ = ("data", "next")
+
+    def __init__(self, data, next=None):
+        self.data = data
+        self.next = next
+
+def create_linked_list(values, compact=False):
+    if compact:
+        return ListPool.from_values(values)
+    head = None
+    for value in reversed(values):
+        head = Node(value, head)
+    return head
+
+def visualize_linked_list(head):
+    if isinstance(head, ListPool):
+        return head.to_list(), "O(n)", "O(n)"
+    data = []
+    node = head
+    while node is not None:
+        data.append(node.data)
+        node = node.next
+    return data, "O(n)", "O(n)"
+
+def insert_at_beginning(head, value):
+    if isinstance(head, ListPool):
+        head.insert(0, value)
+        return head, "O(1)", "O(1)"
+    return Node(value, head), "O(1)", "O(1)"
+
+def insert_at_end(head, value):
+    if isinstance(head, ListPool):
+        # The pool tracks its tail, so appending does not walk the list.
+        head.insert(len(head), value)
+        return head, "O(1)", "O(1)"
+    if head is None:
+        return Node(value), "O(n)", "O(1)"
+    node = head
+    while node.next is not None:
+        node = node.next
+    node.next = Node(value)
+    return head, "O(n)", "O(1)"
+
+def _walk_to(data, position, update_callback, counter):
+    # Shows the traversal up to (but not including) position.
+    for i in range(min(position, len(data))):
+        counter.visit()
+        update_callback((data, [i], []))
+
+def insert_at_position(head, value, position, update_callback, counter=NULL_COUNTER):
+    data, _, _ = visualize_linked_list(head)
+    message = None
+    if position > len(data):
+        message = f"Position {position} is past the end of the list; inserted at the end instead."
+        position = len(data)
+    _walk_to(data, position, update_callback, counter)
+    if isinstance(head, ListPool):
+        head.insert(position, value)
+    elif position == 0:
+        head = Node(value, head)
+    else:
+        node = head
+        for _ in range(position - 1):
+            node = node.next
+        node.next = Node(value, node.next)
+    data, _, _ = visualize_linked_list(head)
+    update_callback((data, [position], [position]))
+    return head, "O(n)", "O(1)", message
+
+def delete_at_beginning(head):
+    if isinstance(head, ListPool):
+        if len(head):
+            head.delete(0)
+        return head, "O(1)", "O(1)"
+    return (head.next if head is not None else None), "O(1)", "O(1)"
+
+def delete_at_end(head):
+    if isinstance(head, ListPool):
+        if len(head):
+            head.delete(len(head) - 1)
+        return head, "O(n)", "O(1)"
+    if head is None or head.next is None:
+        return None, "O(n)", "O(1)"
+    node = head
+    while node.next.next is not None:
+        node = node.next
+    node.next = None
+    return head, "O(n)", "O(1)"
+
+def delete_at_position(head, position, update_callback, counter=NULL_COUNTER):
+    data, _, _ = visualize_linked_list(head)
+    if position >= len(data):
+        return head, "O(n)", "O(1)", f"Position {position} is out of range; nothing was deleted."
+    _walk_to(data, position, update_callback, counter)
+    update_callback((data, [position], [position]))
+    if isinstance(head, ListPool):
+        head.delete(position)
+    elif position == 0:
+        head = head.next
+    else:
+        node = head
+        for _ in range(position - 1):
+            node = node.next
+        node.next = node.next.next
+    data, _, _ = visualize_linked_list(head)
+    update_callback((data, [], []))
+    return head, "O(n)", "O(1)", None
@@ -0,0 +1,204 @@
+# dsa_visualizer/algorithms/node_pool.py
+# Array-backed node storage for large trees and linked lists. Nodes live in
+# parallel typed arrays and are addressed by index (-1 means "no node"), so a
+# million-node structure costs a few flat buffers instead of a million Python
+# objects, and pickles as raw bytes.
+from array import array
+
+NIL = -1
+
+
+class TreeNodeView:
+    # Lightweight handle exposing a pooled node through the same attributes as
+    # tree_traversal.TreeNode, so traversals and visualizers work unchanged.
+    __slots__ = ("pool", "index")
+
+    def __init__(self, pool, index):
+        self.pool = pool
+        self.index = index
+
+    def __eq__(self, other):
+        return isinstance(other, TreeNodeView) and other.pool is self.pool and other.index == self.index
+
+    def __hash__(self):
+        return hash((id(self.pool), self.index))
+
+    @property
+    def value(self):
+        return self.pool.values[self.index]
+
+    @property
+    def left(self):
+        return self.pool.node(self.pool.left[self.index])
+
+    @left.setter
+    def left(self, node):
+        self.pool.left[self.index] = NIL if node is None else node.index
+
+    @property
+    def right(self):
+        return self.pool.node(self.pool.right[self.index])
+
+    @right.setter
+    def right(self, node):
+        self.pool.right[self.index] = NIL if node is None else node.index
+
+
+class TreePool:
+    def __init__(self):
+        self.values = array('q')
+        self.left = array('i')
+        self.right = array('i')
+        self.root_index = NIL
+
+    def __len__(self):
+        return len(self.values)
+
+    @classmethod
+    def from_values(cls, values):
+        pool = cls()
+        for value in values:
+            pool.insert(value)
+        return pool
+
+    @classmethod
+    def from_sorted(cls, values):
+        # Balanced build in O(n): slot i holds the i-th smallest value and
+        # every subtree is rooted at the midpoint of its slot range.
+        pool = cls()
+        n = len(values)
+        pool.values = array('q', values)
+        pool.left = array('i', [NIL]) * n
+        pool.right = array('i', [NIL]) * n
+        if n == 0:
+            return pool
+        pool.root_index = (n - 1) // 2
+        pending = [(0, n - 1)]
+        while pending:
+            low, high = pending.pop()
+            mid = (low + high) // 2
+            if low < mid:
+                pool.left[mid] = (low + mid - 1) // 2
+                pending.append((low, mid - 1))
+            if mid < high:
+                pool.right[mid] = (mid + 1 + high) // 2
+                pending.append((mid + 1, high))
+        return pool
+
+    def insert(self, value):
+        index = len(self.values)
+        self.values.append(value)
+        self.left.append(NIL)
+        self.right.append(NIL)
+        if self.root_index == NIL:
+            self.root_index = index
+            return index
+        current = self.root_index
+        while True:
+            side = self.left if value < self.values[current] else self.right
+            if side[current] == NIL:
+                side[current] = index
+                return index
+            current = side[current]
+
+    def node(self, index):
+        return None if index == NIL else TreeNodeView(self, index)
+
+    @property
+    def root(self):
+        return self.node(self.root_index)
+
+    @property
+    def nbytes(self):
+        return sum(len(buf) * buf.itemsize for buf in (self.values, self.left, self.right))
+
+
+class ListPool:
+    # Singly linked list in parallel arrays, with a free list so deleted slots
+    # are reused by later inserts and a tail index for O(1) appends.
+    def __init__(self):
+        self.values = array('q')
+        self.next = array('i')
+        self.free = array('i')
+        self.head = NIL
+        self.tail = NIL
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def __iter__(self):
+        current = self.head
+        while current != NIL:
+            yield self.values[current]
+            current = self.next[current]
+
+    @classmethod
+    def from_values(cls, values):
+        pool = cls()
+        n = len(values)
+        pool.values = array('q', values)
+        pool.next = array('i', range(1, n + 1))
+        if n:
+            pool.next[n - 1] = NIL
+            pool.head, pool.tail, pool.size = 0, n - 1, n
+        return pool
+
+    def to_list(self):
+        return list(self)
+
+    def _allocate(self, value, next_index):
+        if self.free:
+            index = self.free.pop()
+            self.values[index] = value
+            self.next[index] = next_index
+        else:
+            index = len(self.values)
+            self.values.append(value)
+            self.next.append(next_index)
+        self.size += 1
+        return index
+
+    def _index_at(self, position):
+        current = self.head
+        for _ in range(position):
+            current = self.next[current]
+        return current
+
+    def insert(self, position, value):
+        position = max(0, min(position, self.size))
+        if position == 0:
+            index = self._allocate(value, self.head)
+            self.head = index
+            if self.tail == NIL:
+                self.tail = index
+        elif position == self.size:
+            index = self._allocate(value, NIL)
+            self.next[self.tail] = index
+            self.tail = index
+        else:
+            previous = self._index_at(position - 1)
+            index = self._allocate(value, self.next[previous])
+            self.next[previous] = index
+        return index
+
+    def delete(self, position):
+        if not 0 <= position < self.size:
+            raise IndexError("list position out of range")
+        if position == 0:
+            removed = self.head
+            self.head = self.next[removed]
+            previous = NIL
+        else:
+            previous = self._index_at(position - 1)
+            removed = self.next[previous]
+            self.next[previous] = self.next[removed]
+        if removed == self.tail:
+            self.tail = previous
+        self.free.append(removed)
+        self.size -= 1
+        return self.values[removed]
+
+    @property
+    def nbytes(self):
+        return sum(len(buf) * buf.itemsize for buf in (self.values, self.next, self.free))
@@ -0,0 +1,156 @@
+# dsa_visualizer/algorithms/queue_operations.py
+from array import array
+from collections import deque
+
+class Queue:
+    # List-backed queue: callers pass the list in and get it back. Dequeue
+    # pops from the front, which shifts every remaining element.
+    def __init__(self):
+        self.items = []
+
+    def enqueue(self, items, item):
+        items.append(item)
+        return items, "O(1)", "O(1)"
+
+    def dequeue(self):
+        item = self.items.pop(0) if self.items else None
+        return self.items, item, "O(n)", "O(1)"
+
+    def peek(self, items):
+        return items[0], "O(1)", "O(1)"
+
+    def is_empty(self, items):
+        return len(items) == 0
+
+    def size(self, items):
+        return len(items)
+
+class DequeQueue:
+    # Persistent engine: keep one instance (e.g. in st.session_state) and call
+    # its methods; every single-element operation is O(1).
+    def __init__(self, values=()):
+        self.items = deque(values)
+
+    def __len__(self):
+        return len(self.items)
+
+    def enqueue(self, item):
+        self.items.append(item)
+        return "O(1)", "O(1)"
+
+    def enqueue_many(self, values):
+        self.items.extend(values)
+        return "O(k)", "O(1)"
+
+    def dequeue(self):
+        item = self.items.popleft() if self.items else None
+        return item, "O(1)", "O(1)"
+
+    def dequeue_many(self, count):
+        popleft = self.items.popleft
+        taken = [popleft() for _ in range(min(count, len(self.items)))]
+        return taken, "O(k)", "O(1)"
+
+    def peek(self):
+        return (self.items[0] if self.items else None), "O(1)", "O(1)"
+
+    def is_empty(self):
+        return not self.items
+
+    def size(self):
+        return len(self.items)
+
+    def to_list(self, limit=None):
+        if limit is None:
+            return list(self.items)
+        return [self.items[i] for i in range(min(limit, len(self.items)))]
+
+class RingBufferQueue:
+    # Integer queue in a typed circular buffer. When the buffer is full it
+    # grows by `growth` (amortised O(1) enqueue), or raises OverflowError when
+    # growth is None, which makes it a fixed-capacity ring.
+    def __init__(self, values=(), capacity=16, growth=2.0, typecode='q'):
+        self.typecode = typecode
+        self.growth = growth
+        self.buffer = array(typecode, [0]) * max(capacity, len(values), 1)
+        self.head = 0
+        self.count = 0
+        if values:
+            self.enqueue_many(values)
+
+    def __len__(self):
+        return self.count
+
+    @property
+    def capacity(self):
+        return len(self.buffer)
+
+    def _ensure_capacity(self, needed):
+        if needed <= len(self.buffer):
+            return
+        if self.growth is None:
+            raise OverflowError("queue is full")
+        capacity = len(self.buffer)
+        while capacity < needed:
+            capacity = max(capacity + 1, int(capacity * self.growth))
+        items = self._slice(self.count)
+        self.buffer = items + array(self.typecode, [0]) * (capacity - len(items))
+        self.head = 0
+
+    def _slice(self, count):
+        # The first `count` queued items as one contiguous array (at most two copies).
+        end = self.head + count
+        if end <= len(self.buffer):
+            return self.buffer[self.head:end]
+        return self.buffer[self.head:] + self.buffer[:end - len(self.buffer)]
+
+    def enqueue(self, item):
+        buffer = self.buffer
+        if self.count == len(buffer):
+            self._ensure_capacity(self.count + 1)
+            buffer = self.buffer
+        tail = self.head + self.count
+        if tail >= len(buffer):
+            tail -= len(buffer)
+        buffer[tail] = item
+        self.count += 1
+        return "O(1)", "O(1)"
+
+    def enqueue_many(self, values):
+        values = array(self.typecode, values)
+        self._ensure_capacity(self.count + len(values))
+        size = len(self.buffer)
+        tail = (self.head + self.count) % size
+        first = min(len(values), size - tail)
+        self.buffer[tail:tail + first] = values[:first]
+        self.buffer[:len(values) - first] = values[first:]
+        self.count += len(values)
+        return "O(k)", "O(1)"
+
+    def dequeue(self):
+        if not self.count:
+            return None, "O(1)", "O(1)"
+        head = self.head
+        item = self.buffer[head]
+        self.head = 0 if head + 1 == len(self.buffer) else head + 1
+        self.count -= 1
+        return item, "O(1)", "O(1)"
+
+    def dequeue_many(self, count):
+        count = min(count, self.count)
+        taken = self._slice(count).tolist()
+        self.head = (self.head + count) % len(self.buffer)
+        self.count -= count
+        return taken, "O(k)", "O(1)"
+
+    def peek(self):
+        return (self.buffer[self.head] if self.count else None), "O(1)", "O(1)"
+
+    def is_empty(self):
+        return self.count == 0
+
+    def size(self):
+        return self.count
+
+    def to_list(self, limit=None):
+        return self._slice(self.count if limit is None else min(limit, self.count)).tolist()
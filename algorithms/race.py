@@ -0,0 +1,219 @@
+# dsa_visualizer/algorithms/race.py
+# Race mode: every sort runs on its own copy of the same input as a job of
+# the app's JobScheduler, so lanes share its worker pool, fair queueing and
+# budgets with every other job. Workers publish their comparison/swap counts
+# to a shared-memory block of int64 slots, which the UI thread polls without
+# waiting on the workers. Slot 0 is a cancel flag that workers check whenever
+# they publish, and also where a lane checks its CPU budget.
+import time
+import weakref
+from multiprocessing.shared_memory import SharedMemory
+
+import scheduler
+
+from . import sorting
+from .trace import ArrayTrace
+
+RACE_SORTS = {
+    "Bubble Sort": sorting.bubble_sort,
+    "Insertion Sort": sorting.insertion_sort,
+    "Selection Sort": sorting.selection_sort,
+    "Merge Sort": sorting.merge_sort,
+    "Quick Sort": sorting.quick_sort,
+}
+# Inputs up to this size are traced for synchronized playback; larger races
+# only report counts and timings.
+TRACE_LIMIT = 300
+# Races exist to show O(n²) sorts falling minutes behind, so a lane may use
+# far more CPU than an ordinary job: up to this, and never more than its
+# session has left.
+LANE_CPU_SECONDS = 600.0
+PUBLISH_EVERY = 4096
+FIELDS = 3
+RUNNING, FINISHED, CANCELLED, WAITING, OVER_BUDGET = 0, 1, 2, 3, 4
+
+
+class RaceCancelled(Exception):
+    pass
+
+
+class SharedCounter:
+    # Counter-compatible; counts locally and copies them into this worker's
+    # slots every PUBLISH_EVERY operations, checking the cancel flag and the
+    # lane's CPU time as it goes.
+    __slots__ = ("comparisons", "swaps", "_slots", "_base", "_pending", "_budget", "_started")
+
+    def __init__(self, slots, lane, budget=scheduler.DEFAULT_BUDGET):
+        self.comparisons = 0
+        self.swaps = 0
+        self._slots = slots
+        self._base = 1 + lane * FIELDS
+        self._pending = PUBLISH_EVERY
+        self._budget = budget
+        self._started = time.thread_time()
+
+    def publish(self, state=RUNNING):
+        self._slots[self._base] = self.comparisons
+        self._slots[self._base + 1] = self.swaps
+        self._slots[self._base + 2] = state
+        self._pending = PUBLISH_EVERY
+        if state == RUNNING:
+            if self._slots[0]:
+                raise RaceCancelled
+            used = time.thread_time() - self._started
+            if used > self._budget.cpu_seconds:
+                raise scheduler.BudgetExceeded(f"more than {self._budget.cpu_seconds:g} s of CPU time", used)
+
+    def compare(self, count=1):
+        self.comparisons += count
+        self._pending -= 1
+        if not self._pending:
+            self.publish()
+
+    def swap(self, count=1):
+        self.swaps += count
+        self._pending -= 1
+        if not self._pending:
+            self.publish()
+
+    def visit(self, count=1):
+        pass
+
+    def allocate(self, count=1):
+        pass
+
+
+def _noop(arr, highlighted, marked):
+    pass
+
+
+def run_lane(name, values, shm_name, lane, record, budget=scheduler.DEFAULT_BUDGET):
+    # A scheduler job: returns (result, trace steps). Traced lanes are held
+    # to the step and trace-size budgets as well as the CPU budget.
+    shm = SharedMemory(name=shm_name)
+    slots = shm.buf.cast('q')
+    counter = SharedCounter(slots, lane, budget)
+    recorder = ArrayTrace(values, typecode='q') if record else None
+    callback = _noop if recorder is None else scheduler.BudgetedCallback(recorder, budget, recorder)
+    start = time.perf_counter()
+    try:
+        counter.publish(RUNNING)
+        RACE_SORTS[name](list(values), callback, counter)
+        counter.publish(FINISHED)
+        state = FINISHED
+    except RaceCancelled:
+        counter.publish(CANCELLED)
+        state = CANCELLED
+    except scheduler.BudgetExceeded:
+        counter.publish(OVER_BUDGET)
+        raise
+    finally:
+        slots.release()
+        shm.close()
+    result = {"name": name, "state": state, "wall_time": time.perf_counter() - start,
+              "trace": recorder if state == FINISHED else None}
+    return result, getattr(callback, "steps", 0)
+
+
+def _release(jobs, keys, shm, slots):
+    # Tells running lanes to stop, takes queued ones out of the scheduler and
+    # frees this process's view of the shared block; running lanes keep their
+    # own mapping until they notice the flag. Runs once, from close() or when
+    # the race is garbage collected.
+    slots[0] = 1
+    for key in keys:
+        jobs.cancel(key)
+    slots.release()
+    shm.close()
+    shm.unlink()
+
+
+class SortRace:
+    # Lanes are submitted to `jobs` (a scheduler.JobScheduler) for `session`.
+    # With fewer free workers than lanes, the rest wait their turn in the
+    # scheduler's queue and show as WAITING.
+    def __init__(self, values, jobs, session, names=None, trace_limit=TRACE_LIMIT):
+        self.values = list(values)
+        self.names = list(names or RACE_SORTS)
+        self.record = len(self.values) <= trace_limit
+        self.jobs = jobs
+        self.session = session
+        self.started_at = None
+        self._slots = None
+        self._futures = {}
+        self._keys = []
+        self._final = None
+        self._finalizer = None
+
+    def start(self):
+        # Raises scheduler.JobRejected, with nothing left running, if the
+        # scheduler refuses any lane.
+        shm = SharedMemory(create=True, size=8 * (1 + FIELDS * len(self.names)))
+        self._slots = shm.buf.cast('q')
+        for i in range(len(self._slots)):
+            self._slots[i] = 0
+        for lane in range(len(self.names)):
+            self._slots[1 + lane * FIELDS + 2] = WAITING
+        self._finalizer = weakref.finalize(self, _release, self.jobs, self._keys, shm, self._slots)
+        self.jobs.track(self)
+        self.started_at = time.perf_counter()
+        # One race is one request, so its lanes may all wait at once.
+        budget = self.jobs.budget
+        remaining = budget.session_cpu_seconds - self.jobs.session_usage(self.session)[0]
+        budget = budget._replace(pending=max(budget.pending, len(self.names)),
+                                 cpu_seconds=max(budget.cpu_seconds, min(LANE_CPU_SECONDS, remaining)))
+        try:
+            for lane, name in enumerate(self.names):
+                key = f"race:{shm.name}:{name}"
+                self._futures[name] = self.jobs.submit(self.session, key, run_lane, name, self.values, shm.name, lane,
+                                                       self.record, budget=budget, cache=False)
+                self._keys.append(key)
+        except scheduler.JobRejected:
+            self.close()
+            raise
+        return self
+
+    def progress(self):
+        # {name: (comparisons, swaps, state)}, read straight from shared memory
+        # while the race runs and frozen once it is closed.
+        if self._final is not None:
+            return self._final
+        if self._slots is None:
+            return {}
+        return {name: tuple(self._slots[1 + lane * FIELDS:1 + (lane + 1) * FIELDS])
+                for lane, name in enumerate(self.names)}
+
+    def done(self):
+        # Once every lane has finished, the pool and shared block are released.
+        finished = len(self._futures) == len(self.names) and all(future.done() for future in self._futures.values())
+        if finished and self._final is None:
+            self.close()
+        return finished
+
+    def results(self):
+        # Finished lanes only, keyed by name, in finishing order.
+        finished = [future.result() for future in self._futures.values()
+                    if future.done() and not future.cancelled() and future.exception() is None]
+        return {result["name"]: result for result in sorted(finished, key=lambda r: r["wall_time"])}
+
+    def cancel(self):
+        # Raises the flag for running workers, drops queued lanes and returns
+        # without waiting; close() releases the shared block afterwards.
+        if self._slots is not None:
+            self._slots[0] = 1
+        for key in self._keys:
+            self.jobs.cancel(key)
+
+    def close(self):
+        if self._finalizer is None or not self._finalizer.alive:
+            return
+        self._final = self.progress()
+        self.cancel()
+        self._finalizer()
+        self._slots = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.close()
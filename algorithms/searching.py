@@ -1,22 +1,24 @@
 # dsa_visualizer/algorithms/searching.py
-import time
+import numpy as np
 
-def linear_search(arr, target, update_callback):
+from .instrument import NULL_COUNTER
+
+def linear_search(arr, target, update_callback, counter=NULL_COUNTER):
     for i, num in enumerate(arr):
         update_callback(arr, [i], [])
-        time.sleep(0.3)
+        counter.compare()
         if num == target:
             update_callback(arr, [i], [i])
             return i, "O(n)", "O(1)"
     update_callback(arr, [], [])
     return -1, "O(n)", "O(1)"
 
-def binary_search(arr, target, update_callback):
+def binary_search(arr, target, update_callback, counter=NULL_COUNTER):
     low, high = 0, len(arr) - 1
     while low <= high:
         mid = (low + high) // 2
         update_callback(arr, [mid], [])
-        time.sleep(0.3)
+        counter.compare()
         if arr[mid] == target:
             update_callback(arr, [mid], [mid])
             return mid, "O(log n)", "O(1)"
@@ -27,14 +29,14 @@ def binary_search(arr, target, update_callback):
     update_callback(arr, [], [])
     return -1, "O(log n)", "O(1)"
 
-def jump_search(arr, target, update_callback):
+def jump_search(arr, target, update_callback, counter=NULL_COUNTER):
     n = len(arr)
     step = int(n**0.5)
     left, right = 0, 0
     while left < n and arr[left] <= target:
         right = min(n - 1, left + step)
         update_callback(arr, range(left, right + 1), [])
-        time.sleep(0.3)
+        counter.compare()
         if arr[left] <= target <= arr[right]:
             break
         left += step
@@ -42,10 +44,104 @@ def jump_search(arr, target, update_callback):
         return -1, "O(√n)", "O(1)"
     while left <= right:
         update_callback(arr, [left], [])
-        time.sleep(0.3)
+        counter.compare()
         if arr[left] == target:
             update_callback(arr, [left], [left])
             return left, "O(√n)", "O(1)"
         left += 1
     update_callback(arr, [], [])
-    return -1, "O(√n)", "O(1)"
\ No newline at end of file
+    return -1, "O(√n)", "O(1)"
+
+# Batched variants: look up a whole array of targets at once. Each returns
+# (indices, probes) as int64 arrays; indices match the scalar functions
+# exactly (-1 when missing) and probes[i] equals the number of comparisons
+# the scalar version counts for targets[i].
+
+def _batch_linear(arr, targets):
+    n = len(arr)
+    order = np.argsort(arr, kind="stable")
+    ordered = arr[order]
+    pos = np.searchsorted(ordered, targets, side="left")
+    clipped = np.minimum(pos, max(n - 1, 0))
+    found = (pos < n) & (ordered[clipped] == targets) if n else np.zeros(len(targets), dtype=bool)
+    indices = np.where(found, order[clipped] if n else -1, -1).astype(np.int64)
+    probes = np.where(found, indices + 1, n).astype(np.int64)
+    return indices, probes
+
+def _locate(arr, targets):
+    # searchsorted runs far faster on sorted keys, so sort the targets once
+    # and scatter the positions back.
+    order = np.argsort(targets)
+    ordered = targets[order]
+    first = np.empty(len(targets), dtype=np.int64)
+    last = np.empty(len(targets), dtype=np.int64)
+    first[order] = np.searchsorted(arr, ordered, side="left")
+    last[order] = np.searchsorted(arr, ordered, side="right")
+    return first, last
+
+def _batch_binary(arr, targets):
+    # On a sorted array, arr[mid] < target exactly when mid < first and
+    # arr[mid] == target exactly when first <= mid < last, so the scalar loop
+    # is replayed with index arithmetic alone and duplicates still resolve to
+    # the index the scalar search returns. A finished search is left with
+    # low == high + 1 (high == the hit index), which the update maps to itself.
+    m = len(targets)
+    first, last = _locate(arr, targets)
+    # Index arithmetic only, so int32 halves the memory traffic when it fits.
+    dtype = np.int32 if len(arr) < 2**31 - 1 else np.int64
+    first = first.astype(dtype)
+    last = last.astype(dtype)
+    low = np.zeros(m, dtype=dtype)
+    high = np.full(m, len(arr) - 1, dtype=dtype)
+    probes = np.zeros(m, dtype=np.int64)
+    live = low <= high
+    while live.any():
+        probes += live
+        mid = (low + high) >> 1
+        below = mid < last
+        low = np.where(below, mid + 1, low)
+        high = np.where(mid < first, high, mid - ~below)
+        live = low <= high
+    indices = np.where(first < last, high, -1).astype(np.int64)
+    return indices, probes
+
+def _batch_jump(arr, targets):
+    n = len(arr)
+    m = len(targets)
+    if n == 0:
+        return np.full(m, -1, dtype=np.int64), np.zeros(m, dtype=np.int64)
+    step = int(n**0.5)
+    starts = np.arange(0, n, step)
+    rights = np.minimum(n - 1, starts + step)
+    # The block loop runs while arr[left] <= target and stops at the first
+    # block whose right end reaches the target.
+    runnable = np.searchsorted(arr[starts], targets, side="right")
+    first_fit = np.searchsorted(arr[rights], targets, side="left")
+    in_block = first_fit < runnable
+    block = np.where(in_block, first_fit, 0)
+    left = starts[block]
+    right = rights[block]
+    pos = np.maximum(np.searchsorted(arr, targets, side="left"), left)
+    found = in_block & (pos <= right) & (arr[np.minimum(pos, n - 1)] == targets)
+    indices = np.where(found, pos, -1).astype(np.int64)
+    linear_probes = np.where(found, pos - left + 1, right - left + 1)
+    probes = np.where(in_block, first_fit + 1 + linear_probes, runnable).astype(np.int64)
+    return indices, probes
+
+_BATCH_METHODS = {"linear": _batch_linear, "binary": _batch_binary, "jump": _batch_jump}
+
+def batch_search(arr, targets, method="binary", count_probes=True):
+    if method not in _BATCH_METHODS:
+        raise ValueError(f"Unknown search method: {method}")
+    arr = np.asarray(arr)
+    targets = np.asarray(targets)
+    if not count_probes and method == "binary" and not np.any(arr[1:] == arr[:-1]):
+        # Without duplicates the scalar result is simply the searchsorted
+        # position, so the probe replay can be skipped. Probes come back as None.
+        first, last = _locate(arr, targets)
+        return np.where(first < last, first, -1), None
+    return _BATCH_METHODS[method](arr, targets)
+
+def probe_histogram(probes):
+    # histogram[k] is the number of targets that took exactly k probes.
+    return np.bincount(np.asarray(probes, dtype=np.int64))
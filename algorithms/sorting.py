@@ -0,0 +1,457 @@
+# dsa_visualizer/algorithms/sorting.py
+# Every write to arr is reported in the callback's highlighted or swapped indices,
+# so a trace can record the change as a delta instead of copying the array.
+import multiprocessing
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+
+from .instrument import NULL_COUNTER, Counter
+
+def bubble_sort(arr, update_callback, counter=NULL_COUNTER):
+    n = len(arr)
+    for i in range(n):
+        swapped = False
+        for j in range(n - i - 1):
+            update_callback(arr, [j, j + 1], [])
+            counter.compare()
+            if arr[j] > arr[j + 1]:
+                arr[j], arr[j + 1] = arr[j + 1], arr[j]
+                counter.swap()
+                update_callback(arr, [j, j + 1], [j, j + 1])
+                swapped = True
+        if not swapped:
+            break
+    return "O(n²)", "O(1)"
+
+def insertion_sort(arr, update_callback, counter=NULL_COUNTER):
+    for i in range(1, len(arr)):
+        key = arr[i]
+        j = i - 1
+        update_callback(arr, [j, i], [])
+        counter.compare()
+        while j >= 0 and arr[j] > key:
+            arr[j + 1] = arr[j]
+            counter.swap()
+            update_callback(arr, [j, j + 1], [j + 1])
+            j -= 1
+            counter.compare()
+        arr[j + 1] = key
+        update_callback(arr, [j + 1], [j + 1])
+    return "O(n²)", "O(1)"
+
+def selection_sort(arr, update_callback, counter=NULL_COUNTER):
+    n = len(arr)
+    for i in range(n):
+        min_idx = i
+        for j in range(i + 1, n):
+            update_callback(arr, [min_idx, j], [])
+            counter.compare()
+            if arr[j] < arr[min_idx]:
+                min_idx = j
+        if min_idx != i:
+            arr[i], arr[min_idx] = arr[min_idx], arr[i]
+            counter.swap()
+            update_callback(arr, [i, min_idx], [i, min_idx])
+    return "O(n²)", "O(1)"
+
+def _merge(arr, left, mid, right, update_callback, counter):
+    left_part = arr[left:mid + 1]
+    right_part = arr[mid + 1:right + 1]
+    counter.allocate(right - left + 1)
+    i = j = 0
+    k = left
+    while i < len(left_part) and j < len(right_part):
+        update_callback(arr, [left + i, mid + 1 + j], [])
+        counter.compare()
+        if left_part[i] <= right_part[j]:
+            arr[k] = left_part[i]
+            i += 1
+        else:
+            arr[k] = right_part[j]
+            j += 1
+        counter.swap()
+        update_callback(arr, [k], [k])
+        k += 1
+    for value in left_part[i:] + right_part[j:]:
+        arr[k] = value
+        counter.swap()
+        update_callback(arr, [k], [k])
+        k += 1
+
+def _merge_sort(arr, left, right, update_callback, counter):
+    if left < right:
+        mid = (left + right) // 2
+        _merge_sort(arr, left, mid, update_callback, counter)
+        _merge_sort(arr, mid + 1, right, update_callback, counter)
+        _merge(arr, left, mid, right, update_callback, counter)
+
+def merge_sort(arr, update_callback, counter=NULL_COUNTER):
+    _merge_sort(arr, 0, len(arr) - 1, update_callback, counter)
+    return "O(n log n)", "O(n)"
+
+def _partition(arr, low, high, update_callback, counter):
+    pivot = arr[high]
+    i = low - 1
+    for j in range(low, high):
+        update_callback(arr, [j, high], [])
+        counter.compare()
+        if arr[j] <= pivot:
+            i += 1
+            if i != j:
+                arr[i], arr[j] = arr[j], arr[i]
+                counter.swap()
+                update_callback(arr, [i, j], [i, j])
+    arr[i + 1], arr[high] = arr[high], arr[i + 1]
+    counter.swap()
+    update_callback(arr, [i + 1, high], [i + 1, high])
+    return i + 1
+
+def quick_sort(arr, update_callback, counter=NULL_COUNTER):
+    # Explicit stack: sorted input would otherwise recurse n levels deep.
+    # Pushing the larger side first keeps the stack at O(log n) entries.
+    pending = [(0, len(arr) - 1)]
+    while pending:
+        low, high = pending.pop()
+        if low < high:
+            p = _partition(arr, low, high, update_callback, counter)
+            if p - low > high - p:
+                pending.append((low, p - 1))
+                pending.append((p + 1, high))
+            else:
+                pending.append((p + 1, high))
+                pending.append((low, p - 1))
+    return "O(n log n)", "O(log n)"
+
+# Production-grade sorts. They keep the (arr, update_callback, counter)
+# signature and the write-reporting rule above; update_callback may be None
+# when no trace is wanted.
+
+INSERTION_CUTOFF = 16
+MIN_GALLOP = 7
+RADIX_BITS = 8
+PARALLEL_CUTOFF = 1 << 15
+
+def _ignore(arr, highlighted, marked):
+    pass
+
+def _insertion_range(arr, low, high, update_callback, counter, sorted_until=None):
+    # Insertion sort of arr[low:high + 1]; arr[low:sorted_until] is already sorted.
+    for i in range(sorted_until or low + 1, high + 1):
+        key = arr[i]
+        j = i - 1
+        counter.compare()
+        while j >= low and arr[j] > key:
+            arr[j + 1] = arr[j]
+            counter.swap()
+            update_callback(arr, [j, j + 1], [j + 1])
+            j -= 1
+            counter.compare()
+        if j + 1 != i:
+            arr[j + 1] = key
+            update_callback(arr, [j + 1], [j + 1])
+
+def _swap(arr, i, j, update_callback, counter):
+    arr[i], arr[j] = arr[j], arr[i]
+    counter.swap()
+    update_callback(arr, [i, j], [i, j])
+
+def _median_of_three(arr, low, high, update_callback, counter):
+    # Orders arr[low], arr[mid], arr[high]; the median ends up at mid.
+    mid = (low + high) // 2
+    update_callback(arr, [low, mid, high], [])
+    counter.compare(3)
+    if arr[mid] < arr[low]:
+        _swap(arr, low, mid, update_callback, counter)
+    if arr[high] < arr[low]:
+        _swap(arr, low, high, update_callback, counter)
+    if arr[high] < arr[mid]:
+        _swap(arr, mid, high, update_callback, counter)
+    return arr[mid]
+
+def _hoare_partition(arr, low, high, pivot, update_callback, counter):
+    i, j = low - 1, high + 1
+    while True:
+        i += 1
+        counter.compare()
+        while arr[i] < pivot:
+            i += 1
+            counter.compare()
+        j -= 1
+        counter.compare()
+        while arr[j] > pivot:
+            j -= 1
+            counter.compare()
+        update_callback(arr, [i, j], [])
+        if i >= j:
+            return j
+        _swap(arr, i, j, update_callback, counter)
+
+def _sift_down(arr, low, root, size, update_callback, counter):
+    while True:
+        child = 2 * root + 1
+        if child >= size:
+            return
+        counter.compare()
+        if child + 1 < size and arr[low + child] < arr[low + child + 1]:
+            child += 1
+        counter.compare()
+        if arr[low + root] >= arr[low + child]:
+            return
+        _swap(arr, low + root, low + child, update_callback, counter)
+        root = child
+
+def _heapsort_range(arr, low, high, update_callback, counter):
+    size = high - low + 1
+    for root in range(size // 2 - 1, -1, -1):
+        _sift_down(arr, low, root, size, update_callback, counter)
+    for end in range(size - 1, 0, -1):
+        _swap(arr, low, low + end, update_callback, counter)
+        _sift_down(arr, low, 0, end, update_callback, counter)
+
+def intro_sort(arr, update_callback=None, counter=NULL_COUNTER):
+    # Quick sort with a median-of-three pivot and Hoare partition, insertion
+    # sort below INSERTION_CUTOFF, and heapsort for any range that exceeds
+    # 2·log2(n) partition levels, which caps the worst case at O(n log n).
+    if update_callback is None:
+        update_callback = _ignore
+    pending = [(0, len(arr) - 1, 2 * max(len(arr), 1).bit_length())]
+    while pending:
+        low, high, depth = pending.pop()
+        if high - low < INSERTION_CUTOFF:
+            _insertion_range(arr, low, high, update_callback, counter)
+        elif depth == 0:
+            _heapsort_range(arr, low, high, update_callback, counter)
+        else:
+            pivot = _median_of_three(arr, low, high, update_callback, counter)
+            split = _hoare_partition(arr, low, high, pivot, update_callback, counter)
+            # Larger side first, so the smaller one is popped next.
+            if split - low > high - split - 1:
+                pending.append((low, split, depth - 1))
+                pending.append((split + 1, high, depth - 1))
+            else:
+                pending.append((split + 1, high, depth - 1))
+                pending.append((low, split, depth - 1))
+    return "O(n log n)", "O(log n)"
+
+def _gallop(value, seq, start, stop, after_equal, counter):
+    # First index in seq[start:stop] whose item is > value (after_equal) or
+    # >= value, probing start + 1, 3, 7, ... before bisecting the last gap.
+    def before(item):
+        counter.compare()
+        return item <= value if after_equal else item < value
+    last, offset = 0, 1
+    while start + offset - 1 < stop and before(seq[start + offset - 1]):
+        last, offset = offset, 2 * offset + 1
+    low, high = start + last, min(stop, start + offset - 1)
+    while low < high:
+        mid = (low + high) // 2
+        if before(seq[mid]):
+            low = mid + 1
+        else:
+            high = mid
+    return low
+
+def _copy_block(arr, target, values, update_callback, counter):
+    arr[target:target + len(values)] = values
+    counter.swap(len(values))
+    written = range(target, target + len(values))
+    update_callback(arr, written, written)
+
+def _merge_runs(arr, low, mid, high, update_callback, counter):
+    # Stable merge of arr[low:mid] and arr[mid:high]. The head of the left run
+    # and the tail of the right run that are already in place are skipped by
+    # galloping; after MIN_GALLOP wins in a row, the winning side is copied
+    # as one block.
+    low = _gallop(arr[mid], arr, low, mid, True, counter)
+    if low == mid:
+        return
+    high = _gallop(arr[mid - 1], arr, mid, high, False, counter)
+    left = arr[low:mid]
+    counter.allocate(len(left))
+    i, j, k = 0, mid, low
+    left_wins = right_wins = 0
+    while i < len(left) and j < high:
+        update_callback(arr, [k, j], [])
+        counter.compare()
+        if arr[j] < left[i]:
+            arr[k] = arr[j]
+            j += 1
+            right_wins, left_wins = right_wins + 1, 0
+        else:
+            arr[k] = left[i]
+            i += 1
+            left_wins, right_wins = left_wins + 1, 0
+        counter.swap()
+        update_callback(arr, [k], [k])
+        k += 1
+        if left_wins >= MIN_GALLOP and j < high:
+            stop = _gallop(arr[j], left, i, len(left), True, counter)
+            _copy_block(arr, k, left[i:stop], update_callback, counter)
+            k += stop - i
+            i, left_wins = stop, 0
+        elif right_wins >= MIN_GALLOP and i < len(left):
+            stop = _gallop(left[i], arr, j, high, False, counter)
+            _copy_block(arr, k, arr[j:stop], update_callback, counter)
+            k += stop - j
+            j, right_wins = stop, 0
+    if i < len(left):
+        _copy_block(arr, k, left[i:], update_callback, counter)
+
+def _min_run(n):
+    # As in CPython: 32..64, chosen so n / min_run is a power of two or just below.
+    extra = 0
+    while n >= 64:
+        extra |= n & 1
+        n >>= 1
+    return n + extra
+
+def _next_run(arr, low, n, update_callback, counter):
+    # End of the natural run starting at low; strictly descending runs are reversed.
+    high = low + 1
+    if high == n:
+        return high
+    update_callback(arr, [low, high], [])
+    counter.compare()
+    if arr[high] < arr[low]:
+        while high + 1 < n and arr[high + 1] < arr[high]:
+            counter.compare()
+            high += 1
+        _copy_block(arr, low, arr[low:high + 1][::-1], update_callback, counter)
+    else:
+        while high + 1 < n and arr[high + 1] >= arr[high]:
+            counter.compare()
+            high += 1
+    return high + 1
+
+def tim_sort(arr, update_callback=None, counter=NULL_COUNTER):
+    # Natural runs, extended to min_run by insertion sort, then merged
+    # pairwise bottom-up with galloping merges. Sorted and reversed input is
+    # a single run, so it costs n - 1 comparisons.
+    if update_callback is None:
+        update_callback = _ignore
+    n = len(arr)
+    min_run = _min_run(n)
+    bounds = [0]
+    while bounds[-1] < n:
+        low = bounds[-1]
+        end = _next_run(arr, low, n, update_callback, counter)
+        if end - low < min_run:
+            stop = min(n, low + min_run)
+            _insertion_range(arr, low, stop - 1, update_callback, counter, sorted_until=end)
+            end = stop
+        bounds.append(end)
+    while len(bounds) > 2:
+        merged = [0]
+        for i in range(2, len(bounds), 2):
+            _merge_runs(arr, bounds[i - 2], bounds[i - 1], bounds[i], update_callback, counter)
+            merged.append(bounds[i])
+        if len(bounds) % 2 == 0:
+            merged.append(bounds[-1])
+        bounds = merged
+    return "O(n log n)", "O(n)"
+
+def radix_sort(arr, update_callback=None, counter=NULL_COUNTER):
+    # LSD radix sort for ints, RADIX_BITS per pass, keyed on value - min so
+    # negative numbers work. Each pass is a stable bucket pass written back
+    # in order; passes whose digit is the same for every key are skipped.
+    if update_callback is None:
+        update_callback = _ignore
+    if len(arr) < 2:
+        return "O(d·(n + b))", "O(n + b)"
+    offset = min(arr)
+    width = (max(arr) - offset).bit_length()
+    mask = (1 << RADIX_BITS) - 1
+    for shift in range(0, width, RADIX_BITS):
+        buckets = [[] for _ in range(mask + 1)]
+        for value in arr:
+            buckets[((value - offset) >> shift) & mask].append(value)
+        counter.allocate(len(arr))
+        if max(map(len, buckets)) == len(arr):
+            continue
+        k = 0
+        for bucket in buckets:
+            for value in bucket:
+                if arr[k] != value:
+                    arr[k] = value
+                    counter.swap()
+                    update_callback(arr, [k], [k])
+                k += 1
+    return "O(d·(n + b))", "O(n + b)"
+
+def _attach(shm_name):
+    shm = SharedMemory(name=shm_name)
+    return shm, shm.buf.cast('q')
+
+def _sort_block(shm_name, low, high):
+    shm, view = _attach(shm_name)
+    try:
+        block = view[low:high].tolist()
+        counter = Counter()
+        tim_sort(block, None, counter)
+        view[low:high] = array('q', block)
+    finally:
+        view.release()
+        shm.close()
+    return counter.as_dict()
+
+def _merge_blocks(shm_name, low, mid, high):
+    shm, view = _attach(shm_name)
+    try:
+        block = view[low:high].tolist()
+        counter = Counter()
+        _merge_runs(block, 0, mid - low, high - low, _ignore, counter)
+        view[low:high] = array('q', block)
+    finally:
+        view.release()
+        shm.close()
+    return counter.as_dict()
+
+def _add_counts(counter, counts):
+    counter.compare(counts["comparisons"])
+    counter.swap(counts["swaps"])
+    counter.allocate(counts["allocations"])
+
+def parallel_merge_sort(arr, update_callback=None, counter=NULL_COUNTER, workers=None):
+    # Ints only. The input is copied once into a shared-memory int64 buffer;
+    # each worker process tim-sorts one block in place, then adjacent blocks
+    # are merged pairwise in parallel rounds until one remains. Each finished
+    # block or merge is reported as a single step over its range. Below
+    # PARALLEL_CUTOFF, or with one worker, it is tim_sort in this process.
+    if update_callback is None:
+        update_callback = _ignore
+    n = len(arr)
+    workers = workers or os.cpu_count() or 1
+    if workers < 2 or n < PARALLEL_CUTOFF:
+        tim_sort(arr, update_callback, counter)
+        return "O(n log n / p + n)", "O(n)"
+    shm = SharedMemory(create=True, size=8 * n)
+    view = shm.buf.cast('q')
+    counter.allocate(n)
+
+    def publish(low, high):
+        arr[low:high] = view[low:high].tolist()
+        written = range(low, high)
+        update_callback(arr, written, written)
+
+    try:
+        view[:] = array('q', arr)
+        bounds = [n * i // workers for i in range(workers + 1)]
+        with ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+            jobs = [(low, high, pool.submit(_sort_block, shm.name, low, high)) for low, high in zip(bounds, bounds[1:])]
+            for low, high, job in jobs:
+                _add_counts(counter, job.result())
+                publish(low, high)
+            while len(bounds) > 2:
+                jobs = [(bounds[i - 2], bounds[i], pool.submit(_merge_blocks, shm.name, bounds[i - 2], bounds[i - 1], bounds[i]))
+                        for i in range(2, len(bounds), 2)]
+                for low, high, job in jobs:
+                    _add_counts(counter, job.result())
+                    publish(low, high)
+                bounds = bounds[::2] if len(bounds) % 2 else bounds[::2] + [bounds[-1]]
+    finally:
+        view.release()
+        shm.close()
+        shm.unlink()
+    return "O(n log n / p + n)", "O(n)"
@@ -0,0 +1,174 @@
+# dsa_visualizer/algorithms/stack_operations.py
+from array import array
+
+PUSH, POP = 1, -1
+
+class Stack:
+    # List-backed stack: callers pass the list in and get it back.
+    def __init__(self):
+        self.items = []
+
+    def push(self, items, item):
+        items.append(item)
+        return items, "O(1)", "O(1)"
+
+    def pop(self):
+        item = self.items.pop() if self.items else None
+        return self.items, item, "O(1)", "O(1)"
+
+    def peek(self, items):
+        return items[-1], "O(1)", "O(1)"
+
+    def is_empty(self, items):
+        return len(items) == 0
+
+    def size(self, items):
+        return len(items)
+
+class ArrayStack:
+    # Persistent integer stack: keep one instance (e.g. in st.session_state).
+    # Items live in a typed buffer that doubles when full and halves when a
+    # quarter full, so push and pop are amortised O(1). Every operation is also
+    # appended to a log (kind, plus the values pushed or popped), which is all
+    # an undo or a step-back view needs; the item list is never rewritten.
+    def __init__(self, values=(), capacity=16, typecode='q'):
+        self.typecode = typecode
+        self.min_capacity = max(capacity, 1)
+        self.buffer = array(typecode, [0]) * max(self.min_capacity, len(values))
+        self.count = 0
+        self.log_kinds = array('b')
+        self.log_offsets = array('L', [0])
+        self.log_values = array(typecode)
+        if values:
+            self.push_many(values)
+
+    def __len__(self):
+        return self.count
+
+    @property
+    def capacity(self):
+        return len(self.buffer)
+
+    @property
+    def log_length(self):
+        return len(self.log_kinds)
+
+    def _resize(self, capacity):
+        self.buffer = self.buffer[:self.count] + array(self.typecode, [0]) * (capacity - self.count)
+
+    def _extend(self, values):
+        needed = self.count + len(values)
+        if needed > len(self.buffer):
+            capacity = len(self.buffer)
+            while capacity < needed:
+                capacity *= 2
+            self._resize(capacity)
+        self.buffer[self.count:needed] = values
+        self.count = needed
+
+    def _log(self, kind, values):
+        self.log_kinds.append(kind)
+        self.log_values.extend(values)
+        self.log_offsets.append(len(self.log_values))
+
+    def push(self, item):
+        if self.count == len(self.buffer):
+            self._resize(2 * len(self.buffer))
+        self.buffer[self.count] = item
+        self.count += 1
+        self._log(PUSH, (item,))
+        return "O(1)", "O(1)"
+
+    def push_many(self, values):
+        values = array(self.typecode, values)
+        self._extend(values)
+        self._log(PUSH, values)
+        return "O(k)", "O(1)"
+
+    def _shrink(self):
+        if len(self.buffer) > self.min_capacity and self.count <= len(self.buffer) // 4:
+            self._resize(max(self.min_capacity, len(self.buffer) // 2))
+
+    def pop(self):
+        if not self.count:
+            return None, "O(1)", "O(1)"
+        self.count -= 1
+        item = self.buffer[self.count]
+        self._log(POP, (item,))
+        self._shrink()
+        return item, "O(1)", "O(1)"
+
+    def pop_many(self, count):
+        count = min(count, self.count)
+        if not count:
+            return [], "O(1)", "O(1)"
+        taken = self.buffer[self.count - count:self.count]
+        taken.reverse()
+        self.count -= count
+        self._log(POP, taken)
+        self._shrink()
+        return taken.tolist(), "O(k)", "O(1)"
+
+    def peek(self):
+        return (self.buffer[self.count - 1] if self.count else None), "O(1)", "O(1)"
+
+    def is_empty(self):
+        return self.count == 0
+
+    def size(self):
+        return self.count
+
+    def to_list(self):
+        return self.buffer[:self.count].tolist()
+
+    def top(self, limit):
+        # The topmost `limit` items, bottom to top.
+        return self.buffer[max(0, self.count - limit):self.count].tolist()
+
+    def _entry(self, position):
+        begin, end = self.log_offsets[position], self.log_offsets[position + 1]
+        return self.log_kinds[position], self.log_values[begin:end]
+
+    def history(self, start=0, stop=None):
+        # (kind, values) for each logged operation; pops list values top first.
+        stop = self.log_length if stop is None else min(stop, self.log_length)
+        return [("push" if kind == PUSH else "pop", values.tolist())
+                for kind, values in map(self._entry, range(start, stop))]
+
+    def state_at(self, position):
+        # Contents after the first `position` logged operations, rebuilt from
+        # whichever end of the log is closer: replayed forward from empty, or
+        # unwound backward from the current contents.
+        position = max(0, min(position, self.log_length))
+        if position < self.log_length - position:
+            state = array(self.typecode)
+            for kind, values in map(self._entry, range(position)):
+                if kind == PUSH:
+                    state.extend(values)
+                else:
+                    del state[len(state) - len(values):]
+        else:
+            state = self.buffer[:self.count]
+            for kind, values in map(self._entry, reversed(range(position, self.log_length))):
+                if kind == PUSH:
+                    del state[len(state) - len(values):]
+                else:
+                    values.reverse()
+                    state.extend(values)
+        return state.tolist()
+
+    def undo(self):
+        # Reverts the last logged operation and drops it from the log.
+        if not self.log_length:
+            return None
+        kind, values = self._entry(self.log_length - 1)
+        if kind == PUSH:
+            self.count -= len(values)
+            self._shrink()
+        else:
+            values.reverse()
+            self._extend(values)
+        self.log_kinds.pop()
+        self.log_offsets.pop()
+        del self.log_values[self.log_offsets[-1]:]
+        return "push" if kind == PUSH else "pop"
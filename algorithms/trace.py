@@ -0,0 +1,191 @@
+# dsa_visualizer/algorithms/trace.py
+import time
+from array import array
+from collections import namedtuple
+from itertools import islice
+
+# One recorded step: the data being shown, the indices (or nodes) being looked at,
+# and the ones marked as found / swapped / visited.
+Step = namedtuple("Step", ["state", "highlighted", "marked"])
+
+
+def _compact(indices):
+    if indices is None:
+        return ()
+    if isinstance(indices, range):
+        return indices
+    if isinstance(indices, int):
+        return (indices,)
+    return tuple(indices)
+
+
+class TraceRecorder:
+    def __init__(self):
+        self.steps = []
+        self._last_state = None
+
+    def __len__(self):
+        return len(self.steps)
+
+    def _snapshot(self, state):
+        # Consecutive steps over unchanged data share one tuple.
+        state = tuple(state)
+        if state != self._last_state:
+            self._last_state = state
+        return self._last_state
+
+    def record(self, state, highlighted, marked):
+        self.steps.append(Step(self._snapshot(state), _compact(highlighted), _compact(marked)))
+
+    def array_callback(self, arr, highlighted, marked):
+        self.record(arr, highlighted, marked)
+
+    def list_callback(self, data_tuple):
+        self.steps.append(Step(self._snapshot(data_tuple[0]), data_tuple[1], data_tuple[2]))
+
+
+class ArrayTrace:
+    # Array-backed trace for algorithms that rearrange an int array in place.
+    # Stores the initial buffer plus per-step deltas, with a full keyframe every
+    # keyframe_interval steps. The interval defaults to at least len(arr), so
+    # keyframes never cost more memory than the deltas themselves.
+    def __init__(self, arr, keyframe_interval=None, typecode='i'):
+        self.typecode = typecode
+        self.initial = array(typecode, arr)
+        self.keyframe_interval = keyframe_interval or max(256, len(self.initial))
+        self.keyframes = [array(typecode, self.initial)]
+        self.highlight_offsets = array('L', [0])
+        self.highlight_index = array('l')
+        self.marked_offsets = array('L', [0])
+        self.marked_index = array('l')
+        self.delta_offsets = array('L', [0])
+        self.delta_index = array('l')
+        self.delta_value = array(typecode)
+        self._shadow = array(typecode, self.initial)
+
+    def __len__(self):
+        return len(self.highlight_offsets) - 1
+
+    @property
+    def nbytes(self):
+        buffers = (self.initial, self._shadow, self.highlight_offsets, self.highlight_index, self.marked_offsets,
+                   self.marked_index, self.delta_offsets, self.delta_index, self.delta_value, *self.keyframes)
+        return sum(len(buffer) * buffer.itemsize for buffer in buffers)
+
+    def __call__(self, arr, highlighted, marked):
+        # Only positions named in the callback can have changed, so the shadow
+        # copy is compared at those indices instead of across the whole array.
+        shadow = self._shadow
+        for idx in set(highlighted).union(marked):
+            value = arr[idx]
+            if shadow[idx] != value:
+                shadow[idx] = value
+                self.delta_index.append(idx)
+                self.delta_value.append(value)
+        self.highlight_index.extend(highlighted)
+        self.marked_index.extend(marked)
+        self.highlight_offsets.append(len(self.highlight_index))
+        self.marked_offsets.append(len(self.marked_index))
+        self.delta_offsets.append(len(self.delta_index))
+        if len(self) % self.keyframe_interval == 0:
+            self.keyframes.append(array(self.typecode, shadow))
+
+    def _apply(self, state, start, stop):
+        begin, end = self.delta_offsets[start], self.delta_offsets[stop]
+        for idx, value in zip(self.delta_index[begin:end], self.delta_value[begin:end]):
+            state[idx] = value
+
+    def state_at(self, position):
+        # State after step `position`, rebuilt from the nearest earlier keyframe.
+        keyframe = position // self.keyframe_interval
+        state = array(self.typecode, self.keyframes[keyframe])
+        self._apply(state, keyframe * self.keyframe_interval, position + 1)
+        return state
+
+    def _step(self, position, state):
+        h_begin, h_end = self.highlight_offsets[position], self.highlight_offsets[position + 1]
+        m_begin, m_end = self.marked_offsets[position], self.marked_offsets[position + 1]
+        return Step(state,
+                    tuple(self.highlight_index[h_begin:h_end]),
+                    tuple(self.marked_index[m_begin:m_end]))
+
+    def __getitem__(self, position):
+        if position < 0:
+            position += len(self)
+        if not 0 <= position < len(self):
+            raise IndexError("trace step out of range")
+        return self._step(position, self.state_at(position))
+
+    def iter_steps(self, start=0, stop=None):
+        # Sequential playback advances one local state by a single delta per
+        # step; nothing is cached on the trace, so it can be shared between
+        # sessions.
+        stop = len(self) if stop is None else min(stop, len(self))
+        if start >= stop:
+            return
+        state = self.state_at(start)
+        yield self._step(start, array(self.typecode, state))
+        for position in range(start + 1, stop):
+            self._apply(state, position, position + 1)
+            yield self._step(position, array(self.typecode, state))
+
+
+class VisitTrace:
+    # Lazy trace over a generator of visited values (tree traversals). Events
+    # are pulled only as far as the player asks, so seeking to step k costs k
+    # pulls and a huge traversal is never materialised up front. Step k shows
+    # the first k + 1 visits with the k-th highlighted.
+    def __init__(self, events, total=None):
+        self._events = iter(events)
+        self.visited = []
+        self.total = total
+
+    def _pull(self, count):
+        while len(self.visited) < count and self._events is not None:
+            value = next(self._events, _EXHAUSTED)
+            if value is _EXHAUSTED:
+                self._events = None
+                self.total = len(self.visited)
+            else:
+                self.visited.append(value)
+
+    def __len__(self):
+        if self.total is None:
+            self._pull(float("inf"))
+        return self.total
+
+    def __getitem__(self, position):
+        if position < 0:
+            position += len(self)
+        self._pull(position + 1)
+        if not 0 <= position < len(self.visited):
+            raise IndexError("trace step out of range")
+        return Step(tuple(self.visited[:position + 1]), (self.visited[position],), ())
+
+
+_EXHAUSTED = object()
+
+
+class TracePlayer:
+    def __init__(self, steps):
+        self.steps = steps
+        self.position = 0
+
+    def __len__(self):
+        return len(self.steps)
+
+    def seek(self, position):
+        self.position = max(0, min(position, len(self.steps) - 1))
+        return self.steps[self.position]
+
+    def play(self, render, delay=0.3, start=0, stop=None):
+        stop = len(self.steps) if stop is None else min(stop, len(self.steps))
+        if isinstance(self.steps, ArrayTrace):
+            steps = self.steps.iter_steps(start, stop)
+        else:
+            steps = islice(self.steps, start, stop)
+        for position, step in enumerate(steps, start):
+            self.position = position
+            render(step)
+            if delay and position < stop - 1:
+                time.sleep(delay)
@@ -0,0 +1,162 @@
+# dsa_visualizer/algorithms/tree_traversal.py
+# Traversals are generators over node values driven by an explicit stack (or
+# Morris threading), so a degenerate tree built from sorted input is walked
+# without touching Python's recursion limit. The *_traversal functions keep
+# the callback API on top of them.
+from collections import deque
+
+from .instrument import NULL_COUNTER
+from .node_pool import TreePool
+
+class TreeNode:
+    __slots__ = ("value", "left", "right", "__weakref__")
+
+    def __init__(self, value):
+        self.value = value
+        self.left = None
+        self.right = None
+
+def insert_node(root, value):
+    new_node = TreeNode(value)
+    if root is None:
+        return new_node
+    node = root
+    while True:
+        if value < node.value:
+            if node.left is None:
+                node.left = new_node
+                return root
+            node = node.left
+        else:
+            if node.right is None:
+                node.right = new_node
+                return root
+            node = node.right
+
+def build_bst(values, compact=False):
+    # compact=True stores the nodes in a TreePool and returns a view of its root.
+    if compact:
+        return TreePool.from_values(values).root
+    root = None
+    for value in values:
+        root = insert_node(root, value)
+    return root
+
+def build_balanced_bst(values):
+    return TreePool.from_sorted(sorted(values)).root
+
+def iter_inorder(root, counter=NULL_COUNTER):
+    stack = []
+    node = root
+    while stack or node is not None:
+        while node is not None:
+            stack.append(node)
+            node = node.left
+        node = stack.pop()
+        counter.visit()
+        yield node.value
+        node = node.right
+
+def iter_preorder(root, counter=NULL_COUNTER):
+    stack = [root] if root is not None else []
+    while stack:
+        node = stack.pop()
+        counter.visit()
+        yield node.value
+        if node.right is not None:
+            stack.append(node.right)
+        if node.left is not None:
+            stack.append(node.left)
+
+def iter_postorder(root, counter=NULL_COUNTER):
+    stack = []
+    node = root
+    last_visited = None
+    while stack or node is not None:
+        if node is not None:
+            stack.append(node)
+            node = node.left
+            continue
+        top = stack[-1]
+        if top.right is not None and top.right != last_visited:
+            node = top.right
+        else:
+            counter.visit()
+            yield top.value
+            last_visited = stack.pop()
+
+def iter_level_order(root, counter=NULL_COUNTER):
+    queue = deque([root] if root is not None else [])
+    while queue:
+        node = queue.popleft()
+        counter.visit()
+        yield node.value
+        if node.left is not None:
+            queue.append(node.left)
+        if node.right is not None:
+            queue.append(node.right)
+
+def _morris(root, preorder, counter):
+    node = root
+    while node is not None:
+        if node.left is None:
+            counter.visit()
+            yield node.value
+            node = node.right
+            continue
+        predecessor = node.left
+        while predecessor.right is not None and predecessor.right != node:
+            predecessor = predecessor.right
+        if predecessor.right is None:
+            # Thread the predecessor back to node so the walk can return here.
+            if preorder:
+                counter.visit()
+                yield node.value
+            predecessor.right = node
+            node = node.left
+        else:
+            predecessor.right = None
+            if not preorder:
+                counter.visit()
+                yield node.value
+            node = node.right
+
+def _morris_walk(root, preorder, counter):
+    # O(1) extra space, but the tree is temporarily rewired while the walk is
+    # suspended. Closing the generator early finishes the walk silently, which
+    # removes every thread before the tree is used again.
+    events = _morris(root, preorder, counter)
+    try:
+        for value in events:
+            yield value
+    finally:
+        for _ in events:
+            pass
+
+def morris_inorder(root, counter=NULL_COUNTER):
+    return _morris_walk(root, False, counter)
+
+def morris_preorder(root, counter=NULL_COUNTER):
+    return _morris_walk(root, True, counter)
+
+def _drive(events, update_callback):
+    visited = []
+    for value in events:
+        visited.append(value)
+        update_callback(value, visited)
+
+def inorder_traversal(root, update_callback, counter=NULL_COUNTER):
+    _drive(iter_inorder(root, counter), update_callback)
+    return "O(n)", "O(h)"
+
+def preorder_traversal(root, update_callback, counter=NULL_COUNTER):
+    _drive(iter_preorder(root, counter), update_callback)
+    return "O(n)", "O(h)"
+
+def postorder_traversal(root, update_callback, counter=NULL_COUNTER):
+    _drive(iter_postorder(root, counter), update_callback)
+    return "O(n)", "O(h)"
+
+def level_order_traversal(root, update_callback, counter=NULL_COUNTER):
+    _drive(iter_level_order(root, counter), update_callback)
+    return "O(n)", "O(n)"
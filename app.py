@@ -1,127 +1,472 @@
 # dsa_visualizer/app.py
-import streamlit as st
+import os
+import sys
 import time
-from algorithms import searching, sorting, tree_traversal, list_operations, stack_operations, queue_operations
-from visualizations import search_visualizer, sort_visualizer, tree_visualizer, list_visualizer, stack_visualizer, queue_visualizer
-from utility import generate_random_array, generate_bst_nodes
+import uuid
+
+SCRIPT_START = time.perf_counter()
+
+import streamlit as st
+import registry
+import scheduler
+from algorithms import list_operations, stack_operations, trace, instrument
+from visualizations import list_visualizer, stack_visualizer, queue_visualizer
+from cache import TraceCache, cache_key
+
+# NumPy, altair and pandas come in through these; each page imports only what
+# it touches, on first use.
+utility = registry.LazyModule("utility")
+searching = registry.LazyModule("algorithms.searching")
+tree_traversal = registry.LazyModule("algorithms.tree_traversal")
+race = registry.LazyModule("algorithms.race")
+tree_visualizer = registry.LazyModule("visualizations.tree_traversal_visualizer")
 
 st.set_page_config(page_title="DSA Visualizer", layout="wide")
 
 st.title("Interactive DSA & Data Structures Visualizer")
 
-algorithm_type = st.sidebar.selectbox(
-    "Select Operation Type",
-    ["Searching", "Sorting", "Tree Traversal", "List Operations", "Stack Operations", "Queue Operations"]
-)
 
-if algorithm_type == "Searching":
-    st.sidebar.subheader("Searching Algorithm Options")
-    search_algo = st.sidebar.selectbox(
-        "Select Search Algorithm",
-        ["Linear Search", "Binary Search", "Jump Search"]
-    )
-    data_input = st.sidebar.text_area("Enter comma-separated numbers for the array:", "10,5,8,2,7,1,9,4,6,3", height=50)
+@st.cache_resource
+def get_trace_cache():
+    # One cache per server process, shared by every session.
+    return TraceCache(path=os.environ.get("DSA_VISUALIZER_CACHE_PATH"))
+
+
+trace_cache = get_trace_cache()
+
+
+@st.cache_resource
+def get_job_scheduler():
+    # Traces are computed off the script threads, in one process pool per
+    # server sized by DSA_VISUALIZER_WORKERS (default: one per core).
+    workers = int(os.environ.get("DSA_VISUALIZER_WORKERS", 0)) or None
+    return scheduler.JobScheduler(workers=workers, cache=trace_cache)
+
+
+job_scheduler = get_job_scheduler()
+
+
+def session_id():
+    return st.session_state.setdefault("session_id", uuid.uuid4().hex)
+
+
+@st.fragment(run_every=0.5)
+def job_progress(future):
+    # Polls the job without holding up the page; the whole page reruns once
+    # the trace is ready.
+    if future.done():
+        st.rerun()
+    metrics = job_scheduler.metrics()
+    st.info(f"Computing the trace in the background ({metrics['running']} running, {metrics['queued']} waiting)…")
+
+
+def background_run(key, run_key, started, trace_key, job, *args):
+    # Stores (run_key, steps, outcome) as session_state[f"{key}_run"] once the
+    # trace for trace_key is ready and returns True on that rerun (autoplay).
+    # Until Start is pressed the job is only prefetched; after that, an
+    # unfinished job is polled by job_progress and the result picked up on
+    # the rerun it triggers.
+    if started:
+        st.session_state[f"{key}_pending"] = run_key
+    elif st.session_state.get(f"{key}_pending") != run_key:
+        if trace_key not in trace_cache:
+            try:
+                job_scheduler.submit(session_id(), trace_key, job, *args, prefetch=True)
+            except scheduler.JobRejected:
+                pass
+        return False
+
+    stored = st.session_state.get(f"{key}_job")
+    if stored is not None and stored[0] == trace_key:
+        future = stored[1]
+    else:
+        result = trace_cache.get(trace_key)
+        if result is not None:
+            future = None
+        else:
+            try:
+                future = job_scheduler.submit(session_id(), trace_key, job, *args)
+            except scheduler.JobRejected as error:
+                st.warning(f"The trace was not started: {error}.")
+                del st.session_state[f"{key}_pending"]
+                return False
+            st.session_state[f"{key}_job"] = (trace_key, future)
+    if future is not None:
+        if not future.done():
+            job_progress(future)
+            return False
+        del st.session_state[f"{key}_job"]
+        try:
+            result = future.result()
+        except Exception as error:
+            # Report it once and drop the pending run, so the next rerun does
+            # not submit it again.
+            show_job_error(error)
+            del st.session_state[f"{key}_pending"]
+            return False
+    del st.session_state[f"{key}_pending"]
+    st.session_state[f"{key}_run"] = (run_key, *result)
+    return True
+
+
+def show_job_error(error):
+    if isinstance(error, scheduler.BudgetExceeded):
+        st.error(f"Stopped: this run needs {error}. Try a smaller input.")
+    else:
+        # Bad input (e.g. a value too large for the trace's int64 array), a
+        # crashed worker or a cancelled job.
+        st.error(f"Could not compute the trace: {type(error).__name__}: {error}")
+
+
+def background_value(trace_key, job, *args):
+    # For results shown without a Start button: the job's value once it is
+    # ready, or None while it runs (progress shown) or if it failed (error
+    # shown). Finished values come from the trace cache on later reruns.
+    value = trace_cache.get(trace_key)
+    if value is not None:
+        return value
     try:
-        data_array = [int(x.strip()) for x in data_input.split(',')]
-    except ValueError:
-        st.sidebar.error("Invalid input. Please enter comma-separated numbers.")
+        future = job_scheduler.submit(session_id(), trace_key, job, *args)
+    except scheduler.JobRejected as error:
+        st.warning(f"Not started: {error}.")
+        return None
+    if not future.done():
+        job_progress(future)
+        return None
+    try:
+        return future.result()
+    except Exception as error:
+        show_job_error(error)
+        return None
+
+
+def replay_trace(steps, render, key, autoplay):
+    if not steps:
+        return
+    player = trace.TracePlayer(steps)
+    delay = st.sidebar.slider("Replay delay (seconds)", 0.0, 1.0, 0.3, 0.05, key=f"{key}_delay")
+    st.caption(f"{len(player)} steps recorded")
+    placeholder = st.empty()
+
+    def draw(step):
+        with placeholder.container():
+            render(step)
+
+    if autoplay:
+        player.play(draw, delay)
+    elif len(player) > 1:
+        position = st.slider("Step", 0, len(player) - 1, len(player) - 1, key=f"{key}_step")
+        draw(player.seek(position))
+    else:
+        draw(player.seek(0))
+
+
+def cached_renderer(key, run_key, build):
+    # One renderer per run, kept across reruns so scrubbing reuses its
+    # compiled chart spec and only rebuilds the data frame.
+    stored = st.session_state.get(f"{key}_renderer")
+    if stored is None or stored[0] != run_key:
+        stored = (run_key, build())
+        st.session_state[f"{key}_renderer"] = stored
+    return stored[1]
+
+
+GROWTH_SIZES = [16, 32, 64, 128, 256, 512]
+QUEUE_DISPLAY_LIMIT = 50
+STACK_DISPLAY_LIMIT = 50
+FILE_WINDOW_LIMIT = 1000
+OVERVIEW_POINTS = 2000
+
+
+def load_dataset(source, key):
+    # The loaded array stays in the session, so reruns reuse the mapping
+    # instead of re-reading the file.
+    stored = st.session_state.get("dataset")
+    if stored is None or stored[0] != key:
+        bar = st.sidebar.progress(0.0, "Loading…")
+
+        def progress(done, total):
+            if total:
+                bar.progress(min(done / total, 1.0), f"Parsed {done:,} of {total:,} bytes")
+
+        try:
+            dataset = utility.load_array(source, progress=progress)
+        except ValueError as error:
+            st.sidebar.error(f"Could not load the file: {error}")
+            st.stop()
+        bar.empty()
+        stored = (key, dataset)
+        st.session_state["dataset"] = stored
+    return stored[1]
+
+
+def array_input(default):
+    # Either a small comma-separated list, or a window into a large file that
+    # is memory-mapped (binary) or parsed in chunks (text) by utility.load_array.
+    source = st.sidebar.radio("Input source", ["Text", "File"], horizontal=True)
+    if source == "Text":
+        data_input = st.sidebar.text_area("Enter comma-separated numbers for the array:", default, height=50)
+        try:
+            return [int(x.strip()) for x in data_input.split(',')]
+        except ValueError:
+            st.sidebar.error("Invalid input. Please enter comma-separated numbers.")
+            st.stop()
+
+    uploaded = st.sidebar.file_uploader("Integer file (.csv, .txt, .npy, .bin)", type=["csv", "txt", "npy", "bin"])
+    path = st.sidebar.text_input("...or a local file path")
+    if uploaded is not None:
+        dataset = load_dataset(uploaded, ("upload", uploaded.file_id))
+    elif path:
+        if not os.path.isfile(path):
+            st.sidebar.error("File not found.")
+            st.stop()
+        dataset = load_dataset(path, ("path", path, os.path.getmtime(path)))
+    else:
+        st.info("Upload a file or enter a local path to load a dataset.")
         st.stop()
+    if not len(dataset):
+        st.sidebar.error("The file contains no numbers.")
+        st.stop()
+
+    overview, stride = utility.sample_array(dataset, OVERVIEW_POINTS)
+    st.subheader("Dataset Overview")
+    st.line_chart(overview)
+    st.caption(f"{len(dataset):,} values ({dataset.dtype}), showing every {stride:,}th")
+    max_size = min(FILE_WINDOW_LIMIT, len(dataset))
+    size = st.sidebar.slider("Window size", 1, max_size, min(100, max_size)) if max_size > 1 else 1
+    start = st.sidebar.number_input("Window start", 0, len(dataset) - size, 0, step=size)
+    return utility.window(dataset, int(start), size)
+
+
+def show_measured_growth(category, name, theoretical, metric="comparisons"):
+    costs = background_value(cache_key("growth", GROWTH_SIZES, name, metric), scheduler.growth_costs, category, name,
+                             GROWTH_SIZES, metric)
+    if costs is None:
+        return
+    best, constant, fits = instrument.fit_growth(GROWTH_SIZES, costs)
+    chart = {"n": GROWTH_SIZES, f"measured {metric}": costs}
+    if theoretical in fits:
+        growth = instrument.GROWTH_CLASSES[theoretical]
+        chart[f"{theoretical} fit"] = [fits[theoretical][0] * growth(n) for n in GROWTH_SIZES]
+    st.subheader("Measured Complexity")
+    st.line_chart(chart, x="n")
+    st.info(f"Measured growth: {best} (about {constant:.2f} × f(n) {metric}), theoretical: {theoretical}")
+
+
+RACE_FRAMES = 200
+# Indexed by the lane states race.RUNNING, FINISHED, CANCELLED, WAITING and OVER_BUDGET.
+RACE_STATES = ("running", "finished", "cancelled", "waiting", "over budget")
+
+
+def cancel_race():
+    stored = st.session_state.pop("sort_race", None)
+    if stored is not None:
+        stored[1].close()
+
+
+@st.fragment(run_every=0.5)
+def race_progress(sort_race):
+    # Reruns on its own every half second, reading the workers' counters from
+    # shared memory; the rest of the page is not re-executed until the race ends.
+    if sort_race.done():
+        st.rerun()
+    progress = sort_race.progress()
+    st.subheader(f"Race in progress ({time.perf_counter() - sort_race.started_at:.1f} s)")
+    st.bar_chart({"comparisons": {name: counts[0] for name, counts in progress.items()},
+                  "swaps": {name: counts[1] for name, counts in progress.items()}}, stack=False)
+    st.caption(" | ".join(f"{name}: {RACE_STATES[counts[2]]}" for name, counts in progress.items()))
+
+
+def show_race_results(sort_race, run_key):
+    results = sort_race.results()
+    progress = sort_race.progress()
+    st.subheader("Race Results")
+    st.table({
+        "Algorithm": list(results),
+        "Time (s)": [f"{result['wall_time']:.4f}" for result in results.values()],
+        "Comparisons": [progress[name][0] for name in results],
+        "Swaps": [progress[name][1] for name in results],
+    })
+    players = {name: trace.TracePlayer(result["trace"]) for name, result in results.items() if result["trace"] is not None}
+    if not players:
+        st.info(f"Inputs longer than {race.TRACE_LIMIT} values are raced without recording traces.")
+        return
+
+    # One step counter drives every panel, so faster algorithms finish first.
+    longest = max(len(player) for player in players.values())
+    array_renderer = registry.load("visualizer", "Array")
+    renderers = {name: cached_renderer(f"race_{name}", run_key, lambda: array_renderer(sort_race.values)) for name in players}
+    delay = st.sidebar.slider("Replay delay (seconds)", 0.0, 1.0, 0.05, 0.01, key="race_delay")
+    autoplay = st.button("Replay Race")
+    placeholders = {name: column.empty() for name, column in zip(players, st.columns(len(players)))}
+
+    def draw(position):
+        for name, player in players.items():
+            step = player.seek(position)
+            with placeholders[name].container():
+                renderers[name].render(step.state, step.highlighted, step.marked)
+                st.caption(f"{name}: step {player.position + 1} of {len(player)}")
+
+    if autoplay:
+        stride = max(1, -(-longest // RACE_FRAMES))
+        for position in range(0, longest + stride - 1, stride):
+            draw(position)
+            time.sleep(delay)
+    elif longest > 1:
+        draw(st.slider("Step", 0, longest - 1, longest - 1, key="race_step"))
+    else:
+        draw(0)
+
+
+def show_race(data_array):
+    run_key = ("race", tuple(data_array))
+    stored = st.session_state.get("sort_race")
+    if stored is not None and stored[0] != run_key:
+        # The input changed under a running race.
+        cancel_race()
+        stored = None
+    start_column, cancel_column = st.columns(2)
+    if start_column.button("Start Race"):
+        cancel_race()
+        try:
+            stored = (run_key, race.SortRace(data_array, job_scheduler, session_id()).start())
+        except scheduler.JobRejected as error:
+            st.warning(f"The race was not started: {error}.")
+            return
+        st.session_state["sort_race"] = stored
+    if stored is None:
+        st.info(f"Runs {', '.join(race.RACE_SORTS)} on the same input in the background job pool.")
+        return
+    if cancel_column.button("Cancel Race"):
+        cancel_race()
+        st.warning("Race cancelled.")
+        return
+    sort_race = stored[1]
+    if not sort_race.done():
+        race_progress(sort_race)
+    else:
+        show_race_results(sort_race, run_key)
+
+
+def show_complexity_caption(category, name):
+    # Declared complexity, shown before anything has been imported or run.
+    entry = registry.entry(category, name)
+    if entry.time_complexity:
+        st.sidebar.caption(f"Time: {entry.time_complexity}, Space: {entry.space_complexity}")
+
+
+def searching_page():
+    st.sidebar.subheader("Searching Algorithm Options")
+    search_algo = st.sidebar.selectbox("Select Search Algorithm", registry.names("search"))
+    show_complexity_caption("search", search_algo)
+    search_entry = registry.entry("search", search_algo)
+    sorted_input = search_entry.options.get("sorted_input", False)
+    data_array = array_input("10,5,8,2,7,1,9,4,6,3")
     target = st.sidebar.number_input("Target Value", value=5)
+    show_growth = st.sidebar.checkbox("Show measured complexity")
+    show_batch = st.sidebar.checkbox("Batch lookup analysis")
 
     st.subheader("Array")
     st.write(data_array)
 
-    if st.button("Start Search"):
-        placeholder = st.empty()
-
-        def update_search_visualization(arr, highlighted, found):
-            with placeholder.container():
-                search_visualizer.visualize_search(arr, highlighted, found)
-
-        if search_algo == "Linear Search":
-            result_index, time_complexity, space_complexity = searching.linear_search(list(data_array), target, update_search_visualization)
-        elif search_algo == "Binary Search":
-            sorted_array = sorted(data_array)
-            st.subheader("Sorted Array (for Binary Search)")
-            st.write(sorted_array)
-            result_index, time_complexity, space_complexity = searching.binary_search(list(sorted_array), target, update_search_visualization)
-        elif search_algo == "Jump Search":
-            sorted_array = sorted(data_array)
-            st.subheader("Sorted Array (for Jump Search)")
-            st.write(sorted_array)
-            result_index, time_complexity, space_complexity = searching.jump_search(list(sorted_array), target, update_search_visualization)
+    if show_batch:
+        # Look up every value between min - 1 and max + 1 in one batched call.
+        batch_method = search_entry.options.get("batch_method", "linear")
+        batch_array = utility.sorted_view(data_array) if sorted_input else data_array
+        low_target, high_target = min(data_array) - 1, min(max(data_array) + 1, min(data_array) + 100_000)
+        batch_targets = list(range(low_target, high_target + 1))
+        st.subheader("Batch Lookup Analysis")
+        batch = background_value(cache_key("batch", batch_array, batch_method, low_target, high_target),
+                                 scheduler.batch_lookup, batch_array, batch_targets, batch_method)
+        if batch is not None:
+            found_indices, probes = batch
+            st.write(f"{len(batch_targets)} targets, {int((found_indices != -1).sum())} found, "
+                     f"{probes.mean():.2f} probes on average (max {probes.max()})")
+            st.bar_chart(searching.probe_histogram(probes))
+
+    run_key = (search_algo, tuple(data_array), target)
+    search_input = utility.sorted_view(data_array) if sorted_input else data_array
+    autoplay = background_run("search", run_key, st.button("Start Search"), cache_key(search_algo, data_array, target),
+                              scheduler.search_trace, search_algo, search_input, target)
+
+    search_run = st.session_state.get('search_run')
+    if search_run and search_run[0] == run_key:
+        _, steps, (result_index, time_complexity, space_complexity) = search_run
+        if sorted_input:
+            st.subheader(f"Sorted Array (for {search_algo})")
+            st.write(utility.sorted_view(data_array))
+
+        renderer = cached_renderer("search", run_key, lambda: registry.load("visualizer", "Array")(steps[0].state))
+        replay_trace(steps, lambda step: renderer.render(step.state, step.highlighted, step.marked), "search", autoplay)
 
         if result_index != -1:
             st.success(f"Target found at index: {result_index}")
         else:
             st.error("Target not found.")
         st.info(f"Time Complexity: {time_complexity}, Space Complexity: {space_complexity}")
+        if show_growth:
+            show_measured_growth("search", search_algo, time_complexity)
         st.subheader("Explanation:")
-        if search_algo == "Linear Search":
-            st.write("Linear search iterates through each element of the array until the target is found or the end is reached.")
-        elif search_algo == "Binary Search":
-            st.write("Binary search works on sorted arrays. It repeatedly divides the search interval in half.")
-        elif search_algo == "Jump Search":
-            st.write("Jump search works on sorted arrays by jumping ahead by a fixed step and then performing a linear search.")
-
-elif algorithm_type == "Sorting":
+        st.write(search_entry.explanation)
+
+
+def sorting_page():
     st.sidebar.subheader("Sorting Algorithm Options")
-    sort_algo = st.sidebar.selectbox(
-        "Select Sorting Algorithm",
-        ["Bubble Sort", "Insertion Sort", "Selection Sort", "Merge Sort", "Quick Sort"]
-    )
-    data_input = st.sidebar.text_area("Enter comma-separated numbers for the array:", "5,1,4,2,8", height=50)
-    try:
-        data_array = [int(x.strip()) for x in data_input.split(',')]
-    except ValueError:
-        st.sidebar.error("Invalid input. Please enter comma-separated numbers.")
-        st.stop()
+    sort_algo = st.sidebar.selectbox("Select Sorting Algorithm", registry.names("sort"))
+    show_complexity_caption("sort", sort_algo)
+    sort_entry = registry.entry("sort", sort_algo)
+    data_array = array_input("5,1,4,2,8")
+
+    show_growth = st.sidebar.checkbox("Show measured complexity")
 
     st.subheader("Unsorted Array")
     st.write(data_array)
 
-    if st.button("Start Sort"):
-        placeholder = st.empty()
+    run_key = (sort_algo, tuple(data_array))
+    autoplay = background_run("sort", run_key, st.button("Start Sort"), cache_key(sort_algo, data_array),
+                              scheduler.sort_trace, sort_algo, data_array)
 
-        def update_sort_visualization(arr, highlighted, swapped):
-            with placeholder.container():
-                sort_visualizer.visualize_sort(arr, highlighted, swapped)
+    sort_run = st.session_state.get('sort_run')
+    if sort_run and sort_run[0] == run_key:
+        _, steps, (time_complexity, space_complexity) = sort_run
 
-        if sort_algo == "Bubble Sort":
-            time_complexity, space_complexity = sorting.bubble_sort(list(data_array), update_sort_visualization)
-        elif sort_algo == "Insertion Sort":
-            time_complexity, space_complexity = sorting.insertion_sort(list(data_array), update_sort_visualization)
-        elif sort_algo == "Selection Sort":
-            time_complexity, space_complexity = sorting.selection_sort(list(data_array), update_sort_visualization)
-        elif sort_algo == "Merge Sort":
-            time_complexity, space_complexity = sorting.merge_sort(list(data_array), update_sort_visualization)
-        elif sort_algo == "Quick Sort":
-            time_complexity, space_complexity = sorting.quick_sort(list(data_array), update_sort_visualization)
+        renderer = cached_renderer("sort", run_key, lambda: registry.load("visualizer", "Array")(data_array))
+        replay_trace(steps, lambda step: renderer.render(step.state, step.highlighted, step.marked), "sort", autoplay)
 
         st.success("Array Sorted!")
         st.info(f"Time Complexity: {time_complexity}, Space Complexity: {space_complexity}")
+        if show_growth:
+            show_measured_growth("sort", sort_algo, time_complexity, sort_entry.options.get("growth_metric", "comparisons"))
         st.subheader("Explanation:")
-        if sort_algo == "Bubble Sort":
-            st.write("Bubble sort repeatedly steps through the list, compares adjacent elements and swaps them if they are in the wrong order.")
-        elif sort_algo == "Insertion Sort":
-            st.write("Insertion sort builds the final sorted array one item at a time.")
-        elif sort_algo == "Selection Sort":
-            st.write("Selection sort repeatedly finds the minimum element from the unsorted part and puts it at the beginning.")
-        elif sort_algo == "Merge Sort":
-            st.write("Merge sort is a divide-and-conquer algorithm that divides the array into halves, recursively sorts them, and then merges the sorted halves.")
-        elif sort_algo == "Quick Sort":
-            st.write("Quick sort is also a divide-and-conquer algorithm that picks an element as pivot and partitions the array around the pivot.")
-
-elif algorithm_type == "Tree Traversal":
+        st.write(sort_entry.explanation)
+
+
+def sorting_race_page():
+    st.sidebar.subheader("Sorting Race Options")
+    data_array = array_input("5,1,4,2,8")
+    st.subheader("Unsorted Array")
+    st.write(data_array)
+    show_race(data_array)
+    st.subheader("Explanation:")
+    st.write("Every sort runs on its own copy of the input as a job in the background worker pool, under the same "
+             "budgets as any other job. Live counts come from shared memory; once all have finished, the recorded "
+             "traces replay side by side on one step counter.")
+
+
+def tree_traversal_page():
     st.sidebar.subheader("Tree Traversal Options")
-    traversal_algo = st.sidebar.selectbox(
-        "Select Traversal Algorithm",
-        ["Inorder", "Preorder", "Postorder", "Level Order"]
-    )
+    traversal_algo = st.sidebar.selectbox("Select Traversal Algorithm", registry.names("traversal"))
+    show_complexity_caption("traversal", traversal_algo)
+    traversal_entry = registry.entry("traversal", traversal_algo)
     tree_input = st.sidebar.text_area("Enter comma-separated numbers for BST nodes:", "8,3,10,1,6,14,4,7,13", height=50)
+    compact_tree = st.sidebar.checkbox("Compact balanced tree (large inputs)")
     try:
         bst_nodes = [int(x.strip()) for x in tree_input.split(',')]
-        root = tree_traversal.build_bst(bst_nodes)
+        if compact_tree:
+            root = trace_cache.get_or_compute(cache_key("build_balanced_bst", bst_nodes),
+                                              lambda: tree_traversal.build_balanced_bst(bst_nodes))
+        else:
+            root = trace_cache.get_or_compute(cache_key("build_bst", bst_nodes), lambda: tree_traversal.build_bst(bst_nodes))
     except ValueError:
         st.sidebar.error("Invalid input. Please enter comma-separated numbers.")
         st.stop()
@@ -130,39 +475,33 @@ elif algorithm_type == "Tree Traversal":
     tree_visualizer.visualize_tree(root)
     st.write("Tree Nodes:", sorted(bst_nodes))
 
-    if st.button("Start Traversal"):
-        placeholder = st.empty()
-
-        def update_traversal_visualization(current_node, visited, time_complexity=None, space_complexity=None):
-            with placeholder.container():
-                tree_visualizer.visualize_tree(root, highlighted_nodes=[current_node])
-                st.write("Traversal Order:", visited)
-                if time_complexity and space_complexity:
-                    st.info(f"Time Complexity: {time_complexity}, Space Complexity: {space_complexity}")
-                time.sleep(0.5)
-
-        if traversal_algo == "Inorder":
-            tree_traversal.inorder_traversal(root, update_traversal_visualization)
-        elif traversal_algo == "Preorder":
-            tree_traversal.preorder_traversal(root, update_traversal_visualization)
-        elif traversal_algo == "Postorder":
-            tree_traversal.postorder_traversal(root, update_traversal_visualization)
-        elif traversal_algo == "Level Order":
-            time_complexity, space_complexity = tree_traversal.level_order_traversal(root, update_traversal_visualization)
-            st.info(f"Time Complexity: {time_complexity}, Space Complexity: {space_complexity}")
+    run_key = (traversal_algo, tuple(bst_nodes), compact_tree)
+    autoplay = st.button("Start Traversal")
+    if autoplay:
+        # Traversal events are pulled lazily, so only the steps actually shown
+        # (or skipped to) are ever computed.
+        steps = trace.VisitTrace(registry.load("traversal", traversal_algo)(root), total=len(bst_nodes))
+        st.session_state['traversal_run'] = (run_key, steps, (traversal_entry.time_complexity, traversal_entry.space_complexity))
+
+    traversal_run = st.session_state.get('traversal_run')
+    if traversal_run and traversal_run[0] == run_key:
+        _, steps, complexity = traversal_run
+
+        renderer = cached_renderer("traversal", run_key, lambda: registry.load("visualizer", "Tree")(root))
 
+        def render_traversal_step(step):
+            renderer.render(step.highlighted)
+            st.write("Traversal Order:", list(step.state))
+
+        replay_trace(steps, render_traversal_step, "traversal", autoplay)
+
+        st.info(f"Time Complexity: {complexity[0]}, Space Complexity: {complexity[1]}")
         st.success("Traversal Complete!")
         st.subheader("Explanation:")
-        if traversal_algo == "Inorder":
-            st.write("Inorder traversal visits the left subtree, then the root, then the right subtree.")
-        elif traversal_algo == "Preorder":
-            st.write("Preorder traversal visits the root, then the left subtree, then the right subtree.")
-        elif traversal_algo == "Postorder":
-            st.write("Postorder traversal visits the left subtree, then the right subtree, then the root.")
-        elif traversal_algo == "Level Order":
-            st.write("Level order traversal visits nodes level by level, from left to right.")
-
-elif algorithm_type == "List Operations":
+        st.write(traversal_entry.explanation)
+
+
+def list_operations_page():
     st.subheader("Linked List Operations")
     list_operations_type = st.selectbox(
         "Select Operation",
@@ -170,9 +509,10 @@ elif algorithm_type == "List Operations":
          "Delete at Beginning", "Delete at End", "Delete at Position"]
     )
     list_input = st.text_area("Enter comma-separated numbers for the linked list:", "1,2,3,4,5", height=50)
+    compact_list = st.checkbox("Store nodes in a compact pool (large lists)")
     try:
         list_data_initial = [int(x.strip()) for x in list_input.split(',')]
-        head = list_operations.create_linked_list(list_data_initial)
+        head = list_operations.create_linked_list(list_data_initial, compact=compact_list)
     except ValueError:
         st.error("Invalid input. Please enter comma-separated numbers.")
         st.stop()
@@ -204,13 +544,10 @@ elif algorithm_type == "List Operations":
     elif list_operations_type == "Insert at Position":
         value_to_insert = st.number_input("Value to insert:", value=7)
         position_to_insert = st.number_input("Position to insert at (0-indexed):", value=2, min_value=0)
-        placeholder = st.empty()
         if st.button("Insert"):
-            def update_list_visualization(data_tuple):
-                with placeholder.container():
-                    list_visualizer.visualize_list(data_tuple[0], data_tuple[1], data_tuple[2])
-                    time.sleep(0.5)
-            result = list_operations.insert_at_position(head, value_to_insert, position_to_insert, update_list_visualization)
+            recorder = trace.TraceRecorder()
+            result = list_operations.insert_at_position(head, value_to_insert, position_to_insert, recorder.list_callback)
+            replay_trace(recorder.steps, lambda step: list_visualizer.visualize_list(list(step.state), step.highlighted, step.marked), "list", True)
             if isinstance(result, tuple) and len(result) >= 3:
                 head, time_complexity, space_complexity = result[:3]
                 message = result[3] if len(result) > 3 else None
@@ -246,13 +583,10 @@ elif algorithm_type == "List Operations":
             st.write("Deleting at the end requires traversing to the second-to-last node and removing the last node.")
     elif list_operations_type == "Delete at Position":
         position_to_delete = st.number_input("Position to delete at (0-indexed):", value=1, min_value=0)
-        placeholder = st.empty()
         if st.button("Delete"):
-            def update_list_visualization(data_tuple):
-                with placeholder.container():
-                    list_visualizer.visualize_list(data_tuple[0], data_tuple[1], data_tuple[2])
-                    time.sleep(0.5)
-            result = list_operations.delete_at_position(head, position_to_delete, update_list_visualization)
+            recorder = trace.TraceRecorder()
+            result = list_operations.delete_at_position(head, position_to_delete, recorder.list_callback)
+            replay_trace(recorder.steps, lambda step: list_visualizer.visualize_list(list(step.state), step.highlighted, step.marked), "list", True)
             if isinstance(result, tuple) and len(result) >= 3:
                 head, time_complexity, space_complexity = result[:3]
                 message = result[3] if len(result) > 3 else None
@@ -269,86 +603,209 @@ elif algorithm_type == "List Operations":
             st.subheader("Explanation:")
             st.write("Deleting at a specific position involves traversing to that position and updating the links to bypass the node to be deleted.")
 
-elif algorithm_type == "Stack Operations":
+
+def stack_operations_page():
     st.subheader("Stack Operations")
-    operation_type = st.selectbox("Select Operation", ["Push", "Pop", "Peek", "Is Empty", "Size"])
-    if 'stack_data' not in st.session_state:
-        st.session_state['stack_data'] = []
+    operation_type = st.selectbox("Select Operation", ["Push", "Push Many", "Pop", "Pop Many", "Peek", "Is Empty", "Size", "Undo", "History"])
+    # One engine lives in the session; each operation appends to its log
+    # instead of rewriting a list in session_state.
+    if 'stack_engine' not in st.session_state:
+        st.session_state['stack_engine'] = stack_operations.ArrayStack()
+    engine = st.session_state['stack_engine']
+
+    def show_stack(operation, item, time_complexity, space_complexity):
+        stack_visualizer.display_stack_operation(operation, engine.top(STACK_DISPLAY_LIMIT), item, time_complexity, space_complexity, size=engine.size())
 
     if operation_type == "Push":
         value_to_push = st.number_input("Value to push:", value=1)
         if st.button("Push"):
-            st.session_state['stack_data'], time_complexity, space_complexity = stack_operations.Stack().push(st.session_state['stack_data'], value_to_push)
-            stack_visualizer.display_stack_operation("Push", st.session_state['stack_data'], value_to_push, time_complexity, space_complexity)
+            time_complexity, space_complexity = engine.push(value_to_push)
+            show_stack("Push", value_to_push, time_complexity, space_complexity)
             st.subheader("Explanation:")
             st.write("Push adds an element to the top of the stack.")
+    elif operation_type == "Push Many":
+        values_input = st.text_input("Values to push (comma-separated):", "1, 2, 3")
+        if st.button("Push Many"):
+            try:
+                values = [int(x.strip()) for x in values_input.split(",") if x.strip()]
+            except ValueError:
+                st.error("Invalid input. Please enter comma-separated numbers.")
+                st.stop()
+            time_complexity, space_complexity = engine.push_many(values)
+            show_stack("Push Many", len(values), time_complexity, space_complexity)
+            st.subheader("Explanation:")
+            st.write("Push Many copies k elements onto the top of the stack in one step.")
     elif operation_type == "Pop":
         if st.button("Pop"):
-            current_stack = stack_operations.Stack()
-            current_stack.items = list(st.session_state['stack_data'])
-            popped_list, popped_item, time_complexity, space_complexity = current_stack.pop()
-            st.session_state['stack_data'] = popped_list
-            stack_visualizer.display_stack_operation("Pop", st.session_state['stack_data'], popped_item, time_complexity, space_complexity)
+            popped_item, time_complexity, space_complexity = engine.pop()
+            show_stack("Pop", popped_item, time_complexity, space_complexity)
             st.subheader("Explanation:")
             st.write("Pop removes and returns the element at the top of the stack.")
+    elif operation_type == "Pop Many":
+        count = st.number_input("Number of elements to pop:", min_value=1, value=2)
+        if st.button("Pop Many"):
+            popped_items, time_complexity, space_complexity = engine.pop_many(int(count))
+            show_stack("Pop Many", popped_items, time_complexity, space_complexity)
+            st.subheader("Explanation:")
+            st.write("Pop Many removes up to k elements from the top, returning them top first.")
     elif operation_type == "Peek":
-        if st.session_state['stack_data']:
-            peeked_item, time_complexity, space_complexity = stack_operations.Stack().peek(st.session_state['stack_data'])
-            stack_visualizer.display_stack_operation("Peek", st.session_state['stack_data'], peeked_item, time_complexity, space_complexity)
+        if not engine.is_empty():
+            peeked_item, time_complexity, space_complexity = engine.peek()
+            show_stack("Peek", peeked_item, time_complexity, space_complexity)
             st.subheader("Explanation:")
             st.write("Peek returns the element at the top of the stack without removing it.")
         else:
             stack_visualizer.display_stack_operation("Peek", [], None, "O(1)", "O(1)")
             st.info("Stack is empty.")
     elif operation_type == "Is Empty":
-        is_empty, time_complexity, space_complexity = stack_operations.Stack().is_empty(st.session_state['stack_data']), "O(1)", "O(1)"
-        stack_visualizer.display_stack_operation("Is Empty", st.session_state['stack_data'], is_empty, time_complexity, space_complexity)
+        show_stack("Is Empty", engine.is_empty(), "O(1)", "O(1)")
         st.subheader("Explanation:")
         st.write("Is Empty checks if the stack contains any elements.")
     elif operation_type == "Size":
-        size, time_complexity, space_complexity = stack_operations.Stack().size(st.session_state['stack_data']), "O(1)", "O(1)"
-        stack_visualizer.display_stack_operation("Size", st.session_state['stack_data'], size, time_complexity, space_complexity)
+        show_stack("Size", engine.size(), "O(1)", "O(1)")
         st.subheader("Explanation:")
         st.write("Size returns the number of elements in the stack.")
+    elif operation_type == "Undo":
+        if st.button("Undo"):
+            undone = engine.undo()
+            show_stack("Undo", undone, "O(k)", "O(1)")
+            if undone is None:
+                st.info("Nothing to undo.")
+            st.subheader("Explanation:")
+            st.write("Undo reverts the last logged operation using the values recorded in the log.")
+    elif operation_type == "History":
+        if engine.log_length:
+            position = st.slider("Operations applied", 0, engine.log_length, engine.log_length)
+            state = engine.state_at(position)
+            stack_visualizer.display_stack_operation(f"{position} of {engine.log_length} operations", state[-STACK_DISPLAY_LIMIT:],
+                                                     None, "O(m)", "O(n)", size=len(state))
+            if position:
+                kind, values = engine.history(position - 1, position)[0]
+                st.write(f"Operation {position}: {kind} {values}")
+            st.subheader("Explanation:")
+            st.write("The state at any earlier point is rebuilt from the operation log, from whichever end is closer.")
+        else:
+            st.info("No operations yet.")
+
 
-elif algorithm_type == "Queue Operations":
+def queue_operations_page():
     st.subheader("Queue Operations")
-    operation_type = st.selectbox("Select Operation", ["Enqueue", "Dequeue", "Peek", "Is Empty", "Size"])
-    if 'queue_data' not in st.session_state:
-        st.session_state['queue_data'] = []
+    backend = st.selectbox("Queue backend", registry.names("queue"))
+    st.caption(registry.entry("queue", backend).explanation)
+    operation_type = st.selectbox("Select Operation", ["Enqueue", "Enqueue Many", "Dequeue", "Dequeue Many", "Peek", "Is Empty", "Size"])
+    # One engine lives in the session; switching backend carries the items over.
+    engine = st.session_state.get('queue_engine')
+    engine_class = registry.load("queue", backend)
+    if not isinstance(engine, engine_class):
+        engine = engine_class(engine.to_list() if engine is not None else ())
+        st.session_state['queue_engine'] = engine
+
+    def show_queue(operation, item, time_complexity, space_complexity):
+        queue_visualizer.display_queue_operation(operation, engine.to_list(QUEUE_DISPLAY_LIMIT), item, time_complexity, space_complexity, size=engine.size())
 
     if operation_type == "Enqueue":
         value_to_enqueue = st.number_input("Value to enqueue:", value=1)
         if st.button("Enqueue"):
-            st.session_state['queue_data'], time_complexity, space_complexity = queue_operations.Queue().enqueue(st.session_state['queue_data'], value_to_enqueue)
-            queue_visualizer.display_queue_operation("Enqueue", st.session_state['queue_data'], value_to_enqueue, time_complexity, space_complexity)
+            time_complexity, space_complexity = engine.enqueue(value_to_enqueue)
+            show_queue("Enqueue", value_to_enqueue, time_complexity, space_complexity)
             st.subheader("Explanation:")
             st.write("Enqueue adds an element to the rear of the queue.")
+    elif operation_type == "Enqueue Many":
+        values_input = st.text_input("Values to enqueue (comma-separated):", "1, 2, 3")
+        if st.button("Enqueue Many"):
+            try:
+                values = [int(x.strip()) for x in values_input.split(",") if x.strip()]
+            except ValueError:
+                st.error("Invalid input. Please enter comma-separated numbers.")
+                st.stop()
+            time_complexity, space_complexity = engine.enqueue_many(values)
+            show_queue("Enqueue Many", len(values), time_complexity, space_complexity)
+            st.subheader("Explanation:")
+            st.write("Enqueue Many appends k elements to the rear in one bulk copy.")
     elif operation_type == "Dequeue":
         if st.button("Dequeue"):
-            current_queue = queue_operations.Queue()
-            current_queue.items = list(st.session_state['queue_data'])
-            dequeued_list, dequeued_item, time_complexity, space_complexity = current_queue.dequeue()
-            st.session_state['queue_data'] = dequeued_list
-            queue_visualizer.display_queue_operation("Dequeue", st.session_state['queue_data'], dequeued_item, time_complexity, space_complexity)
+            dequeued_item, time_complexity, space_complexity = engine.dequeue()
+            show_queue("Dequeue", dequeued_item, time_complexity, space_complexity)
             st.subheader("Explanation:")
             st.write("Dequeue removes and returns the element at the front of the queue.")
+    elif operation_type == "Dequeue Many":
+        count = st.number_input("Number of elements to dequeue:", min_value=1, value=2)
+        if st.button("Dequeue Many"):
+            dequeued_items, time_complexity, space_complexity = engine.dequeue_many(int(count))
+            show_queue("Dequeue Many", dequeued_items, time_complexity, space_complexity)
+            st.subheader("Explanation:")
+            st.write("Dequeue Many removes up to k elements from the front in one call.")
     elif operation_type == "Peek":
-        if st.session_state['queue_data']:
-            peeked_item, time_complexity, space_complexity = queue_operations.Queue().peek(st.session_state['queue_data'])
-            queue_visualizer.display_queue_operation("Peek", st.session_state['queue_data'], peeked_item, time_complexity, space_complexity)
+        if not engine.is_empty():
+            peeked_item, time_complexity, space_complexity = engine.peek()
+            show_queue("Peek", peeked_item, time_complexity, space_complexity)
             st.subheader("Explanation:")
             st.write("Peek returns the element at the front of the queue without removing it.")
         else:
             queue_visualizer.display_queue_operation("Peek", [], None, "O(1)", "O(1)")
             st.info("Queue is empty.")
     elif operation_type == "Is Empty":
-        is_empty, time_complexity, space_complexity = queue_operations.Queue().is_empty(st.session_state['queue_data']), "O(1)", "O(1)"
-        queue_visualizer.display_queue_operation("Is Empty", st.session_state['queue_data'], is_empty, time_complexity, space_complexity)
+        show_queue("Is Empty", engine.is_empty(), "O(1)", "O(1)")
         st.subheader("Explanation:")
         st.write("Is Empty checks if the queue contains any elements.")
     elif operation_type == "Size":
-        size, time_complexity, space_complexity = queue_operations.Queue().size(st.session_state['queue_data']), "O(1)", "O(1)"
-        queue_visualizer.display_queue_operation("Size", st.session_state['queue_data'], size, time_complexity, space_complexity)
+        show_queue("Size", engine.size(), "O(1)", "O(1)")
         st.subheader("Explanation:")
-        st.write("Size returns the number of elements in the queue.")
\ No newline at end of file
+        st.write("Size returns the number of elements in the queue.")
+
+
+# Pages are looked up by name, so adding one is a function and an entry here.
+PAGES = {
+    "Searching": searching_page,
+    "Sorting": sorting_page,
+    "Sorting Race": sorting_race_page,
+    "Tree Traversal": tree_traversal_page,
+    "List Operations": list_operations_page,
+    "Stack Operations": stack_operations_page,
+    "Queue Operations": queue_operations_page,
+}
+
+algorithm_type = st.sidebar.selectbox("Select Operation Type", list(PAGES))
+PAGES[algorithm_type]()
+
+if algorithm_type != "Sorting Race":
+    # Leaving the race page stops any race still running.
+    cancel_race()
+
+cache_stats = trace_cache.stats()
+st.sidebar.subheader("Trace Cache")
+st.sidebar.caption(
+    f"Hits: {cache_stats['hits']} (disk: {cache_stats['disk_hits']}) | Misses: {cache_stats['misses']} | "
+    f"Entries: {cache_stats['entries']} | {cache_stats['bytes'] / 1024:.1f} / {cache_stats['max_bytes'] / 1024 / 1024:.0f} MiB"
+    + (f" | Disk: {cache_stats['disk_bytes'] / 1024 / 1024:.1f} / {cache_stats['max_disk_bytes'] / 1024 / 1024:.0f} MiB"
+       if os.environ.get("DSA_VISUALIZER_CACHE_PATH") else "")
+)
+
+job_stats = job_scheduler.metrics()
+session_cpu, session_steps = job_scheduler.session_usage(session_id())
+st.sidebar.subheader("Background Jobs")
+st.sidebar.caption(
+    f"Running: {job_stats['running']} / {job_stats['workers']} | Queued: {job_stats['queued']} "
+    f"({job_stats['sessions_waiting']} sessions) | Done: {job_stats['completed']} | Over budget: {job_stats['over_budget']} | "
+    f"Rejected: {job_stats['rejected']} | Failed: {job_stats['failed']} | "
+    f"Prefetches skipped: {job_stats['prefetch_refused']}, superseded: {job_stats['superseded']} | "
+    f"Wait p50/p95: {job_stats['wait_p50'] * 1000:.0f} / {job_stats['wait_p95'] * 1000:.0f} ms | "
+    f"Run p50/p95: {job_stats['run_p50'] * 1000:.0f} / {job_stats['run_p95'] * 1000:.0f} ms | "
+    f"This session: {session_cpu:.2f} s CPU, {session_steps:,} steps"
+)
+
+with st.sidebar.expander("Debug: imports and timing"):
+    # Imports made through the registry by this server process, heaviest
+    # first; "modules" counts everything each one pulled into sys.modules.
+    imports = sorted(registry.import_log(), key=lambda record: record.seconds, reverse=True)
+    if imports:
+        st.table({
+            "Module": [record.module for record in imports],
+            "Time (ms)": [f"{record.seconds * 1000:.1f}" for record in imports],
+            "Modules": [record.modules for record in imports],
+            "Packages": [", ".join(record.packages[:5]) + (" …" if len(record.packages) > 5 else "") for record in imports],
+        })
+    else:
+        st.caption("No lazy imports yet.")
+    st.caption(f"Script run: {(time.perf_counter() - SCRIPT_START) * 1000:.1f} ms | "
+               f"Loaded: {', '.join(name for name in ('numpy', 'pandas', 'altair') if name in sys.modules) or 'no heavy packages'}")
@@ -0,0 +1,448 @@
+# dsa_visualizer/bench.py
+# Headless benchmarks for the algorithms package.
+#
+#   python -m bench --sizes 10,100,1000 --format csv --output results.csv
+#   python -m bench --output baseline.json
+#   python -m bench --baseline baseline.json --tolerance 1.25
+#   python -m bench --batch --batch-size 1000000 --batch-targets 100000
+#   python -m bench --queue --queue-ops 1000000
+#   python -m bench --only stack,queue --sizes 1000,100000
+#   python -m bench --only sort --sizes 1000,100000 --fastest sort
+import argparse
+import csv
+import json
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from collections import namedtuple
+
+import numpy as np
+
+from algorithms import list_operations, queue_operations, searching, sorting, stack_operations, tree_traversal
+from algorithms.instrument import NULL_COUNTER, Counter
+
+SIZES = [10, 100, 1_000, 10_000, 100_000, 1_000_000]
+DISTRIBUTIONS = ["random", "sorted", "reversed", "few_unique"]
+FIELDS = ["category", "name", "distribution", "size", "wall_time", "comparisons", "swaps", "visits", "allocations",
+          "peak_memory"]
+QUADRATIC_LIMIT = 2_000
+LINEAR_BATCH_LIMIT = 256
+LOOP_SAMPLE = 10_000
+REPEAT = 5
+SAMPLE_TIME = 0.02
+MAX_CALLS = 10_000
+
+# prepare(data) returns the positional arguments for run, minus the callback.
+# Sizes above max_size are skipped.
+BenchCase = namedtuple("BenchCase", ["category", "name", "prepare", "run", "max_size"])
+
+
+def make_input(distribution, n, seed=0):
+    rng = random.Random(seed)
+    if distribution == "random":
+        return [rng.randrange(n * 10 + 1) for _ in range(n)]
+    if distribution == "sorted":
+        return list(range(n))
+    if distribution == "reversed":
+        return list(range(n, 0, -1))
+    if distribution == "few_unique":
+        return [rng.randrange(8) for _ in range(n)]
+    raise ValueError(f"Unknown distribution: {distribution}")
+
+
+def _noop(*args):
+    pass
+
+
+def _skewed_tree(data):
+    # The chain build_bst produces from sorted input, built in O(n).
+    root = None
+    for value in sorted(data, reverse=True):
+        node = tree_traversal.TreeNode(value)
+        node.right = root
+        root = node
+    return (root,)
+
+
+def _morris_inorder(root, callback, counter=NULL_COUNTER):
+    for _ in tree_traversal.morris_inorder(root, counter):
+        pass
+
+
+def _call_each(method, values, callback, counter=NULL_COUNTER):
+    # One call per value on a bound engine method (push, enqueue).
+    for value in values:
+        method(value)
+
+
+def _call_times(method, count, callback, counter=NULL_COUNTER):
+    for _ in range(count):
+        method()
+
+
+def _engine_cases(category, label, make, add, add_many, remove, remove_many):
+    # The four operations of a stack or queue engine over n values. The add
+    # rows start from an empty engine, the remove rows from one holding data.
+    return [
+        BenchCase(category, f"{label} {add}", lambda data: (getattr(make(), add), data), _call_each, None),
+        BenchCase(category, f"{label} {add_many}", lambda data: (getattr(make(), add_many), data),
+                  lambda method, values, callback, counter=None: method(values), None),
+        BenchCase(category, f"{label} {remove}", lambda data: (getattr(make(data), remove), len(data)),
+                  _call_times, None),
+        BenchCase(category, f"{label} {remove_many}", lambda data: (getattr(make(data), remove_many), len(data)),
+                  lambda method, count, callback, counter=None: method(count), None),
+    ]
+
+
+def _search_args(data, needs_sorted):
+    arr = sorted(data) if needs_sorted else list(data)
+    return arr, arr[len(arr) // 3] if arr else 0
+
+
+CASES = [
+    BenchCase("search", "Linear Search", lambda data: _search_args(data, False), searching.linear_search, None),
+    BenchCase("search", "Binary Search", lambda data: _search_args(data, True), searching.binary_search, None),
+    BenchCase("search", "Jump Search", lambda data: _search_args(data, True), searching.jump_search, None),
+    BenchCase("sort", "Bubble Sort", lambda data: (list(data),), sorting.bubble_sort, QUADRATIC_LIMIT),
+    BenchCase("sort", "Insertion Sort", lambda data: (list(data),), sorting.insertion_sort, QUADRATIC_LIMIT),
+    BenchCase("sort", "Selection Sort", lambda data: (list(data),), sorting.selection_sort, QUADRATIC_LIMIT),
+    BenchCase("sort", "Merge Sort", lambda data: (list(data),), sorting.merge_sort, None),
+    # Last-element pivot: sorted and reversed inputs are quadratic.
+    BenchCase("sort", "Quick Sort", lambda data: (list(data),), sorting.quick_sort, QUADRATIC_LIMIT),
+    BenchCase("sort", "Intro Sort", lambda data: (list(data),), sorting.intro_sort, None),
+    BenchCase("sort", "Tim Sort", lambda data: (list(data),), sorting.tim_sort, None),
+    BenchCase("sort", "Radix Sort", lambda data: (list(data),), sorting.radix_sort, None),
+    BenchCase("sort", "Parallel Merge Sort", lambda data: (list(data),), sorting.parallel_merge_sort, None),
+    # Reference point: CPython's own list.sort.
+    BenchCase("sort", "list.sort", lambda data: (list(data),),
+              lambda arr, callback, counter=None: arr.sort(), None),
+    # Insertion-order BSTs degenerate into a chain on sorted input.
+    BenchCase("tree", "BST Build", lambda data: (data,),
+              lambda values, callback, counter=None: tree_traversal.build_bst(values), QUADRATIC_LIMIT),
+    BenchCase("tree", "Balanced BST Build (pool)", lambda data: (data,),
+              lambda values, callback, counter=None: tree_traversal.build_balanced_bst(values), None),
+    BenchCase("tree", "Inorder", lambda data: (tree_traversal.build_balanced_bst(data),),
+              tree_traversal.inorder_traversal, None),
+    BenchCase("tree", "Preorder", lambda data: (tree_traversal.build_balanced_bst(data),),
+              tree_traversal.preorder_traversal, None),
+    BenchCase("tree", "Postorder", lambda data: (tree_traversal.build_balanced_bst(data),),
+              tree_traversal.postorder_traversal, None),
+    BenchCase("tree", "Level Order", lambda data: (tree_traversal.build_balanced_bst(data),),
+              tree_traversal.level_order_traversal, None),
+    BenchCase("tree", "Inorder (skewed)", _skewed_tree, tree_traversal.inorder_traversal, None),
+    BenchCase("tree", "Morris Inorder (skewed)", _skewed_tree, _morris_inorder, None),
+    BenchCase("list", "Insert at Position", lambda data: (list_operations.create_linked_list(data), -1, len(data) // 2),
+              list_operations.insert_at_position, None),
+    BenchCase("list", "Insert at Position (pool)",
+              lambda data: (list_operations.create_linked_list(data, compact=True), -1, len(data) // 2),
+              list_operations.insert_at_position, None),
+    BenchCase("list", "Delete at Position", lambda data: (list_operations.create_linked_list(data), len(data) // 2),
+              list_operations.delete_at_position, None),
+    BenchCase("list", "Delete at Position (pool)",
+              lambda data: (list_operations.create_linked_list(data, compact=True), len(data) // 2),
+              list_operations.delete_at_position, None),
+    *_engine_cases("stack", "ArrayStack", stack_operations.ArrayStack, "push", "push_many", "pop", "pop_many"),
+    *_engine_cases("queue", "Deque", queue_operations.DequeQueue,
+                   "enqueue", "enqueue_many", "dequeue", "dequeue_many"),
+    *_engine_cases("queue", "Ring Buffer", queue_operations.RingBufferQueue,
+                   "enqueue", "enqueue_many", "dequeue", "dequeue_many"),
+]
+
+
+def _sample(case, data, number):
+    # Mean time of one call over `number` calls; every call gets freshly
+    # prepared arguments, built before the clock starts.
+    args = [case.prepare(data) for _ in range(number)]
+    start = time.perf_counter()
+    for call_args in args:
+        case.run(*call_args, _noop)
+    return (time.perf_counter() - start) / number
+
+
+def _autorange(case, data):
+    # Like timeit's autorange: the smallest 1, 2, 5, 10, ... calls per sample
+    # that take at least SAMPLE_TIME, so fast cases are not timed in single
+    # microsecond-long calls dominated by timer noise.
+    number = 1
+    while True:
+        for multiple in (1, 2, 5):
+            per_call = _sample(case, data, number * multiple)
+            if per_call * number * multiple >= SAMPLE_TIME or number * multiple >= MAX_CALLS:
+                return number * multiple
+        number *= 10
+
+
+def run_case(case, data, repeat=REPEAT):
+    # wall_time is the median per-call time over `repeat` samples.
+    number = _autorange(case, data)
+    wall_time = statistics.median(_sample(case, data, number) for _ in range(repeat))
+
+    counter = Counter()
+    args = case.prepare(data)
+    tracemalloc.start()
+    try:
+        case.run(*args, _noop, counter=counter)
+        peak_memory = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return dict(counter.as_dict(), wall_time=wall_time, peak_memory=peak_memory)
+
+
+def run_benchmarks(cases=None, sizes=SIZES, distributions=DISTRIBUTIONS, repeat=REPEAT, seed=0, progress=None):
+    results = []
+    for case in cases or CASES:
+        for distribution in distributions:
+            for n in sizes:
+                if case.max_size is not None and n > case.max_size:
+                    continue
+                data = make_input(distribution, n, seed)
+                row = {"category": case.category, "name": case.name, "distribution": distribution, "size": n}
+                row.update(run_case(case, data, repeat))
+                results.append(row)
+                if progress:
+                    progress(row)
+    return results
+
+
+def _timed(fn, *args, **kwargs):
+    start = time.perf_counter()
+    fn(*args, **kwargs)
+    return time.perf_counter() - start
+
+
+def run_batch_benchmarks(size=1_000_000, n_targets=100_000, seed=0, progress=None):
+    # Scalar searches in a Python loop against searching.batch_search over the
+    # same strictly increasing array and targets. The loop runs over at most
+    # LOOP_SAMPLE targets and is scaled up to n_targets; linear search uses a
+    # much shorter array so the loop finishes in seconds.
+    rng = np.random.default_rng(seed)
+    full = np.cumsum(rng.integers(1, 20, size))
+    targets = rng.integers(0, int(full[-1]) + 1, n_targets)
+    sample = targets[:LOOP_SAMPLE].tolist()
+    variants = [
+        ("Linear Search", "linear", searching.linear_search, min(size, LINEAR_BATCH_LIMIT)),
+        ("Binary Search", "binary", searching.binary_search, size),
+        ("Jump Search", "jump", searching.jump_search, size),
+    ]
+    results = []
+    for name, method, scalar, n in variants:
+        arr = full[:n]
+        arr_list = arr.tolist()
+
+        def loop():
+            for target in sample:
+                scalar(arr_list, target, _noop)
+
+        loop_time = _timed(loop) * n_targets / len(sample)
+        timings = [(f"{name} (loop)", loop_time),
+                   (f"{name} (batched)", _timed(searching.batch_search, arr, targets, method))]
+        if method == "binary":
+            timings.append((f"{name} (batched, indices only)",
+                            _timed(searching.batch_search, arr, targets, method, count_probes=False)))
+        for label, wall_time in timings:
+            row = {"category": "batch_search", "name": label, "distribution": "random", "size": n,
+                   "targets": n_targets, "wall_time": wall_time, "speedup": loop_time / wall_time}
+            results.append(row)
+            if progress:
+                progress(row)
+    return results
+
+
+def _list_queue_ops(values, dequeues):
+    # The list path as the app used it: a fresh Queue per call, with the
+    # session list copied in for every dequeue.
+    items = []
+    for value in values:
+        items, _, _ = queue_operations.Queue().enqueue(items, value)
+    for value in dequeues:
+        items, _, _ = queue_operations.Queue().enqueue(items, value)
+        current = queue_operations.Queue()
+        current.items = list(items)
+        items, _, _, _ = current.dequeue()
+
+
+def _engine_queue_ops(make, values, dequeues):
+    queue = make()
+    enqueue, dequeue = queue.enqueue, queue.dequeue
+    for value in values:
+        enqueue(value)
+    for value in dequeues:
+        enqueue(value)
+        dequeue()
+
+
+def _engine_queue_bulk(make, values, dequeues, chunk):
+    queue = make()
+    queue.enqueue_many(values)
+    for start in range(0, len(dequeues), chunk):
+        block = dequeues[start:start + chunk]
+        queue.enqueue_many(block)
+        queue.dequeue_many(len(block))
+
+
+def run_queue_benchmarks(ops=1_000_000, queue_length=1_000, chunk=1_000, seed=0, progress=None):
+    # Steady-state throughput: fill the queue to queue_length, then alternate
+    # enqueue/dequeue until `ops` operations have run. The bulk rows move the
+    # same elements through enqueue_many/dequeue_many in blocks of `chunk`.
+    rng = random.Random(seed)
+    values = [rng.randrange(1_000_000) for _ in range(queue_length)]
+    dequeues = [rng.randrange(1_000_000) for _ in range(max(0, ops - queue_length) // 2)]
+    variants = [("List (copying)", lambda: _list_queue_ops(values, dequeues))]
+    for label, make in (("Deque", queue_operations.DequeQueue), ("Ring Buffer", queue_operations.RingBufferQueue)):
+        variants.append((label, lambda make=make: _engine_queue_ops(make, values, dequeues)))
+        variants.append((f"{label} (bulk)", lambda make=make: _engine_queue_bulk(make, values, dequeues, chunk)))
+    results = []
+    baseline = None
+    for label, run in variants:
+        wall_time = _timed(run)
+        baseline = baseline or wall_time
+        row = {"category": "queue", "name": label, "distribution": "random", "size": ops,
+               "queue_length": queue_length, "wall_time": wall_time, "ops_per_sec": ops / wall_time,
+               "speedup": baseline / wall_time}
+        results.append(row)
+        if progress:
+            progress(row)
+    return results
+
+
+def fastest(results, category="sort", exclude=("list.sort",)):
+    # The winner for each (distribution, size), with the runner-up for scale.
+    # Reference rows such as CPython's list.sort are left out of the ranking.
+    groups = {}
+    for row in results:
+        if row["category"] == category and row["name"] not in exclude:
+            groups.setdefault((row["distribution"], row["size"]), []).append(row)
+    summary = []
+    for (distribution, size), rows in sorted(groups.items()):
+        rows = sorted(rows, key=lambda row: row["wall_time"])
+        runner_up = rows[1] if len(rows) > 1 else None
+        summary.append({"distribution": distribution, "size": size, "name": rows[0]["name"],
+                        "wall_time": rows[0]["wall_time"],
+                        "runner_up": runner_up["name"] if runner_up else None,
+                        "margin": runner_up["wall_time"] / rows[0]["wall_time"] if runner_up else None})
+    return summary
+
+
+def compare_to_baseline(results, baseline, tolerance=1.25, min_time=2e-3):
+    # Rows faster than min_time in the baseline are too short to compare
+    # reliably against a fixed tolerance and are skipped.
+    previous = {(row["category"], row["name"], row["distribution"], row["size"]): row for row in baseline}
+    regressions = []
+    for row in results:
+        old = previous.get((row["category"], row["name"], row["distribution"], row["size"]))
+        if old is None or old["wall_time"] < min_time:
+            continue
+        ratio = row["wall_time"] / old["wall_time"]
+        if ratio > tolerance:
+            regressions.append(dict(row, baseline_wall_time=old["wall_time"], ratio=ratio))
+    return regressions
+
+
+def confirm_regressions(regressions, tolerance=1.25, repeat=REPEAT * 3, seed=0):
+    # Re-times each suspected regression with more samples and keeps it only
+    # if it is still over tolerance; a single noisy sample set is not enough
+    # to fail a run. Rows from the batch and queue modes are kept as they are.
+    cases = {(case.category, case.name): case for case in CASES}
+    confirmed = []
+    for row in regressions:
+        case = cases.get((row["category"], row["name"]))
+        if case is not None:
+            data = make_input(row["distribution"], row["size"], seed)
+            wall_time = run_case(case, data, repeat)["wall_time"]
+            row = dict(row, wall_time=wall_time, ratio=wall_time / row["baseline_wall_time"])
+        if row["ratio"] > tolerance:
+            confirmed.append(row)
+    return confirmed
+
+
+def write_results(results, stream, fmt="json"):
+    if fmt == "csv":
+        writer = csv.DictWriter(stream, fieldnames=FIELDS, extrasaction="ignore")
+        writer.writeheader()
+        writer.writerows(results)
+    else:
+        json.dump(results, stream, indent=2)
+        stream.write("\n")
+
+
+def _csv_list(value, convert=str):
+    return [convert(item.strip()) for item in value.split(',') if item.strip()]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the DSA visualizer algorithms without the UI.")
+    parser.add_argument("--sizes", type=lambda v: _csv_list(v, int), default=SIZES)
+    parser.add_argument("--distributions", type=_csv_list, default=DISTRIBUTIONS)
+    parser.add_argument("--only", type=_csv_list, default=None,
+                        help="comma-separated categories or algorithm names to run")
+    parser.add_argument("--repeat", type=int, default=REPEAT,
+                        help="timed samples per case; the median is reported")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--format", choices=["json", "csv"], default="json")
+    parser.add_argument("--output", help="write results here instead of stdout")
+    parser.add_argument("--baseline", help="JSON results from an earlier run to compare against")
+    parser.add_argument("--tolerance", type=float, default=1.25,
+                        help="slowdown ratio above which a result counts as a regression")
+    parser.add_argument("--min-time", type=float, default=2e-3,
+                        help="skip baseline rows faster than this many seconds")
+    parser.add_argument("--batch", action="store_true",
+                        help="compare batched NumPy searches against a Python loop of scalar searches")
+    parser.add_argument("--batch-size", type=int, default=1_000_000)
+    parser.add_argument("--batch-targets", type=int, default=100_000)
+    parser.add_argument("--queue", action="store_true",
+                        help="compare queue backends against the list path under a steady enqueue/dequeue load")
+    parser.add_argument("--queue-ops", type=int, default=1_000_000)
+    parser.add_argument("--queue-length", type=int, default=1_000)
+    parser.add_argument("--fastest", metavar="CATEGORY",
+                        help="also print the fastest algorithm per distribution and size in CATEGORY (e.g. sort)")
+    parser.add_argument("--quiet", action="store_true")
+    args = parser.parse_args(argv)
+
+    cases = CASES
+    if args.only:
+        cases = [case for case in CASES if case.category in args.only or case.name in args.only]
+
+    def progress(row):
+        speedup = f" {row['speedup']:8.1f}x" if "speedup" in row else ""
+        print(f"{row['name']:>36} {row['distribution']:>10} n={row['size']:<8} {row['wall_time'] * 1000:10.3f} ms{speedup}",
+              file=sys.stderr)
+
+    if args.batch:
+        results = run_batch_benchmarks(args.batch_size, args.batch_targets, args.seed,
+                                       None if args.quiet else progress)
+    elif args.queue:
+        results = run_queue_benchmarks(args.queue_ops, args.queue_length, seed=args.seed,
+                                       progress=None if args.quiet else progress)
+    else:
+        results = run_benchmarks(cases, args.sizes, args.distributions, args.repeat, args.seed,
+                                 None if args.quiet else progress)
+
+    if args.fastest:
+        for row in fastest(results, args.fastest):
+            margin = f"{row['margin']:.2f}x ahead of {row['runner_up']}" if row["runner_up"] else ""
+            print(f"FASTEST {row['distribution']:>10} n={row['size']:<8} {row['name']:>20} "
+                  f"{row['wall_time'] * 1000:10.3f} ms  {margin}", file=sys.stderr)
+
+    if args.output:
+        with open(args.output, "w", newline="") as stream:
+            write_results(results, stream, args.format)
+    else:
+        write_results(results, sys.stdout, args.format)
+
+    if args.baseline:
+        with open(args.baseline) as stream:
+            regressions = compare_to_baseline(results, json.load(stream), args.tolerance, args.min_time)
+        regressions = confirm_regressions(regressions, args.tolerance, args.repeat * 3, args.seed)
+        for row in regressions:
+            print(f"REGRESSION {row['name']} {row['distribution']} n={row['size']}: "
+                  f"{row['baseline_wall_time'] * 1000:.3f} ms -> {row['wall_time'] * 1000:.3f} ms ({row['ratio']:.2f}x)",
+                  file=sys.stderr)
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,149 @@
+# dsa_visualizer/cache.py
+import hashlib
+import pickle
+import sqlite3
+import threading
+from collections import OrderedDict
+
+
+def cache_key(algorithm, data, *params):
+    digest = hashlib.blake2b(digest_size=16)
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        digest.update(data)
+    elif hasattr(data, "tobytes"):
+        # The raw bytes alone are ambiguous: int32 [1, 0] and int64 [1] match.
+        dtype = getattr(data, "dtype", None)
+        digest.update((dtype.str if dtype is not None else getattr(data, "typecode", "")).encode())
+        digest.update(data.tobytes())
+    else:
+        digest.update(repr(list(data)).encode())
+    digest.update(repr(params).encode())
+    return f"{algorithm}:{digest.hexdigest()}"
+
+
+class TraceCache:
+    # Thread-safe LRU shared by every session of the app. Entries are charged
+    # their pickled size against max_bytes; with a path, every entry is also
+    # written to a SQLite file so a restarted server starts warm. The file
+    # holds at most max_disk_bytes of pickled values, dropping the oldest
+    # writes first; entries over max_bytes are stored in neither tier.
+    def __init__(self, max_bytes=64 * 1024 * 1024, path=None, max_disk_bytes=512 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.max_disk_bytes = max_disk_bytes
+        self.current_bytes = 0
+        self.disk_bytes = 0
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.disk_evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._db = None
+        if path:
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._db.execute("CREATE TABLE IF NOT EXISTS traces (key TEXT PRIMARY KEY, value BLOB)")
+            self._db.commit()
+            self.disk_bytes = self._db.execute("SELECT COALESCE(SUM(length(value)), 0) FROM traces").fetchone()[0]
+            with self._lock:
+                self._trim_disk()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def _remember(self, key, value, size):
+        if size > self.max_bytes:
+            return
+        if key in self._entries:
+            self.current_bytes -= self._entries.pop(key)[1]
+        self._entries[key] = (value, size)
+        self.current_bytes += size
+        while self.current_bytes > self.max_bytes:
+            _, (_, evicted_size) = self._entries.popitem(last=False)
+            self.current_bytes -= evicted_size
+            self.evictions += 1
+
+    def _store(self, key, payload):
+        # INSERT OR REPLACE gives the row a new rowid, so rowid order is
+        # write order and the trim below drops the oldest writes.
+        row = self._db.execute("SELECT length(value) FROM traces WHERE key = ?", (key,)).fetchone()
+        if row is not None:
+            self.disk_bytes -= row[0]
+        self._db.execute("INSERT OR REPLACE INTO traces (key, value) VALUES (?, ?)", (key, payload))
+        self.disk_bytes += len(payload)
+        self._trim_disk()
+        self._db.commit()
+
+    def _trim_disk(self):
+        while self.disk_bytes > self.max_disk_bytes:
+            row = self._db.execute("SELECT rowid, length(value) FROM traces ORDER BY rowid LIMIT 1").fetchone()
+            if row is None:
+                self.disk_bytes = 0
+                break
+            self._db.execute("DELETE FROM traces WHERE rowid = ?", (row[0],))
+            self.disk_bytes -= row[1]
+            self.disk_evictions += 1
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            if self._db is not None:
+                row = self._db.execute("SELECT value FROM traces WHERE key = ?", (key,)).fetchone()
+                if row is not None:
+                    value = pickle.loads(row[0])
+                    self._remember(key, value, len(row[0]))
+                    self.disk_hits += 1
+                    return value
+            self.misses += 1
+            return default
+
+    def put(self, key, value):
+        try:
+            payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, RecursionError, TypeError):
+            # Deeply nested node chains cannot be sized or stored; skip them.
+            return value
+        if len(payload) > self.max_bytes:
+            return value
+        with self._lock:
+            self._remember(key, value, len(payload))
+            if self._db is not None:
+                self._store(key, payload)
+        return value
+
+    def get_or_compute(self, key, compute):
+        missing = object()
+        value = self.get(key, missing)
+        if value is missing:
+            value = self.put(key, compute())
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+            self.disk_bytes = 0
+            if self._db is not None:
+                self._db.execute("DELETE FROM traces")
+                self._db.commit()
+
+    def stats(self):
+        return {
+            "entries": len(self._entries),
+            "bytes": self.current_bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "disk_bytes": self.disk_bytes,
+            "max_disk_bytes": self.max_disk_bytes,
+            "disk_evictions": self.disk_evictions,
+        }
@@ -0,0 +1,138 @@
+# dsa_visualizer/registry.py
+# Plugin registry. Every algorithm and visualizer is declared up front by
+# category, name and a "module:attribute" target, together with its complexity
+# and explanation text; the module itself is imported only when an entry is
+# first loaded, so a page never pays for another page's dependencies (the
+# array and tree renderers alone pull in altair and pandas). Imports made
+# through the registry are timed for the app's debug panel.
+#
+# Extra modules named in DSA_VISUALIZER_PLUGINS (comma-separated) are imported
+# at startup; they call register() to add or replace entries, and the pages
+# pick them up from names() without any other change.
+import importlib
+import os
+import sys
+import threading
+import time
+from collections import namedtuple
+
+Entry = namedtuple("Entry", ["category", "name", "target", "time_complexity", "space_complexity", "explanation", "options"])
+# seconds includes everything the module imported; modules counts the entries
+# it added to sys.modules and packages names their top-level packages.
+ImportRecord = namedtuple("ImportRecord", ["module", "seconds", "modules", "packages"])
+
+_entries = {}
+_imports = []
+_lock = threading.Lock()
+
+
+def register(category, name, target, time_complexity=None, space_complexity=None, explanation="", **options):
+    # Registering an existing name replaces it, keeping its position in names().
+    _entries.setdefault(category, {})[name] = Entry(category, name, target, time_complexity, space_complexity,
+                                                    explanation, options)
+
+
+def names(category):
+    return list(_entries.get(category, ()))
+
+
+def entry(category, name):
+    return _entries[category][name]
+
+
+def load_module(name):
+    # Always goes through import_module, which waits on the module's import
+    # lock, so a module another session's thread is still importing is never
+    # returned half-initialised. _lock is not held across the import itself:
+    # the imported module may load others through the registry.
+    if name in sys.modules:
+        return importlib.import_module(name)
+    with _lock:
+        before = set(sys.modules)
+    start = time.perf_counter()
+    module = importlib.import_module(name)
+    seconds = time.perf_counter() - start
+    with _lock:
+        added = set(sys.modules) - before
+        # A thread that lost the race finds the modules already recorded.
+        if added and not any(record.module == name for record in _imports):
+            _imports.append(ImportRecord(name, seconds, len(added), sorted({m.partition(".")[0] for m in added})))
+    return module
+
+
+def load(category, name):
+    module, _, attribute = entry(category, name).target.partition(":")
+    loaded = load_module(module)
+    return getattr(loaded, attribute) if attribute else loaded
+
+
+def import_log():
+    return list(_imports)
+
+
+class LazyModule:
+    # Stands in for a module at import time and imports it through
+    # load_module() on first attribute access.
+    def __init__(self, name):
+        self._name = name
+
+    def __getattr__(self, attribute):
+        return getattr(load_module(self._name), attribute)
+
+
+def load_plugins(modules):
+    for name in filter(None, (m.strip() for m in (modules or "").split(","))):
+        load_module(name)
+
+
+register("search", "Linear Search", "algorithms.searching:linear_search", "O(n)", "O(1)",
+         "Linear search iterates through each element of the array until the target is found or the end is reached.",
+         batch_method="linear")
+register("search", "Binary Search", "algorithms.searching:binary_search", "O(log n)", "O(1)",
+         "Binary search works on sorted arrays. It repeatedly divides the search interval in half.",
+         sorted_input=True, batch_method="binary")
+register("search", "Jump Search", "algorithms.searching:jump_search", "O(√n)", "O(1)",
+         "Jump search works on sorted arrays by jumping ahead by a fixed step and then performing a linear search.",
+         sorted_input=True, batch_method="jump")
+
+register("sort", "Bubble Sort", "algorithms.sorting:bubble_sort", "O(n²)", "O(1)",
+         "Bubble sort repeatedly steps through the list, compares adjacent elements and swaps them if they are in the wrong order.")
+register("sort", "Insertion Sort", "algorithms.sorting:insertion_sort", "O(n²)", "O(1)",
+         "Insertion sort builds the final sorted array one item at a time.")
+register("sort", "Selection Sort", "algorithms.sorting:selection_sort", "O(n²)", "O(1)",
+         "Selection sort repeatedly finds the minimum element from the unsorted part and puts it at the beginning.")
+register("sort", "Merge Sort", "algorithms.sorting:merge_sort", "O(n log n)", "O(n)",
+         "Merge sort is a divide-and-conquer algorithm that divides the array into halves, recursively sorts them, and then merges the sorted halves.")
+register("sort", "Quick Sort", "algorithms.sorting:quick_sort", "O(n log n)", "O(log n)",
+         "Quick sort is also a divide-and-conquer algorithm that picks an element as pivot and partitions the array around the pivot.")
+register("sort", "Intro Sort", "algorithms.sorting:intro_sort", "O(n log n)", "O(log n)",
+         "Introsort is quick sort with a median-of-three pivot that finishes small ranges with insertion sort and switches to heapsort if partitioning goes too deep.")
+register("sort", "Tim Sort", "algorithms.sorting:tim_sort", "O(n log n)", "O(n)",
+         "Tim sort finds runs that are already sorted, extends short ones with insertion sort, and merges them, galloping over long stretches taken from one side.")
+# Radix sort never compares elements; its growth is measured in values placed in buckets.
+register("sort", "Radix Sort", "algorithms.sorting:radix_sort", "O(d·(n + b))", "O(n + b)",
+         "LSD radix sort distributes the integers into 256 buckets by one byte at a time, starting from the least significant byte, without comparing elements.",
+         growth_metric="allocations")
+register("sort", "Parallel Merge Sort", "algorithms.sorting:parallel_merge_sort", "O(n log n / p + n)", "O(n)",
+         "Parallel merge sort sorts blocks of a shared-memory buffer in separate processes, then merges neighbouring blocks in parallel rounds. Small inputs are sorted in-process.")
+
+register("traversal", "Inorder", "algorithms.tree_traversal:iter_inorder", "O(n)", "O(h)",
+         "Inorder traversal visits the left subtree, then the root, then the right subtree.")
+register("traversal", "Preorder", "algorithms.tree_traversal:iter_preorder", "O(n)", "O(h)",
+         "Preorder traversal visits the root, then the left subtree, then the right subtree.")
+register("traversal", "Postorder", "algorithms.tree_traversal:iter_postorder", "O(n)", "O(h)",
+         "Postorder traversal visits the left subtree, then the right subtree, then the root.")
+register("traversal", "Level Order", "algorithms.tree_traversal:iter_level_order", "O(n)", "O(n)",
+         "Level order traversal visits nodes level by level, from left to right.")
+
+register("queue", "Deque", "algorithms.queue_operations:DequeQueue", "O(1)", "O(n)",
+         "A collections.deque: both ends are O(1) and bulk operations run in C.")
+register("queue", "Ring Buffer", "algorithms.queue_operations:RingBufferQueue", "O(1)", "O(n)",
+         "A typed circular buffer that wraps head and tail around a fixed array and grows by copying when full.")
+
+register("visualizer", "Array", "visualizations.renderer:ArrayRenderer",
+         explanation="Bar chart of the array with highlighted and marked cells; the chart spec is compiled once per run.")
+register("visualizer", "Tree", "visualizations.renderer:TreeRenderer",
+         explanation="Binary tree with a cached layout and a chart spec compiled once per tree.")
+
+load_plugins(os.environ.get("DSA_VISUALIZER_PLUGINS"))
@@ -0,0 +1,412 @@
+# dsa_visualizer/scheduler.py
+# Background computation shared by every session of the app: search and sort
+# traces, race lanes (algorithms/race.py), the measured-complexity counts and
+# batch lookups run here rather than in a Streamlit script thread. Tree
+# builds and traversals, the list, stack and queue operations and file
+# parsing still run in the script thread, outside these budgets. Jobs run
+# in a process pool with one worker per core, and at most `workers` jobs are
+# handed to the pool at a time; the rest wait in one FIFO per session, and the
+# next job always comes from the waiting session served least recently, so a
+# session queueing many jobs cannot starve the others.
+# Every job runs under its session's Budget: the worker counts trace steps,
+# CPU time and trace memory as it goes and stops with BudgetExceeded instead
+# of running unbounded. The CPU time and steps of every job, finished or not,
+# are charged to its session, and a session past its total is refused new
+# jobs. Finished traces are put into the shared TraceCache.
+#
+# Pages submit prefetch jobs on every rerun, so the trace for the current
+# configuration is usually ready before Start is pressed; a newer prefetch
+# from the same session drops its older ones that have not started yet, and
+# is refused while one of the session's prefetches is running. Keys whose job
+# failed are remembered, and submitting them again returns the same error
+# without running anything.
+import multiprocessing
+import os
+import random
+import threading
+import time
+import weakref
+from collections import OrderedDict, deque, namedtuple
+from concurrent.futures import CancelledError, Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import registry
+from algorithms import instrument
+from algorithms.trace import ArrayTrace, TraceRecorder
+
+# steps and cpu_seconds bound a single job, trace_bytes the trace it builds,
+# and pending how many jobs one session may have waiting at once;
+# session_steps and session_cpu_seconds bound all of a session's jobs together.
+Budget = namedtuple("Budget", ["steps", "cpu_seconds", "trace_bytes", "pending", "session_steps",
+                               "session_cpu_seconds"])
+DEFAULT_BUDGET = Budget(steps=2_000_000, cpu_seconds=10.0, trace_bytes=64 * 1024 * 1024, pending=4,
+                        session_steps=50_000_000, session_cpu_seconds=300.0)
+CHECK_EVERY = 1024
+LATENCY_HISTORY = 256
+SERVED_HISTORY = 1024
+FAILED_HISTORY = 1024
+
+
+class BudgetExceeded(Exception):
+    # cpu_seconds and steps are what the job had used when it was stopped.
+    def __init__(self, message, cpu_seconds=0.0, steps=0):
+        super().__init__(message)
+        self.cpu_seconds = cpu_seconds
+        self.steps = steps
+
+
+class JobRejected(Exception):
+    pass
+
+
+class BudgetedCallback:
+    # Wraps an update callback; counts every step and checks CPU time and
+    # trace size every CHECK_EVERY steps.
+    __slots__ = ("callback", "budget", "recorder", "steps", "_started")
+
+    def __init__(self, callback, budget, recorder=None):
+        self.callback = callback
+        self.budget = budget
+        self.recorder = recorder
+        self.steps = 0
+        self._started = time.thread_time()
+
+    def __call__(self, arr, highlighted, marked):
+        self.steps += 1
+        if self.steps > self.budget.steps:
+            self._stop(f"more than {self.budget.steps:,} steps")
+        if not self.steps % CHECK_EVERY:
+            if time.thread_time() - self._started > self.budget.cpu_seconds:
+                self._stop(f"more than {self.budget.cpu_seconds:g} s of CPU time")
+            if self.recorder is not None and self.recorder.nbytes > self.budget.trace_bytes:
+                self._stop(f"a trace larger than {self.budget.trace_bytes:,} bytes")
+        self.callback(arr, highlighted, marked)
+
+    def _stop(self, message):
+        raise BudgetExceeded(message, time.thread_time() - self._started, self.steps)
+
+
+# Job functions run in the worker processes, so they take registry names
+# rather than functions. They return (value, steps used), and the value must
+# be picklable.
+
+def sort_trace(name, values, budget=DEFAULT_BUDGET):
+    recorder = ArrayTrace(values, typecode='q')
+    callback = BudgetedCallback(recorder, budget, recorder)
+    outcome = registry.load("sort", name)(list(values), callback)
+    return (recorder, outcome), callback.steps
+
+
+def search_trace(name, values, target, budget=DEFAULT_BUDGET):
+    recorder = TraceRecorder()
+    callback = BudgetedCallback(recorder.array_callback, budget)
+    outcome = registry.load("search", name)(values, target, callback)
+    return (recorder.steps, outcome), callback.steps
+
+
+def _search_growth_input(n):
+    # Worst case: a target larger than every element.
+    return list(range(n)), n
+
+
+def _sort_growth_input(n):
+    return (random.Random(n).sample(range(n * 10), n),)
+
+
+GROWTH_INPUTS = {"search": _search_growth_input, "sort": _sort_growth_input}
+
+
+def _ignore(arr, highlighted, marked):
+    pass
+
+
+def growth_costs(category, name, sizes, metric, budget=DEFAULT_BUDGET):
+    # The measured-complexity chart: `metric` counted at each size.
+    callback = BudgetedCallback(_ignore, budget)
+    costs = instrument.measure_growth(registry.load(category, name), GROWTH_INPUTS[category], sizes, metric, callback)
+    return costs, callback.steps
+
+
+def batch_lookup(values, targets, method, budget=DEFAULT_BUDGET):
+    # One vectorised NumPy call, so it cannot be stopped part way; its CPU
+    # time is still charged to the session afterwards.
+    searching = registry.load_module("algorithms.searching")
+    return searching.batch_search(values, targets, method), 0
+
+
+def _execute(job, args, budget):
+    # Returns (value, cpu_seconds, steps). A failed job's exception carries
+    # the CPU time it used as cpu_seconds, so the session is still charged.
+    started = time.thread_time()
+    try:
+        value, steps = job(*args, budget=budget)
+    except Exception as error:
+        error.cpu_seconds = time.thread_time() - started
+        raise
+    return value, time.thread_time() - started, steps
+
+
+class Job:
+    __slots__ = ("key", "session", "function", "args", "budget", "prefetch", "cache", "future", "submitted_at",
+                 "started_at")
+
+    def __init__(self, key, session, function, args, budget, prefetch, cache):
+        self.key = key
+        self.session = session
+        self.function = function
+        self.args = args
+        self.budget = budget
+        self.prefetch = prefetch
+        self.cache = cache
+        self.future = Future()
+        self.submitted_at = time.perf_counter()
+        self.started_at = None
+
+
+def _percentile(values, fraction):
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(fraction * len(values)))]
+
+
+class JobScheduler:
+    def __init__(self, workers=None, max_queued=64, budget=DEFAULT_BUDGET, cache=None):
+        self.workers = workers or os.cpu_count() or 1
+        self.max_queued = max_queued
+        self.budget = budget
+        self.cache = cache
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.over_budget = 0
+        self.rejected = 0
+        self.prefetch_refused = 0
+        self.superseded = 0
+        self._executor = None
+        self._running = 0
+        self._jobs = {}
+        self._queues = {}
+        self._served = {}
+        self._dispatched = 0
+        self._prefetching = {}
+        self._failed = OrderedDict()
+        self._tracked = weakref.WeakSet()
+        # session -> [cpu_seconds, steps], least recently charged first.
+        self._usage = {}
+        self._waits = deque(maxlen=LATENCY_HISTORY)
+        self._runs = deque(maxlen=LATENCY_HISTORY)
+        # Re-entrant: a pool future that is already done runs its callback,
+        # which dispatches again, inside submit().
+        self._lock = threading.RLock()
+
+    def queued(self):
+        return sum(len(queue) for queue in self._queues.values())
+
+    def submit(self, session, key, function, *args, budget=None, prefetch=False, cache=True):
+        # Returns a Future for (value) of function(*args); with cache=False the
+        # value is not put into the trace cache. Jobs are shared by
+        # key: submitting a key that is already queued or running returns its
+        # future, and a key whose job failed returns an already failed one.
+        # Raises JobRejected when the session or the server is full, or the
+        # session has used up its budget. Pages drop refused prefetches
+        # silently, so those are counted apart from the refusals users see.
+        with self._lock:
+            job = self._jobs.get(key)
+            if job is not None:
+                job.prefetch = job.prefetch and prefetch
+                return job.future
+            failure = self._failed.get(key)
+            if failure is not None:
+                future = Future()
+                future.set_exception(failure)
+                return future
+            budget = budget or self.budget
+            cpu_seconds, steps = self._usage.get(session, (0.0, 0))
+            if cpu_seconds >= budget.session_cpu_seconds:
+                self._refuse(prefetch, f"this session has used its {budget.session_cpu_seconds:g} s of CPU time")
+            if steps >= budget.session_steps:
+                self._refuse(prefetch, f"this session has used its {budget.session_steps:,} steps")
+            queue = self._queues.get(session, ())
+            running = self._prefetching.get(session)
+            if prefetch and running is not None and running.prefetch:
+                self._refuse(prefetch, "a prefetch is already running for this session")
+            if prefetch:
+                for stale in [job for job in queue if job.prefetch]:
+                    self._drop(stale)
+                    self.superseded += 1
+                queue = self._queues.get(session, ())
+            if len(queue) >= budget.pending:
+                self._refuse(prefetch, f"{len(queue)} jobs are already waiting for this session")
+            if self.queued() >= self.max_queued:
+                self._refuse(prefetch, f"{self.max_queued} jobs are already waiting on the server")
+            job = Job(key, session, function, args, budget, prefetch, cache)
+            self._jobs[key] = job
+            self._queues.setdefault(session, deque()).append(job)
+            self.submitted += 1
+            self._dispatch()
+            return job.future
+
+    def _refuse(self, prefetch, message):
+        if prefetch:
+            self.prefetch_refused += 1
+        else:
+            self.rejected += 1
+        raise JobRejected(message)
+
+    def _drop(self, job):
+        # Takes a job that has not started out of its session's queue, so it
+        # no longer counts against the pending or server limits.
+        queue = self._queues[job.session]
+        queue.remove(job)
+        if not queue:
+            del self._queues[job.session]
+        del self._jobs[job.key]
+        job.future.cancel()
+
+    def cancel(self, key):
+        # Drops the job for key if it is still waiting and returns True; a
+        # job that has started runs to the end and returns False.
+        with self._lock:
+            job = self._jobs.get(key)
+            if job is None or job.started_at is not None:
+                return False
+            self._drop(job)
+            return True
+
+    def _next_job(self):
+        # The waiting session whose last job started earliest goes next;
+        # sessions never served (or long forgotten) go first.
+        session = min(self._queues, key=lambda session: self._served.get(session, -1))
+        queue = self._queues[session]
+        job = queue.popleft()
+        if not queue:
+            del self._queues[session]
+        self._dispatched += 1
+        self._served[session] = self._dispatched
+        if len(self._served) > SERVED_HISTORY:
+            self._served = {session: served for session, served in self._served.items() if session in self._queues}
+        return job
+
+    def _dispatch(self):
+        while self._running < self.workers and self._queues:
+            job = self._next_job()
+            if not job.future.set_running_or_notify_cancel():
+                del self._jobs[job.key]
+                continue
+            if self._executor is None:
+                # Spawned workers: forking a process that runs the Streamlit
+                # server threads is unsafe.
+                self._executor = ProcessPoolExecutor(self.workers, mp_context=multiprocessing.get_context("spawn"))
+            job.started_at = time.perf_counter()
+            self._running += 1
+            if job.prefetch:
+                self._prefetching[job.session] = job
+            try:
+                pool_future = self._executor.submit(_execute, job.function, job.args, job.budget)
+            except (BrokenProcessPool, RuntimeError) as error:
+                self._executor = None
+                self._finish(job, None, error)
+                continue
+            pool_future.add_done_callback(lambda pool_future, job=job: self._collect(job, pool_future))
+
+    def _collect(self, job, pool_future):
+        try:
+            value, cpu_seconds, steps = pool_future.result()
+        except BaseException as error:
+            if isinstance(error, BrokenProcessPool):
+                # A worker died (e.g. killed for memory); start a fresh pool.
+                with self._lock:
+                    self._executor = None
+            self._finish(job, None, error, getattr(error, "cpu_seconds", 0.0), getattr(error, "steps", 0))
+        else:
+            if self.cache is not None and job.cache:
+                self.cache.put(job.key, value)
+            self._finish(job, value, None, cpu_seconds, steps)
+
+    def _charge(self, session, cpu_seconds, steps):
+        # Moves the session to the end, so the table stays ordered by last use
+        # and the sessions dropped once it is too long are the idlest ones.
+        used = self._usage.pop(session, [0.0, 0])
+        used[0] += cpu_seconds
+        used[1] += steps
+        self._usage[session] = used
+        while len(self._usage) > SERVED_HISTORY:
+            del self._usage[next(iter(self._usage))]
+
+    def _finish(self, job, value, error, cpu_seconds=0.0, steps=0):
+        with self._lock:
+            self._running -= 1
+            if self._jobs.get(job.key) is job:
+                del self._jobs[job.key]
+            self._waits.append(job.started_at - job.submitted_at)
+            self._runs.append(time.perf_counter() - job.started_at)
+            self._charge(job.session, cpu_seconds, steps)
+            if self._prefetching.get(job.session) is job:
+                del self._prefetching[job.session]
+            # A crashed pool or a cancelled future says nothing about the
+            # job itself; any other failure would happen again.
+            if error is not None and not isinstance(error, (BrokenProcessPool, CancelledError)):
+                self._failed[job.key] = error
+                if len(self._failed) > FAILED_HISTORY:
+                    self._failed.popitem(last=False)
+            if error is None:
+                self.completed += 1
+            elif isinstance(error, BudgetExceeded):
+                self.over_budget += 1
+            else:
+                self.failed += 1
+            self._dispatch()
+        if error is None:
+            job.future.set_result(value)
+        else:
+            job.future.set_exception(error)
+
+    def session_usage(self, session):
+        # (cpu_seconds, steps) charged to the session so far.
+        return tuple(self._usage.get(session, (0.0, 0)))
+
+    def metrics(self):
+        with self._lock:
+            waits, runs = list(self._waits), list(self._runs)
+            return {
+                "workers": self.workers,
+                "queued": self.queued(),
+                "running": self._running,
+                "sessions_waiting": len(self._queues),
+                "submitted": self.submitted,
+                "completed": self.completed,
+                "failed": self.failed,
+                "over_budget": self.over_budget,
+                "rejected": self.rejected,
+                "prefetch_refused": self.prefetch_refused,
+                "superseded": self.superseded,
+                "wait_p50": _percentile(waits, 0.5),
+                "wait_p95": _percentile(waits, 0.95),
+                "run_p50": _percentile(runs, 0.5),
+                "run_p95": _percentile(runs, 0.95),
+            }
+
+    def track(self, owner):
+        # owner.cancel() is called at the start of shutdown(). Jobs that only
+        # stop when their owner raises a flag (race lanes) would otherwise
+        # keep the pool, and interpreter exit, waiting until they finish.
+        with self._lock:
+            self._tracked.add(owner)
+
+    def shutdown(self):
+        with self._lock:
+            owners = list(self._tracked)
+        for owner in owners:
+            owner.cancel()
+        with self._lock:
+            for queue in self._queues.values():
+                for job in queue:
+                    job.future.cancel()
+            self._queues.clear()
+            self._served.clear()
+            self._prefetching.clear()
+            self._jobs.clear()
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,7 @@
+# dsa_visualizer/tests/conftest.py
+# The app's modules are top-level scripts rather than an installed package,
+# so the tests import them from the repository root.
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
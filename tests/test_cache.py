@@ -0,0 +1,92 @@
+# dsa_visualizer/tests/test_cache.py
+# TraceCache eviction in memory and on disk, and cache_key disambiguation.
+import pickle
+from array import array
+
+import numpy as np
+
+from cache import TraceCache, cache_key
+
+
+def _value(tag):
+    return bytes([tag]) * 100
+
+
+SIZE = len(pickle.dumps(_value(0), protocol=pickle.HIGHEST_PROTOCOL))
+
+
+def test_least_recently_used_is_evicted_first():
+    cache = TraceCache(max_bytes=3 * SIZE)
+    for tag in range(3):
+        cache.put(f"k{tag}", _value(tag))
+    assert cache.get("k0") == _value(0)
+    cache.put("k3", _value(3))
+    assert "k1" not in cache
+    assert [key for key in ("k0", "k2", "k3") if key in cache] == ["k0", "k2", "k3"]
+    cache.put("k4", _value(4))
+    assert "k2" not in cache and "k0" in cache
+    assert cache.stats()["evictions"] == 2
+    assert cache.current_bytes == 3 * SIZE
+
+
+def test_replacing_a_key_is_not_charged_twice():
+    cache = TraceCache(max_bytes=2 * SIZE)
+    cache.put("a", _value(1))
+    cache.put("a", _value(2))
+    cache.put("b", _value(3))
+    assert cache.get("a") == _value(2) and "b" in cache
+    assert cache.current_bytes == 2 * SIZE and cache.evictions == 0
+
+
+def test_oversized_entry_is_skipped_in_both_tiers(tmp_path):
+    cache = TraceCache(max_bytes=2 * SIZE, path=tmp_path / "traces.sqlite")
+    cache.put("small", _value(1))
+    big = bytes(4 * SIZE)
+    assert cache.put("big", big) is big
+    assert "big" not in cache and "small" in cache
+    assert cache.get("big") is None
+    assert cache.stats()["disk_bytes"] == SIZE
+    assert cache.get_or_compute("big", lambda: big) is big
+
+
+def test_disk_tier_serves_a_new_instance(tmp_path):
+    path = tmp_path / "traces.sqlite"
+    TraceCache(path=path).put("k", {"steps": [1, 2, 3]})
+    reopened = TraceCache(path=path)
+    assert len(reopened) == 0
+    assert reopened.get("k") == {"steps": [1, 2, 3]}
+    assert reopened.disk_hits == 1 and "k" in reopened
+
+
+def test_reopening_with_a_smaller_limit_trims_the_oldest(tmp_path):
+    path = tmp_path / "traces.sqlite"
+    cache = TraceCache(path=path)
+    for tag in range(5):
+        cache.put(f"k{tag}", _value(tag))
+    # Rewriting k0 makes it the newest write.
+    cache.put("k0", _value(9))
+    assert cache.disk_bytes == 5 * SIZE
+    reopened = TraceCache(path=path, max_disk_bytes=2 * SIZE)
+    assert reopened.disk_bytes == 2 * SIZE and reopened.disk_evictions == 3
+    assert reopened.get("k1") is None and reopened.get("k3") is None
+    assert reopened.get("k4") == _value(4) and reopened.get("k0") == _value(9)
+
+
+def test_disk_limit_applies_on_put(tmp_path):
+    cache = TraceCache(path=tmp_path / "traces.sqlite", max_disk_bytes=2 * SIZE)
+    for tag in range(4):
+        cache.put(f"k{tag}", _value(tag))
+    assert cache.disk_bytes == 2 * SIZE and cache.disk_evictions == 2
+    reopened = TraceCache(path=tmp_path / "traces.sqlite")
+    assert [reopened.get(f"k{tag}") is not None for tag in range(4)] == [False, False, True, True]
+
+
+def test_cache_key_includes_dtype():
+    wide = np.array([1], dtype=np.int64)
+    narrow = np.array([1, 0], dtype=np.int32)
+    assert wide.tobytes() == narrow.tobytes()
+    assert cache_key("sort", wide) != cache_key("sort", narrow)
+    assert cache_key("sort", array('q', [1])) != cache_key("sort", array('i', [1, 0]))
+    assert cache_key("sort", wide) == cache_key("sort", wide.copy())
+    assert cache_key("sort", [1, 2], "x") != cache_key("sort", [1, 2], "y")
+    assert cache_key("sort", [1, 2]) != cache_key("search", [1, 2])
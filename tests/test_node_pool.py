@@ -0,0 +1,112 @@
+# dsa_visualizer/tests/test_node_pool.py
+# Pooled trees and lists must match the object-per-node versions they stand
+# in for: same shape, same contents after the same operations.
+import pickle
+import random
+
+import pytest
+
+from algorithms import list_operations as lists
+from algorithms.node_pool import ListPool, TreePool
+from algorithms.tree_traversal import build_balanced_bst, build_bst
+
+
+def _shape(root):
+    # Preorder (value, has_left, has_right) list; equal lists mean equal trees.
+    shape, stack = [], [root] if root is not None else []
+    while stack:
+        node = stack.pop()
+        shape.append((node.value, node.left is not None, node.right is not None))
+        stack.extend(child for child in (node.right, node.left) if child is not None)
+    return shape
+
+
+def _height(root):
+    height, level = 0, [root] if root is not None else []
+    while level:
+        height += 1
+        level = [child for node in level for child in (node.left, node.right) if child is not None]
+    return height
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_tree_pool_matches_object_tree(seed):
+    rng = random.Random(seed)
+    # Narrow ranges give duplicates, which both versions send right.
+    values = [rng.randrange(rng.choice([5, 1000])) for _ in range(rng.randrange(0, 300))]
+    assert _shape(build_bst(values, compact=True)) == _shape(build_bst(values))
+
+
+@pytest.mark.parametrize("n", [0, 1, 2, 3, 7, 8, 1000])
+def test_balanced_build_is_sorted_and_minimal(n):
+    rng = random.Random(n)
+    values = [rng.randrange(-50, 50) for _ in range(n)]
+    root = build_balanced_bst(values)
+    inorder, stack, node = [], [], root
+    while stack or node is not None:
+        while node is not None:
+            stack.append(node)
+            node = node.left
+        node = stack.pop()
+        inorder.append(node.value)
+        node = node.right
+    assert inorder == sorted(values)
+    assert _height(root) == n.bit_length()
+
+
+def test_tree_pool_pickles_as_arrays():
+    pool = TreePool.from_values([5, 2, 8, 1, 9, 2])
+    copy = pickle.loads(pickle.dumps(pool))
+    assert _shape(copy.root) == _shape(pool.root)
+    assert copy.root.pool is copy
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_list_pool_matches_node_chain(seed):
+    rng = random.Random(seed)
+    initial = [rng.randrange(100) for _ in range(rng.randrange(0, 20))]
+    chain = lists.create_linked_list(initial)
+    pool = lists.create_linked_list(initial, compact=True)
+    assert isinstance(pool, ListPool)
+    largest = len(initial)
+    for _ in range(200):
+        op = rng.randrange(6)
+        value = rng.randrange(100)
+        position = rng.randrange(0, len(pool) + 3)
+        if op == 0:
+            chain, *_ = lists.insert_at_beginning(chain, value)
+            pool, *_ = lists.insert_at_beginning(pool, value)
+        elif op == 1:
+            chain, *_ = lists.insert_at_end(chain, value)
+            pool, *_ = lists.insert_at_end(pool, value)
+        elif op == 2:
+            chain, _, _, chain_message = lists.insert_at_position(chain, value, position, lambda step: None)
+            pool, _, _, pool_message = lists.insert_at_position(pool, value, position, lambda step: None)
+            assert chain_message == pool_message
+        elif op == 3:
+            chain, *_ = lists.delete_at_beginning(chain)
+            pool, *_ = lists.delete_at_beginning(pool)
+        elif op == 4:
+            chain, *_ = lists.delete_at_end(chain)
+            pool, *_ = lists.delete_at_end(pool)
+        else:
+            chain, _, _, chain_message = lists.delete_at_position(chain, position, lambda step: None)
+            pool, _, _, pool_message = lists.delete_at_position(pool, position, lambda step: None)
+            assert chain_message == pool_message
+        expected = lists.visualize_linked_list(chain)[0]
+        assert lists.visualize_linked_list(pool)[0] == expected
+        assert len(pool) == len(expected)
+        assert (pool.tail == -1) == (not expected)
+        if expected:
+            assert pool.values[pool.tail] == expected[-1]
+        # Deleted slots are reused, so the arrays never outgrow the largest list.
+        largest = max(largest, len(expected))
+        assert len(pool.values) == largest
+
+
+def test_list_pool_pickles_with_its_free_list():
+    pool = ListPool.from_values([1, 2, 3, 4])
+    pool.delete(1)
+    copy = pickle.loads(pickle.dumps(pool))
+    copy.insert(1, 7)
+    assert copy.to_list() == [1, 7, 3, 4] and len(copy.values) == 4
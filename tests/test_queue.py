@@ -0,0 +1,73 @@
+# dsa_visualizer/tests/test_queue.py
+# Random enqueue/dequeue sequences on RingBufferQueue, checked against
+# collections.deque; they run well past the starting capacity, so the ring
+# wraps around and grows (or overflows, for a fixed ring).
+import random
+from collections import deque
+
+import pytest
+
+from algorithms.queue_operations import RingBufferQueue
+
+
+def _random_operations(rng, queue, model, rounds, fixed=False):
+    for _ in range(rounds):
+        op = rng.choice(["enqueue", "enqueue", "enqueue_many", "dequeue", "dequeue_many"])
+        if op == "enqueue":
+            item = rng.randrange(-2**63, 2**63)
+            if fixed and len(model) == queue.capacity:
+                with pytest.raises(OverflowError):
+                    queue.enqueue(item)
+            else:
+                queue.enqueue(item)
+                model.append(item)
+        elif op == "enqueue_many":
+            items = [rng.randrange(-1000, 1000) for _ in range(rng.randrange(0, 12))]
+            if fixed and len(model) + len(items) > queue.capacity:
+                with pytest.raises(OverflowError):
+                    queue.enqueue_many(items)
+            else:
+                queue.enqueue_many(items)
+                model.extend(items)
+        elif op == "dequeue":
+            assert queue.dequeue()[0] == (model.popleft() if model else None)
+        else:
+            count = rng.randrange(0, 10)
+            expected = [model.popleft() for _ in range(min(count, len(model)))]
+            assert queue.dequeue_many(count)[0] == expected
+        assert queue.to_list() == list(model)
+        assert queue.to_list(3) == list(model)[:3]
+        assert queue.size() == len(model)
+        assert queue.peek()[0] == (model[0] if model else None)
+        assert 0 <= queue.head < queue.capacity
+
+
+@pytest.mark.parametrize("growth", [2.0, 1.1])
+@pytest.mark.parametrize("seed", range(20))
+def test_growing_ring_matches_deque(seed, growth):
+    rng = random.Random(seed)
+    initial = [rng.randrange(-1000, 1000) for _ in range(rng.randrange(0, 5))]
+    queue = RingBufferQueue(initial, capacity=rng.choice([1, 3, 8]), growth=growth)
+    model = deque(initial)
+    _random_operations(rng, queue, model, 500)
+    assert queue.capacity >= len(model)
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_fixed_ring_matches_deque(seed):
+    rng = random.Random(seed)
+    queue = RingBufferQueue(capacity=rng.choice([1, 5, 8]), growth=None)
+    capacity = queue.capacity
+    model = deque()
+    _random_operations(rng, queue, model, 500, fixed=True)
+    assert queue.capacity == capacity
+
+
+def test_wraparound_then_growth_keeps_order():
+    queue = RingBufferQueue(capacity=4)
+    queue.enqueue_many([1, 2, 3])
+    queue.dequeue_many(2)
+    queue.enqueue_many([4, 5, 6])
+    assert queue.head == 2 and queue.capacity == 4
+    queue.enqueue(7)
+    assert queue.to_list() == [3, 4, 5, 6, 7] and queue.head == 0
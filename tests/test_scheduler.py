@@ -0,0 +1,152 @@
+# dsa_visualizer/tests/test_scheduler.py
+# JobScheduler ordering, sharing and prefetch handling, with one worker so the
+# dispatch order is the run order.
+import time
+
+import pytest
+
+import scheduler
+from scheduler import DEFAULT_BUDGET, JobRejected, JobScheduler
+
+PAUSE = 0.2
+
+
+def tagged(tag, budget=DEFAULT_BUDGET):
+    # A job function: sleeps, then reports its tag and when it finished.
+    time.sleep(PAUSE)
+    return (tag, time.time()), 1
+
+
+def overflowing(budget=DEFAULT_BUDGET):
+    raise OverflowError("int too big to convert")
+
+
+@pytest.fixture
+def jobs():
+    jobs = JobScheduler(workers=1)
+    # Start the worker first, so later timings are not dominated by spawning.
+    jobs.submit("warmup", "warmup", tagged, "warmup").result()
+    yield jobs
+    jobs.shutdown()
+
+
+def _run_order(futures):
+    return [tag for tag, _ in sorted((future.result() for future in futures), key=lambda result: result[1])]
+
+
+def test_least_recently_served_session_goes_next(jobs):
+    first = [jobs.submit("a", f"a{i}", tagged, f"a{i}") for i in range(4)]
+    second = jobs.submit("b", "b0", tagged, "b0")
+    # a0 is already running; b0 overtakes a1..a3, which stay in FIFO order.
+    assert _run_order(first + [second]) == ["a0", "b0", "a1", "a2", "a3"]
+
+
+def test_sessions_take_turns(jobs):
+    blocker = jobs.submit("x", "x", tagged, "x")
+    futures = [jobs.submit(session, f"{session}{i}", tagged, f"{session}{i}")
+               for session in ("a", "b") for i in range(2)]
+    blocker.result()
+    assert _run_order(futures) == ["a0", "b0", "a1", "b1"]
+
+
+def test_same_key_shares_one_job(jobs):
+    first = jobs.submit("a", "shared", tagged, "shared")
+    second = jobs.submit("b", "shared", tagged, "shared")
+    assert first is second
+    first.result()
+    assert jobs.metrics()["submitted"] == 2
+
+
+def test_newer_prefetch_supersedes_queued_one(jobs):
+    blocker = jobs.submit("a", "block", tagged, "block")
+    old = jobs.submit("a", "p1", tagged, "p1", prefetch=True)
+    new = jobs.submit("a", "p2", tagged, "p2", prefetch=True)
+    assert old.cancelled()
+    assert new.result()[0] == "p2"
+    blocker.result()
+    assert jobs.metrics()["superseded"] == 1
+
+
+def test_real_submit_keeps_prefetched_job(jobs):
+    blocker = jobs.submit("a", "block", tagged, "block")
+    prefetched = jobs.submit("a", "p1", tagged, "p1", prefetch=True)
+    assert jobs.submit("a", "p1", tagged, "p1") is prefetched
+    jobs.submit("a", "p2", tagged, "p2", prefetch=True)
+    assert prefetched.result()[0] == "p1"
+    blocker.result()
+
+
+def test_one_running_prefetch_per_session(jobs):
+    running = jobs.submit("a", "p1", tagged, "p1", prefetch=True)
+    with pytest.raises(JobRejected):
+        jobs.submit("a", "p2", tagged, "p2", prefetch=True)
+    other = jobs.submit("b", "p3", tagged, "p3", prefetch=True)
+    assert running.result()[0] == "p1"
+    assert other.result()[0] == "p3"
+    # The page drops the refused prefetch without telling anyone.
+    metrics = jobs.metrics()
+    assert metrics["prefetch_refused"] == 1 and metrics["rejected"] == 0
+
+
+def test_pending_limit_per_session(jobs):
+    budget = DEFAULT_BUDGET._replace(pending=2)
+    futures = [jobs.submit("a", f"a{i}", tagged, f"a{i}", budget=budget) for i in range(3)]
+    with pytest.raises(JobRejected):
+        jobs.submit("a", "a3", tagged, "a3", budget=budget)
+    assert jobs.metrics()["rejected"] == 1
+    for future in futures:
+        future.result()
+
+
+def test_failed_key_is_not_run_again(jobs):
+    with pytest.raises(OverflowError):
+        jobs.submit("a", "bad", overflowing).result()
+    submitted = jobs.metrics()["submitted"]
+    again = jobs.submit("b", "bad", overflowing, prefetch=True)
+    assert again.done()
+    assert isinstance(again.exception(), OverflowError)
+    assert jobs.metrics()["submitted"] == submitted
+
+
+def test_budget_exceeded_is_charged_to_the_session(jobs):
+    budget = DEFAULT_BUDGET._replace(steps=100)
+    with pytest.raises(scheduler.BudgetExceeded) as raised:
+        jobs.submit("a", "big", scheduler.sort_trace, "Bubble Sort", list(range(200, 0, -1)), budget=budget).result()
+    assert raised.value.steps == 101
+    cpu_seconds, steps = jobs.session_usage("a")
+    assert steps == 101 and cpu_seconds > 0
+    exhausted = DEFAULT_BUDGET._replace(session_steps=100)
+    with pytest.raises(JobRejected):
+        jobs.submit("a", "next", tagged, "next", budget=exhausted)
+
+
+def test_cancelled_job_stops_counting_toward_pending(jobs):
+    budget = DEFAULT_BUDGET._replace(pending=2)
+    blocker = jobs.submit("x", "x", tagged, "x")
+    waiting = [jobs.submit("a", f"a{i}", tagged, f"a{i}", budget=budget) for i in range(2)]
+    with pytest.raises(JobRejected):
+        jobs.submit("a", "a2", tagged, "a2", budget=budget)
+    assert not jobs.cancel("x")
+    for i, future in enumerate(waiting):
+        assert jobs.cancel(f"a{i}")
+        assert future.cancelled()
+    assert jobs.metrics()["queued"] == 0
+    assert jobs.submit("a", "a2", tagged, "a2", budget=budget).result()[0] == "a2"
+    blocker.result()
+
+
+def test_shutdown_cancels_tracked_owners():
+    jobs = JobScheduler(workers=1)
+
+    class Owner:
+        cancelled = False
+
+        def cancel(self):
+            self.cancelled = True
+
+    owner, dropped = Owner(), Owner()
+    jobs.track(owner)
+    jobs.track(dropped)
+    del dropped
+    jobs.shutdown()
+    assert owner.cancelled
@@ -0,0 +1,68 @@
+# dsa_visualizer/tests/test_searching.py
+# batch_search must return exactly what the scalar searches return, and
+# count the same number of comparisons, for every target.
+import random
+
+import numpy as np
+import pytest
+
+from algorithms import searching
+from algorithms.instrument import Counter
+
+SCALAR = {"linear": searching.linear_search, "binary": searching.binary_search, "jump": searching.jump_search}
+
+
+def _noop(arr, highlighted, marked):
+    pass
+
+
+def _scalar_results(method, values, targets):
+    indices, probes = [], []
+    for target in targets:
+        counter = Counter()
+        index, _, _ = SCALAR[method](values, target, _noop, counter)
+        indices.append(index)
+        probes.append(counter.comparisons)
+    return indices, probes
+
+
+def _case(seed, sort):
+    rng = random.Random(seed)
+    n = rng.randrange(0, 300)
+    spread = rng.choice([5, 50, 5000])
+    values = [rng.randrange(-spread, spread) for _ in range(n)]
+    if sort:
+        values.sort()
+    targets = [rng.randrange(-spread - 3, spread + 3) for _ in range(200)]
+    return values, targets
+
+
+@pytest.mark.parametrize("method", ["linear", "binary", "jump"])
+@pytest.mark.parametrize("seed", range(25))
+def test_batch_matches_scalar(method, seed):
+    # Small spreads give many duplicates; linear search runs on unsorted input.
+    values, targets = _case(seed, sort=method != "linear")
+    indices, probes = searching.batch_search(np.array(values, dtype=np.int64), np.array(targets, dtype=np.int64), method)
+    expected_indices, expected_probes = _scalar_results(method, values, targets)
+    assert indices.tolist() == expected_indices
+    assert probes.tolist() == expected_probes
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_binary_indices_only_matches_scalar(seed):
+    rng = random.Random(seed)
+    values = sorted(rng.sample(range(-10_000, 10_000), rng.randrange(1, 500)))
+    targets = [rng.randrange(-10_010, 10_010) for _ in range(300)]
+    indices, probes = searching.batch_search(np.array(values), np.array(targets), "binary", count_probes=False)
+    assert probes is None
+    assert indices.tolist() == _scalar_results("binary", values, targets)[0]
+
+
+def test_probe_histogram_counts_targets():
+    probes = np.array([1, 3, 3, 0])
+    assert searching.probe_histogram(probes).tolist() == [1, 1, 0, 2]
+
+
+def test_unknown_method():
+    with pytest.raises(ValueError):
+        searching.batch_search(np.arange(3), np.arange(3), "interpolation")
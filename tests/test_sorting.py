@@ -0,0 +1,121 @@
+# dsa_visualizer/tests/test_sorting.py
+# Randomised checks of the production sorts against sorted().
+import random
+
+import pytest
+
+from algorithms import sorting
+from algorithms.instrument import Counter
+
+
+class Keyed:
+    # Compares on key only, so equal keys expose an unstable merge.
+    __slots__ = ("key", "tag")
+
+    def __init__(self, key, tag):
+        self.key = key
+        self.tag = tag
+
+    def __lt__(self, other):
+        return self.key < other.key
+
+    def __le__(self, other):
+        return self.key <= other.key
+
+
+def _runs_input(rng, n):
+    # Long sorted stretches from both sides, so merges gallop in blocks.
+    values = []
+    while len(values) < n:
+        start = rng.randrange(n)
+        values.extend(range(start, start + rng.randrange(1, 200)))
+    return values[:n]
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_tim_sort_matches_sorted(seed):
+    rng = random.Random(seed)
+    n = rng.randrange(0, 3000)
+    values = _runs_input(rng, n) if seed % 2 else [rng.randrange(-50, 50) for _ in range(n)]
+    arr = list(values)
+    sorting.tim_sort(arr)
+    assert arr == sorted(values)
+
+
+def test_tim_sort_gallops_and_stays_stable():
+    rng = random.Random(1)
+    keys = _runs_input(rng, 5000)
+    items = [Keyed(key, tag) for tag, key in enumerate(keys)]
+    counter = Counter()
+    sorting.tim_sort(items, None, counter)
+    assert [item.key for item in items] == sorted(keys)
+    for before, after in zip(items, items[1:]):
+        if before.key == after.key:
+            assert before.tag < after.tag
+    # Galloping copies whole blocks, so it needs far fewer comparisons than a
+    # plain merge sort of the same input.
+    merge_counter = Counter()
+    sorting.merge_sort(list(keys), sorting._ignore, merge_counter)
+    assert counter.comparisons < merge_counter.comparisons / 2
+
+
+def test_tim_sort_single_run_costs_n_minus_one():
+    for values in (list(range(500)), list(range(500, 0, -1))):
+        counter = Counter()
+        sorting.tim_sort(list(values), None, counter)
+        assert counter.comparisons == len(values) - 1
+
+
+def test_merge_runs_matches_sorted():
+    rng = random.Random(2)
+    for _ in range(200):
+        left = sorted(rng.randrange(100) for _ in range(rng.randrange(1, 80)))
+        right = sorted(rng.randrange(100) for _ in range(rng.randrange(1, 80)))
+        arr = left + right
+        sorting._merge_runs(arr, 0, len(left), len(arr), sorting._ignore, Counter())
+        assert arr == sorted(left + right)
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_intro_sort_matches_sorted(seed):
+    rng = random.Random(seed)
+    n = rng.randrange(0, 3000)
+    values = [rng.randrange(-n, n + 1) for _ in range(n)]
+    arr = list(values)
+    sorting.intro_sort(arr)
+    assert arr == sorted(values)
+
+
+def test_heapsort_range_matches_sorted():
+    # intro_sort's fallback once a range runs out of partition depth.
+    rng = random.Random(3)
+    values = [rng.randrange(1000) for _ in range(500)]
+    arr = list(values)
+    sorting._heapsort_range(arr, 0, len(arr) - 1, sorting._ignore, Counter())
+    assert arr == sorted(values)
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_radix_sort_handles_negatives(seed):
+    rng = random.Random(seed)
+    n = rng.randrange(0, 2000)
+    bound = rng.choice([10, 1000, 2**40])
+    values = [rng.randrange(-bound, bound) for _ in range(n)]
+    arr = list(values)
+    sorting.radix_sort(arr)
+    assert arr == sorted(values)
+
+
+@pytest.mark.parametrize("workers", [2, 3, 5])
+def test_parallel_merge_sort_merge_rounds(monkeypatch, workers):
+    # An odd block count carries the last block into the next round.
+    monkeypatch.setattr(sorting, "PARALLEL_CUTOFF", 64)
+    rng = random.Random(workers)
+    values = [rng.randrange(-10**9, 10**9) for _ in range(3001)]
+    arr = list(values)
+    steps = []
+    sorting.parallel_merge_sort(arr, lambda arr, highlighted, marked: steps.append(highlighted), workers=workers)
+    assert arr == sorted(values)
+    # workers block sorts, then one step per merge.
+    assert len(steps) == 2 * workers - 1
+    assert steps[-1] == range(0, len(values))
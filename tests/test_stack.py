@@ -0,0 +1,80 @@
+# dsa_visualizer/tests/test_stack.py
+# Random operation sequences on ArrayStack, checked against a plain list and
+# a snapshot of that list after every logged operation.
+import random
+
+import pytest
+
+from algorithms.stack_operations import ArrayStack
+
+
+def _check(stack, model, snapshots, rng):
+    assert stack.to_list() == model
+    assert stack.size() == len(model)
+    assert stack.peek()[0] == (model[-1] if model else None)
+    assert stack.top(3) == model[-3:]
+    assert stack.min_capacity <= stack.capacity and len(model) <= stack.capacity
+    assert stack.log_length == len(snapshots) - 1
+    # state_at replays from the front or unwinds from the back, so check both
+    # ends as well as a few random positions.
+    positions = {0, len(snapshots) - 1, len(snapshots) // 2}
+    positions.update(rng.randrange(len(snapshots)) for _ in range(3))
+    for position in positions:
+        assert stack.state_at(position) == snapshots[position]
+
+
+@pytest.mark.parametrize("seed", range(30))
+def test_random_operations_match_list(seed):
+    rng = random.Random(seed)
+    initial = [rng.randrange(-2**63, 2**63) for _ in range(rng.randrange(0, 20))]
+    stack = ArrayStack(initial, capacity=rng.choice([1, 4, 16]))
+    model = list(initial)
+    snapshots = [[], list(model)] if initial else [[]]
+    for _ in range(300):
+        op = rng.choice(["push", "push", "push_many", "pop", "pop_many", "undo"])
+        if op == "push":
+            item = rng.randrange(-1000, 1000)
+            stack.push(item)
+            model.append(item)
+        elif op == "push_many":
+            items = [rng.randrange(-1000, 1000) for _ in range(rng.randrange(0, 40))]
+            stack.push_many(items)
+            model.extend(items)
+        elif op == "pop":
+            item = stack.pop()[0]
+            assert item == (model.pop() if model else None)
+            if item is None:
+                continue
+        elif op == "pop_many":
+            count = rng.randrange(0, 50)
+            taken = stack.pop_many(count)[0]
+            expected = model[len(model) - min(count, len(model)):][::-1]
+            del model[len(model) - len(expected):]
+            assert taken == expected
+            if not expected:
+                continue
+        else:
+            undone = stack.undo()
+            if len(snapshots) == 1:
+                assert undone is None
+                continue
+            snapshots.pop()
+            model = list(snapshots[-1])
+            _check(stack, model, snapshots, rng)
+            continue
+        snapshots.append(list(model))
+        _check(stack, model, snapshots, rng)
+    for position, snapshot in enumerate(snapshots):
+        assert stack.state_at(position) == snapshot
+    while stack.undo():
+        snapshots.pop()
+        assert stack.to_list() == snapshots[-1]
+    assert snapshots == [[]] and stack.is_empty()
+
+
+def test_history_lists_pops_top_first():
+    stack = ArrayStack([1, 2, 3])
+    stack.pop_many(2)
+    stack.push(7)
+    assert stack.history() == [("push", [1, 2, 3]), ("pop", [3, 2]), ("push", [7])]
+    assert stack.pop_many(5)[0] == [7, 1]
@@ -0,0 +1,67 @@
+# dsa_visualizer/tests/test_trace.py
+# ArrayTrace stores deltas and keyframes; every step it rebuilds must equal the
+# one a plain TraceRecorder, which copies the whole array per step, recorded.
+import random
+
+import pytest
+
+import registry
+from algorithms import sorting
+from algorithms.trace import ArrayTrace, TraceRecorder
+
+SORTS = registry.names("sort")
+
+
+def _record_both(name, values, keyframe_interval):
+    trace = ArrayTrace(values, keyframe_interval, typecode='q')
+    full = TraceRecorder()
+
+    def callback(arr, highlighted, marked):
+        trace(arr, highlighted, marked)
+        full.array_callback(arr, highlighted, marked)
+
+    # Three workers, whatever this machine's CPU count.
+    options = {"workers": 3} if name == "Parallel Merge Sort" else {}
+    registry.load("sort", name)(list(values), callback, **options)
+    return trace, full.steps
+
+
+def _same_step(step, expected):
+    return (tuple(step.state) == expected.state and tuple(step.highlighted) == tuple(expected.highlighted)
+            and tuple(step.marked) == tuple(expected.marked))
+
+
+@pytest.mark.parametrize("keyframe_interval", [1, 3, 16, None])
+@pytest.mark.parametrize("name", SORTS)
+def test_state_at_matches_full_snapshots(monkeypatch, name, keyframe_interval):
+    # A low cutoff sends Parallel Merge Sort through its worker processes.
+    monkeypatch.setattr(sorting, "PARALLEL_CUTOFF", 64)
+    rng = random.Random(f"{name}-{keyframe_interval}")
+    values = [rng.randrange(-1000, 1000) for _ in range(150)] + [2**62, -2**62]
+    rng.shuffle(values)
+    trace, expected = _record_both(name, values, keyframe_interval)
+    assert len(trace) == len(expected) > 0
+    # Every step, which covers the first and last ones and those on and either
+    # side of each keyframe.
+    for position, step in enumerate(expected):
+        assert tuple(trace.state_at(position)) == step.state
+        assert _same_step(trace[position], step)
+    assert _same_step(trace[-1], expected[-1])
+    # Sequential playback, started off a keyframe, walks every step.
+    start = len(trace) // 3
+    for position, step in enumerate(trace.iter_steps(start), start):
+        assert _same_step(step, expected[position])
+    assert tuple(trace.state_at(len(trace) - 1)) == tuple(sorted(values))
+
+
+def test_unchanged_steps_store_no_delta():
+    trace = ArrayTrace([3, 1, 2], keyframe_interval=2)
+    arr = [3, 1, 2]
+    trace(arr, (0, 1), ())
+    arr[0], arr[1] = arr[1], arr[0]
+    trace(arr, (0, 1), ())
+    trace(arr, (2,), (0,))
+    assert list(trace.delta_offsets) == [0, 0, 2, 2]
+    assert [list(trace.state_at(i)) for i in range(3)] == [[3, 1, 2], [1, 3, 2], [1, 3, 2]]
+    with pytest.raises(IndexError):
+        trace[3]
@@ -0,0 +1,129 @@
+# dsa_visualizer/tests/test_tree_traversal.py
+# The explicit-stack and Morris traversals must visit nodes in the same order
+# as the textbook recursive versions, and a Morris walk that is abandoned
+# part way must leave the tree exactly as it found it.
+import random
+from array import array
+from collections import deque
+
+import pytest
+
+from algorithms import tree_traversal as traversal
+from algorithms.instrument import Counter
+from algorithms.node_pool import NIL, TreePool
+from algorithms.tree_traversal import TreeNode
+
+
+def _recursive(node, order, out):
+    if node is None:
+        return out
+    if order == "pre":
+        out.append(node.value)
+    _recursive(node.left, order, out)
+    if order == "in":
+        out.append(node.value)
+    _recursive(node.right, order, out)
+    if order == "post":
+        out.append(node.value)
+    return out
+
+
+def _level_order(root):
+    out, queue = [], deque([root] if root is not None else [])
+    while queue:
+        node = queue.popleft()
+        out.append(node.value)
+        queue.extend(child for child in (node.left, node.right) if child is not None)
+    return out
+
+
+def _nodes(root):
+    nodes, stack = [], [root] if root is not None else []
+    while stack:
+        node = stack.pop()
+        nodes.append(node)
+        stack.extend(child for child in (node.left, node.right) if child is not None)
+    return nodes
+
+
+def _links(nodes):
+    return [(node.left, node.right) for node in nodes]
+
+
+def _tree(seed, compact):
+    rng = random.Random(seed)
+    values = [rng.randrange(rng.choice([10, 1000])) for _ in range(rng.randrange(0, 200))]
+    if seed % 5 == 0:
+        values.sort()
+    return traversal.build_bst(values, compact=compact), len(values)
+
+
+@pytest.mark.parametrize("compact", [False, True])
+@pytest.mark.parametrize("seed", range(20))
+def test_generators_match_recursive_order(seed, compact):
+    root, n = _tree(seed, compact)
+    expected = {order: _recursive(root, order, []) for order in ("pre", "in", "post")}
+    engines = [(traversal.iter_inorder, expected["in"]), (traversal.iter_preorder, expected["pre"]),
+               (traversal.iter_postorder, expected["post"]), (traversal.iter_level_order, _level_order(root)),
+               (traversal.morris_inorder, expected["in"]), (traversal.morris_preorder, expected["pre"])]
+    links = _links(_nodes(root))
+    for engine, order in engines:
+        counter = Counter()
+        assert list(engine(root, counter)) == order
+        assert counter.visits == n
+    assert _links(_nodes(root)) == links
+
+
+@pytest.mark.parametrize("compact", [False, True])
+@pytest.mark.parametrize("seed", range(10))
+def test_closing_morris_early_restores_the_tree(seed, compact):
+    root, n = _tree(seed + 1, compact)
+    nodes = _nodes(root)
+    links = _links(nodes)
+    rng = random.Random(seed)
+    for engine, order in ((traversal.morris_inorder, "in"), (traversal.morris_preorder, "pre")):
+        expected = _recursive(root, order, [])
+        stop = rng.randrange(0, n + 1)
+        events = engine(root)
+        assert [next(events) for _ in range(stop)] == expected[:stop]
+        events.close()
+        assert _links(nodes) == links
+        # Dropping an unfinished walk without closing it restores the tree too.
+        events = engine(root)
+        next(events, None)
+        del events
+        assert _links(nodes) == links
+
+
+def test_callback_api_reports_visits_so_far():
+    root = traversal.build_bst([2, 1, 3])
+    calls = []
+    assert traversal.inorder_traversal(root, lambda value, visited: calls.append((value, list(visited)))) == ("O(n)", "O(h)")
+    assert calls == [(1, [1]), (2, [1, 2]), (3, [1, 2, 3])]
+
+
+def _skewed_pool(n):
+    # Each node is the right child of the one before it.
+    pool = TreePool()
+    pool.values = array('q', range(n))
+    pool.left = array('i', [NIL]) * n
+    pool.right = array('i', range(1, n + 1))
+    pool.right[n - 1] = NIL
+    pool.root_index = 0
+    return pool
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_skewed_tree_deeper_than_recursion_limit(compact):
+    n = 100_000
+    if compact:
+        root = _skewed_pool(n).root
+    else:
+        root = node = TreeNode(0)
+        for value in range(1, n):
+            node.right = TreeNode(value)
+            node = node.right
+    for engine in (traversal.iter_inorder, traversal.iter_preorder, traversal.morris_inorder,
+                   traversal.morris_preorder, traversal.iter_level_order):
+        assert list(engine(root)) == list(range(n))
+    assert list(traversal.iter_postorder(root)) == list(range(n - 1, -1, -1))
@@ -0,0 +1,31 @@
+# dsa_visualizer/tests/test_utility.py
+# Chunked text parsing must give the same values as parsing the whole text
+# with int(), whatever the chunk size, and refuse numbers int64 cannot hold.
+import io
+import random
+import re
+
+import pytest
+
+import utility
+
+
+@pytest.mark.parametrize("chunk_bytes", [1, 7, 64, utility.CHUNK_BYTES])
+def test_text_matches_int_parse(chunk_bytes):
+    rng = random.Random(chunk_bytes)
+    values = [rng.randrange(-2**63, 2**63) for _ in range(300)] + [2**63 - 1, -2**63]
+    separators = [",", ", ", ";", "\t", "\n", "\r\n", "  "]
+    text = "".join(f"{value}{rng.choice(separators)}" for value in values).encode()
+    assert utility.load_text_array(io.BytesIO(text), chunk_bytes=chunk_bytes).tolist() == values
+
+
+@pytest.mark.parametrize("number", ["9223372036854775808", "-9223372036854775809", "99999999999999999999"])
+def test_out_of_range_is_rejected(number):
+    text = f"1,{number},3".encode()
+    with pytest.raises(ValueError, match=re.escape(number)):
+        utility.load_text_array(io.BytesIO(text), chunk_bytes=4)
+
+
+def test_garbage_is_rejected():
+    with pytest.raises(ValueError):
+        utility.load_text_array(io.BytesIO(b"1,2,x,4"))
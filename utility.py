@@ -0,0 +1,164 @@
+# dsa_visualizer/utility.py
+# Input helpers. Large integer datasets stay in NumPy buffers end to end:
+# binary files are memory-mapped, CSV/text files are parsed in chunks into a
+# binary file that is then memory-mapped, and display or algorithm input is
+# taken as a view (a window or a strided sample), never as a Python int list.
+import io
+import os
+import random
+import tempfile
+
+import numpy as np
+
+CHUNK_BYTES = 8 * 1024 * 1024
+NPY_HEADER_BYTES = 1024 * 1024
+BINARY_SUFFIXES = (".bin", ".raw", ".i64")
+TEXT_SEPARATORS = bytes.maketrans(b",;\t\r", b"    ")
+
+
+def generate_random_array(size=10, low=1, high=100, seed=None, path=None, chunk=1_000_000):
+    # Small arrays come back as a list. With a path, values are written to a
+    # .npy file chunk by chunk and the memory-mapped result is returned.
+    if path is None:
+        rng = random.Random(seed)
+        return [rng.randint(low, high) for _ in range(size)]
+    rng = np.random.default_rng(seed)
+    out = np.lib.format.open_memmap(path, mode="w+", dtype=np.int64, shape=(size,))
+    for start in range(0, size, chunk):
+        stop = min(size, start + chunk)
+        out[start:stop] = rng.integers(low, high + 1, stop - start)
+    out.flush()
+    return np.load(path, mmap_mode="r")
+
+
+def generate_bst_nodes(count=7, low=1, high=100, seed=None):
+    # Distinct values in random insertion order.
+    rng = random.Random(seed)
+    return rng.sample(range(low, high + 1), min(count, high - low + 1))
+
+
+def _suffix(name):
+    return os.path.splitext(name or "")[1].lower()
+
+
+def _parse_text_stream(stream, out, total=None, progress=None, chunk_bytes=CHUNK_BYTES):
+    # Numbers may be separated by commas, semicolons or any whitespace. Each
+    # chunk is cut after its last separator, parsed in one NumPy call and
+    # appended to `out` as raw int64; the cut-off token is carried forward.
+    carry = b""
+    done = 0
+    count = 0
+    while True:
+        block = stream.read(chunk_bytes)
+        if not block:
+            break
+        done += len(block)
+        block = carry + block.translate(TEXT_SEPARATORS)
+        cut = max(block.rfind(b" "), block.rfind(b"\n")) + 1
+        carry, block = block[cut:], block[:cut]
+        count += _write_numbers(block, out, done)
+        if progress:
+            progress(done, total)
+    count += _write_numbers(carry, out, done)
+    return count
+
+
+def _write_numbers(block, out, position):
+    if not block.strip():
+        return 0
+    try:
+        values = np.fromstring(block.decode("ascii"), dtype=np.int64, sep=" ")
+    except (UnicodeDecodeError, ValueError):
+        raise ValueError(f"could not parse integers before byte {position}") from None
+    # fromstring clamps out-of-range numbers to the int64 limits, so any value
+    # at a limit is checked against its token.
+    limits = np.iinfo(np.int64)
+    suspect = np.flatnonzero((values == limits.max) | (values == limits.min))
+    if len(suspect):
+        tokens = block.split()
+        for index in suspect:
+            if int(tokens[index]) != values[index]:
+                raise ValueError(f"{tokens[index].decode()} does not fit in a 64-bit integer (before byte {position})")
+    values.tofile(out)
+    return len(values)
+
+
+def load_text_array(stream, total=None, progress=None, cache_dir=None, chunk_bytes=CHUNK_BYTES):
+    # stream: any binary file object (an open file or an uploaded file).
+    # Returns a read-only int64 memmap over the parsed values.
+    handle, path = tempfile.mkstemp(suffix=".i64", dir=cache_dir)
+    with os.fdopen(handle, "wb") as out:
+        count = _parse_text_stream(stream, out, total, progress, chunk_bytes)
+    try:
+        return np.memmap(path, dtype=np.int64, mode="r") if count else np.empty(0, dtype=np.int64)
+    finally:
+        # The mapping keeps the data reachable; the file itself is scratch.
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+def _npy_from_buffer(buffer):
+    # Reads the .npy header and returns the payload as a view of `buffer`.
+    stream = io.BytesIO(bytes(buffer[:NPY_HEADER_BYTES]))
+    version = np.lib.format.read_magic(stream)
+    if version == (1, 0):
+        shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(stream)
+    else:
+        shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(stream)
+    if fortran_order or len(shape) != 1:
+        raise ValueError("expected a one-dimensional array")
+    return _integer_array(np.frombuffer(buffer, dtype=dtype, count=shape[0], offset=stream.tell()))
+
+
+def _integer_array(array):
+    # The algorithms and their array traces hold integers only; a float or
+    # object .npy would fail much later, inside a background job.
+    if array.ndim != 1:
+        raise ValueError("expected a one-dimensional array")
+    if not np.issubdtype(array.dtype, np.integer):
+        raise ValueError(f"expected integers, found {array.dtype}")
+    return array
+
+
+def load_array(source, dtype=np.int64, progress=None, cache_dir=None):
+    # source: a file path, or an uploaded file with .name and .getbuffer().
+    #   .npy          -> memory-mapped (or a view of the upload), no copy
+    #   .bin/.raw/.i64 -> raw values of `dtype`, mapped the same way
+    #   anything else -> parsed as CSV/whitespace-separated text in chunks
+    name = source if isinstance(source, (str, os.PathLike)) else getattr(source, "name", "")
+    suffix = _suffix(os.fspath(name))
+    if isinstance(source, (str, os.PathLike)):
+        if suffix == ".npy":
+            return _integer_array(np.load(source, mmap_mode="r"))
+        if suffix in BINARY_SUFFIXES:
+            return _integer_array(np.memmap(source, dtype=dtype, mode="r"))
+        with open(source, "rb") as stream:
+            return load_text_array(stream, os.path.getsize(source), progress, cache_dir)
+    if suffix == ".npy":
+        return _npy_from_buffer(source.getbuffer())
+    if suffix in BINARY_SUFFIXES:
+        return _integer_array(np.frombuffer(source.getbuffer(), dtype=dtype))
+    source.seek(0)
+    return load_text_array(source, getattr(source, "size", None), progress, cache_dir)
+
+
+def window(arr, start=0, size=1000):
+    # A contiguous view of at most `size` values starting at `start`.
+    start = max(0, min(start, len(arr)))
+    return arr[start:start + size]
+
+
+def sample_array(arr, max_points=1000):
+    # A strided view with at most max_points values, and its stride.
+    step = max(1, -(-len(arr) // max_points))
+    return arr[::step], step
+
+
+def sorted_view(arr):
+    # arr itself when it is already non-decreasing, otherwise a sorted copy.
+    arr = np.asarray(arr)
+    if len(arr) < 2 or bool(np.all(arr[:-1] <= arr[1:])):
+        return arr
+    return np.sort(arr)
@@ -0,0 +1,16 @@
+# dsa_visualizer/visualizations/list_visualizer.py
+import streamlit as st
+
+def visualize_list(data, highlighted, marked):
+    # Nodes are drawn as "[value] -> ..." with the current node in bold and
+    # the inserted / deleted node in italics.
+    highlighted, marked = set(highlighted), set(marked)
+    parts = []
+    for i, value in enumerate(data):
+        text = f"[{value}]"
+        if i in marked:
+            text = f"_{text}_"
+        if i in highlighted:
+            text = f"**{text}**"
+        parts.append(text)
+    st.markdown(" → ".join(parts) + " → None" if parts else "Empty List")
@@ -0,0 +1,15 @@
+# dsa_visualizer/visualizations/queue_visualizer.py
+import streamlit as st
+
+def display_queue_operation(operation, queue_data, item, time_complexity, space_complexity, size=None):
+    # queue_data may be just the front of a longer queue; size is the full length.
+    st.subheader(f"Queue after {operation}")
+    if item is not None:
+        st.write(f"{operation} result: {item}")
+    if queue_data:
+        hidden = (size or len(queue_data)) - len(queue_data)
+        tail = f" | … {hidden} more" if hidden > 0 else ""
+        st.write("Front → " + " | ".join(map(str, queue_data)) + tail + " ← Rear")
+    else:
+        st.write("Queue is empty.")
+    st.info(f"Time Complexity: {time_complexity}, Space Complexity: {space_complexity}")
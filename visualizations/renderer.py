@@ -0,0 +1,135 @@
+# dsa_visualizer/visualizations/renderer.py
+# Step renderers. Streamlit re-sends a chart element in full on every draw, so
+# the cost that can be saved per step is Altair's spec conversion and schema
+# validation, which dominates at a few thousand bars: each renderer compiles
+# its Vega-Lite spec once and a step only rebuilds the data frame passed with
+# it, which still has one row per bar or node. Tree layouts and renderers are
+# cached per tree, so highlighting a node never re-lays out the tree or
+# recompiles its spec, and the edges travel as a fixed dataset in the spec.
+import weakref
+
+import altair as alt
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+DEFAULT, HIGHLIGHTED, MARKED = "default", "highlighted", "marked"
+STATUS_SCALE = alt.Scale(domain=[DEFAULT, HIGHLIGHTED, MARKED], range=["#4C78A8", "#F58518", "#54A24B"])
+
+
+def _status_column(size, highlighted, marked):
+    status = np.full(size, DEFAULT, dtype=object)
+    status[list(highlighted)] = HIGHLIGHTED
+    status[list(marked)] = MARKED
+    return status
+
+
+class ArrayRenderer:
+    def __init__(self, values):
+        self.index = np.arange(len(values))
+        self.spec = alt.Chart().mark_bar().encode(
+            x=alt.X("index:O", title=None),
+            y=alt.Y("value:Q", title=None),
+            color=alt.Color("status:N", scale=STATUS_SCALE, legend=None),
+        ).to_dict()
+
+    def frame(self, state, highlighted=(), marked=()):
+        return pd.DataFrame({
+            "index": self.index,
+            "value": np.asarray(state),
+            "status": _status_column(len(self.index), highlighted, marked),
+        })
+
+    def render(self, state, highlighted=(), marked=()):
+        st.vega_lite_chart(self.frame(state, highlighted, marked), self.spec)
+
+
+_layouts = weakref.WeakKeyDictionary()
+_renderers = weakref.WeakKeyDictionary()
+
+
+def _compute_layout(root):
+    # x is the inorder rank and y the negated depth, so nodes never overlap.
+    # Rows are numbered in preorder; edges are (parent_row, child_row).
+    xs, ys, values, edges = [], [], [], []
+    stack = []
+    node, depth, parent = root, 0, None
+    rank = 0
+    while stack or node is not None:
+        while node is not None:
+            row = len(values)
+            values.append(node.value)
+            xs.append(0)
+            ys.append(-depth)
+            if parent is not None:
+                edges.append((parent, row))
+            stack.append((node, row, depth))
+            node, depth, parent = node.left, depth + 1, row
+        node, row, depth = stack.pop()
+        xs[row] = rank
+        rank += 1
+        node, depth, parent = node.right, depth + 1, row
+    rows_by_value = {}
+    for row, value in enumerate(values):
+        rows_by_value.setdefault(value, []).append(row)
+    return {"x": xs, "y": ys, "value": values, "edges": edges, "rows_by_value": rows_by_value}
+
+
+def tree_layout(root):
+    # Cached per tree: keyed weakly on the pool for pooled trees, otherwise on
+    # the root node, so the entry disappears together with the tree.
+    owner = getattr(root, "pool", root)
+    layout = _layouts.get(owner)
+    if layout is None:
+        layout = _compute_layout(root)
+        _layouts[owner] = layout
+    return layout
+
+
+class TreeRenderer:
+    def __init__(self, root):
+        layout = tree_layout(root) if root is not None else _compute_layout(None)
+        xs, ys = layout["x"], layout["y"]
+        self.rows_by_value = layout["rows_by_value"]
+        self.nodes = {"x": xs, "y": ys, "value": layout["value"]}
+        edges = pd.DataFrame({
+            "x": [xs[parent] for parent, _ in layout["edges"]],
+            "y": [ys[parent] for parent, _ in layout["edges"]],
+            "x2": [xs[child] for _, child in layout["edges"]],
+            "y2": [ys[child] for _, child in layout["edges"]],
+        })
+        # The node layers take the data passed at render time; only the edge
+        # layer carries its own (fixed) data.
+        lines = alt.Chart(edges).mark_rule(color="#999999").encode(x="x:Q", y="y:Q", x2="x2:Q", y2="y2:Q")
+        circles = alt.Chart().mark_circle(size=600, opacity=1).encode(
+            x=alt.X("x:Q", axis=None),
+            y=alt.Y("y:Q", axis=None),
+            color=alt.Color("status:N", scale=STATUS_SCALE, legend=None),
+        )
+        labels = alt.Chart().mark_text(color="white").encode(x="x:Q", y="y:Q", text="value:N")
+        spec = alt.layer(lines, circles, labels).to_dict()
+        # Altair points data-less layers at an "empty" dataset; dropping it
+        # lets them inherit the top-level data.
+        for layer in spec["layer"][1:]:
+            spec["datasets"].pop(layer.pop("data")["name"], None)
+        self.spec = spec
+
+    def frame(self, highlighted_nodes=()):
+        rows = [row for value in highlighted_nodes for row in self.rows_by_value.get(value, ())]
+        return pd.DataFrame({**self.nodes, "status": _status_column(len(self.nodes["x"]), rows, ())})
+
+    def render(self, highlighted_nodes=()):
+        st.vega_lite_chart(self.frame(highlighted_nodes), self.spec)
+
+
+def tree_renderer(root):
+    # Cached on the same owner as tree_layout, so reruns that draw the same
+    # tree reuse its compiled spec.
+    if root is None:
+        return TreeRenderer(None)
+    owner = getattr(root, "pool", root)
+    renderer = _renderers.get(owner)
+    if renderer is None:
+        renderer = TreeRenderer(root)
+        _renderers[owner] = renderer
+    return renderer
@@ -0,0 +1,17 @@
+# dsa_visualizer/visualizations/stack_visualizer.py
+import streamlit as st
+
+def display_stack_operation(operation, stack_data, item, time_complexity, space_complexity, size=None):
+    # stack_data may be just the top of a taller stack; size is the full height.
+    st.subheader(f"Stack after {operation}")
+    if item is not None:
+        st.write(f"{operation} result: {item}")
+    if stack_data:
+        # Top of the stack first.
+        st.table({"Stack (top first)": list(reversed(stack_data))})
+        hidden = (size or len(stack_data)) - len(stack_data)
+        if hidden > 0:
+            st.caption(f"… {hidden} more below")
+    else:
+        st.write("Stack is empty.")
+    st.info(f"Time Complexity: {time_complexity}, Space Complexity: {space_complexity}")
@@ -0,0 +1,5 @@
+# dsa_visualizer/visualizations/tree_traversal_visualizer.py
+from .renderer import tree_renderer
+
+def visualize_tree(root, highlighted_nodes=None):
+    tree_renderer(root).render(highlighted_nodes or ())